@@ -1,23 +1,39 @@
+import os
 from logging.config import fileConfig
-from sqlalchemy import engine_from_config, pool
+from sqlalchemy import create_engine, engine_from_config, pool
 from alembic import context
 from alembic.ddl.impl import DefaultImpl
+from snowflake.sqlalchemy import URL
+from snowflake.sqlalchemy.snowdialect import SnowflakeDialect
 from app.config import get_settings
 
 # Register Snowflake dialect
 class SnowflakeImpl(DefaultImpl):
     __dialect__ = 'snowflake'
 
+# Declare statement-cache support explicitly (silences the per-compile warning)
+if 'supports_statement_cache' not in SnowflakeDialect.__dict__:
+    SnowflakeDialect.supports_statement_cache = False
+
 config = context.config
-fileConfig(config.config_file_name)
+if config.attributes.get('configure_logger', True):
+    fileConfig(config.config_file_name)
 
 settings = get_settings()
 
+url_parts = {
+    'account': settings.snowflake.account,
+    'user': settings.snowflake.user,
+    'password': settings.snowflake.password.get_secret_value(),
+    'database': settings.snowflake.database,
+    'schema': settings.snowflake.schema,
+    'warehouse': settings.snowflake.warehouse,
+    'role': settings.snowflake.role,
+}
+# URL() quotes special characters; '%' is doubled for ConfigParser interpolation
 config.set_main_option(
     'sqlalchemy.url',
-    f"snowflake://{settings.snowflake.user}:{settings.snowflake.password.get_secret_value()}"
-    f"@{settings.snowflake.account}/{settings.snowflake.database}/{settings.snowflake.schema}"
-    f"?warehouse={settings.snowflake.warehouse}&role={settings.snowflake.role}"
+    URL(**{k: v for k, v in url_parts.items() if v is not None}).replace('%', '%%')
 )
 
 target_metadata = None
@@ -33,16 +49,49 @@ def run_migrations_offline():
     with context.begin_transaction():
         context.run_migrations()
 
+def _run_with_connection(connection):
+    context.configure(connection=connection, target_metadata=target_metadata)
+    with context.begin_transaction():
+        context.run_migrations()
+
 def run_migrations_online():
+    # Reuse a runtime DBAPI connection when the app hands one in (init_database),
+    # so migrations don't perform a second Snowflake handshake
+    existing_conn = config.attributes.get('connection')
+    if existing_conn is not None:
+        connectable = create_engine(
+            "snowflake://",
+            creator=lambda: existing_conn,
+            poolclass=pool.StaticPool,
+            pool_reset_on_return=None,
+        )
+        # No dispose(): StaticPool would close the borrowed connection
+        with connectable.connect() as connection:
+            _run_with_connection(connection)
+        return
+    
+    # ALEMBIC_NULLPOOL=1 keeps the old connect-per-checkout behaviour (CI/offline)
+    if os.getenv("ALEMBIC_NULLPOOL") == "1":
+        pool_kwargs = {"poolclass": pool.NullPool}
+    else:
+        # One warm connection reused across every op.execute() DDL
+        pool_kwargs = {
+            "poolclass": pool.QueuePool,
+            "pool_size": 2,
+            "max_overflow": 0,
+            "pool_pre_ping": False,
+            "pool_reset_on_return": None,
+            "connect_args": {"client_session_keep_alive": True},
+        }
+    
     connectable = engine_from_config(
         config.get_section(config.config_ini_section),
         prefix="sqlalchemy.",
-        poolclass=pool.NullPool,
+        **pool_kwargs,
     )
     with connectable.connect() as connection:
-        context.configure(connection=connection, target_metadata=target_metadata)
-        with context.begin_transaction():
-            context.run_migrations()
+        _run_with_connection(connection)
+    connectable.dispose()
 
 if context.is_offline_mode():
     run_migrations_offline()
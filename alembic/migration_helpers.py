@@ -0,0 +1,11 @@
+"""Helpers shared by revision scripts (importable via prepend_sys_path in alembic.ini)."""
+from alembic import op, context
+
+
+def execute_batch(*statements: str) -> None:
+    """Run DDL statements as one Snowflake multi-statement request."""
+    if context.is_offline_mode():
+        for statement in statements:
+            op.execute(statement)
+        return
+    op.get_bind().connection.execute_string(";\n".join(statements))
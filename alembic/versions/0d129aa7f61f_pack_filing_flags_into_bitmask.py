@@ -0,0 +1,59 @@
+"""pack_filing_flags_into_bitmask
+
+Revision ID: 0d129aa7f61f
+Revises: 2419eded98e6
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import execute_batch
+
+revision = '0d129aa7f61f'
+down_revision = '2419eded98e6'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Replace has_10k/has_10q/has_8k with filing_types_mask (1=10-K, 2=10-Q, 4=8-K)."""
+    execute_batch(
+        "ALTER TABLE company_evidence_summary ADD COLUMN filing_types_mask INT DEFAULT 0",
+        """
+        UPDATE company_evidence_summary
+        SET filing_types_mask =
+            IFF(has_10k, 1, 0) + IFF(has_10q, 2, 0) + IFF(has_8k, 4, 0)
+        """,
+        "ALTER TABLE company_evidence_summary DROP COLUMN has_10k, has_10q, has_8k",
+        # Backward-compatible boolean view for existing readers
+        """
+        CREATE OR REPLACE VIEW v_company_evidence_summary AS
+        SELECT
+            *,
+            BITAND(filing_types_mask, 1) = 1 AS has_10k,
+            BITAND(filing_types_mask, 2) = 2 AS has_10q,
+            BITAND(filing_types_mask, 4) = 4 AS has_8k
+        FROM company_evidence_summary
+        """,
+    )
+
+
+def downgrade() -> None:
+    """Restore the boolean filing columns."""
+    execute_batch(
+        "DROP VIEW IF EXISTS v_company_evidence_summary",
+        """
+        ALTER TABLE company_evidence_summary ADD COLUMN
+            has_10k BOOLEAN DEFAULT FALSE,
+            has_10q BOOLEAN DEFAULT FALSE,
+            has_8k BOOLEAN DEFAULT FALSE
+        """,
+        """
+        UPDATE company_evidence_summary
+        SET has_10k = BITAND(filing_types_mask, 1) = 1,
+            has_10q = BITAND(filing_types_mask, 2) = 2,
+            has_8k = BITAND(filing_types_mask, 4) = 4
+        """,
+        "ALTER TABLE company_evidence_summary DROP COLUMN filing_types_mask",
+    )
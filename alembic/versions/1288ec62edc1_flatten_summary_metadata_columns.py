@@ -0,0 +1,70 @@
+"""flatten_summary_metadata_columns
+
+Revision ID: 1288ec62edc1
+Revises: 0d129aa7f61f
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+from migration_helpers import execute_batch
+
+revision = '1288ec62edc1'
+down_revision = '0d129aa7f61f'
+branch_labels = None
+depends_on = None
+
+
+# (column, type, metadata column, JSON path) for the hot summary keys
+FLAT_COLUMNS = [
+    ("hiring_job_count", "INT", "hiring_metadata", "total_jobs"),
+    ("hiring_ai_job_count", "INT", "hiring_metadata", "ai_related_count"),
+    ("hiring_ai_ratio", "DECIMAL(4,3)", "hiring_metadata", "ai_ratio"),
+    ("patent_total_count", "INT", "patent_metadata", "total_patents"),
+    ("patent_ai_count", "INT", "patent_metadata", "ai_patents"),
+    ("patent_recent_ai_count", "INT", "patent_metadata", "recent_ai_count"),
+    ("patent_ai_ratio", "DECIMAL(4,3)", "patent_metadata", "ai_ratio"),
+    ("github_repo_count", "INT", "github_metadata", "total_repos"),
+    ("github_ai_repo_count", "INT", "github_metadata", "ai_repos"),
+    ("github_ai_stars", "INT", "github_metadata", "ai_stars"),
+]
+
+# SELECT * views bind their column list at creation, so rebuild after ALTERs
+SUMMARY_VIEW = """
+    CREATE OR REPLACE VIEW v_company_evidence_summary AS
+    SELECT
+        *,
+        BITAND(filing_types_mask, 1) = 1 AS has_10k,
+        BITAND(filing_types_mask, 2) = 2 AS has_10q,
+        BITAND(filing_types_mask, 4) = 4 AS has_8k
+    FROM company_evidence_summary
+"""
+
+
+def upgrade() -> None:
+    """Promote frequently read *_metadata keys to typed scalar columns."""
+    columns = ",\n            ".join(f"{name} {type_}" for name, type_, _, _ in FLAT_COLUMNS)
+    backfill = ",\n            ".join(
+        f"{name} = {source}:{key}::{type_}" for name, type_, source, key in FLAT_COLUMNS
+    )
+    execute_batch(
+        f"""
+        ALTER TABLE company_evidence_summary ADD COLUMN
+            {columns}
+        """,
+        f"""
+        UPDATE company_evidence_summary
+        SET {backfill}
+        """,
+        SUMMARY_VIEW,
+    )
+
+
+def downgrade() -> None:
+    """Drop the flattened metadata columns (VARIANT payloads are untouched)."""
+    columns = ", ".join(name for name, _, _, _ in FLAT_COLUMNS)
+    execute_batch(
+        f"ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS {columns}",
+        SUMMARY_VIEW,
+    )
@@ -34,30 +34,34 @@ def upgrade() -> None:
         )
     """)
     
-    # Update company_evidence_summary - add collection timestamps
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN hiring_collected_at TIMESTAMP_NTZ")
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN patent_collected_at TIMESTAMP_NTZ")
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN github_collected_at TIMESTAMP_NTZ")
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN leadership_collected_at TIMESTAMP_NTZ")
-    
-    # Add S3 keys for full datasets
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN hiring_s3_key VARCHAR(500)")
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN patent_s3_key VARCHAR(500)")
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN github_s3_key VARCHAR(500)")
-    op.execute("ALTER TABLE company_evidence_summary ADD COLUMN leadership_s3_key VARCHAR(500)")
+    # Update company_evidence_summary - collection timestamps and S3 keys
+    # for full datasets, added in a single multi-column ALTER
+    op.execute("""
+        ALTER TABLE company_evidence_summary ADD COLUMN
+            hiring_collected_at TIMESTAMP_NTZ,
+            patent_collected_at TIMESTAMP_NTZ,
+            github_collected_at TIMESTAMP_NTZ,
+            leadership_collected_at TIMESTAMP_NTZ,
+            hiring_s3_key VARCHAR(500),
+            patent_s3_key VARCHAR(500),
+            github_s3_key VARCHAR(500),
+            leadership_s3_key VARCHAR(500)
+    """)
 
 
 def downgrade() -> None:
     """Remove external_signals table and related columns."""
     
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS hiring_collected_at")
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS patent_collected_at")
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS github_collected_at")
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS leadership_collected_at")
-    
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS hiring_s3_key")
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS patent_s3_key")
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS github_s3_key")
-    op.execute("ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS leadership_s3_key")
+    op.execute("""
+        ALTER TABLE company_evidence_summary DROP COLUMN IF EXISTS
+            hiring_collected_at,
+            patent_collected_at,
+            github_collected_at,
+            leadership_collected_at,
+            hiring_s3_key,
+            patent_s3_key,
+            github_s3_key,
+            leadership_s3_key
+    """)
     
     op.execute("DROP TABLE IF EXISTS external_signals")
\ No newline at end of file
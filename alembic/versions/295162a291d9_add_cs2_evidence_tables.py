@@ -8,6 +8,8 @@ Create Date: ZZZZ  # Keep the auto-generated timestamp
 from alembic import op
 import sqlalchemy as sa
 
+from migration_helpers import execute_batch
+
 # revision identifiers
 revision = '295162a291d9'  
 down_revision = 'f88633c59ce0'  
@@ -19,7 +21,7 @@ def upgrade() -> None:
     """Create CS2 evidence tables."""
     
     # Table 1: evidence_documents (filing metadata + pre-computed stats)
-    op.execute("""
+    evidence_documents = """
         CREATE TABLE IF NOT EXISTS evidence_documents (
             id VARCHAR(36) PRIMARY KEY,
             company_id VARCHAR(36) NOT NULL,
@@ -50,11 +52,11 @@ def upgrade() -> None:
             CONSTRAINT fk_evidence_doc_company 
                 FOREIGN KEY (company_id) REFERENCES companies(id)
         )
-    """)
+    """
     
     
     # Table 2: document_chunks (actual chunk content, partitioned)
-    op.execute("""
+    document_chunks = """
         CREATE TABLE IF NOT EXISTS document_chunks (
             id VARCHAR(36) PRIMARY KEY,
             document_id VARCHAR(36) NOT NULL,
@@ -81,13 +83,13 @@ def upgrade() -> None:
             CONSTRAINT fk_chunk_document 
                 FOREIGN KEY (document_id) REFERENCES evidence_documents(id)
         )
-    """)
+    """
      
     # Clustering key for partition optimization (Snowflake-specific)
-    op.execute("ALTER TABLE document_chunks CLUSTER BY (document_id)")
+    chunk_clustering = "ALTER TABLE document_chunks CLUSTER BY (document_id)"
     
     # Table 3: company_evidence_summary (single row per company, read-optimized)
-    op.execute("""
+    company_evidence_summary = """
         CREATE TABLE IF NOT EXISTS company_evidence_summary (
             company_id VARCHAR(36) PRIMARY KEY,
             ticker VARCHAR(10) NOT NULL,
@@ -124,11 +126,21 @@ def upgrade() -> None:
             CONSTRAINT fk_summary_company 
                 FOREIGN KEY (company_id) REFERENCES companies(id)
         )
-    """)
+    """
+    
+    # One round-trip for all four DDLs
+    execute_batch(
+        evidence_documents,
+        document_chunks,
+        chunk_clustering,
+        company_evidence_summary,
+    )
 
 def downgrade() -> None:
     """Drop CS2 evidence tables."""
     # Drop in reverse order (children before parents)
-    op.execute("DROP TABLE IF EXISTS company_evidence_summary")
-    op.execute("DROP TABLE IF EXISTS document_chunks")
-    op.execute("DROP TABLE IF EXISTS evidence_documents")
\ No newline at end of file
+    execute_batch(
+        "DROP TABLE IF EXISTS company_evidence_summary",
+        "DROP TABLE IF EXISTS document_chunks",
+        "DROP TABLE IF EXISTS evidence_documents",
+    )
\ No newline at end of file
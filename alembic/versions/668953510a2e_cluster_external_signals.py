@@ -0,0 +1,24 @@
+"""cluster_external_signals
+
+Revision ID: 668953510a2e
+Revises: 1288ec62edc1
+Create Date: 2026-10-15
+
+"""
+from alembic import op
+import sqlalchemy as sa
+
+revision = '668953510a2e'
+down_revision = '1288ec62edc1'
+branch_labels = None
+depends_on = None
+
+
+def upgrade() -> None:
+    """Cluster external_signals for "latest signals for company X in category Y" reads."""
+    op.execute("ALTER TABLE external_signals CLUSTER BY (company_id, category, collected_at)")
+
+
+def downgrade() -> None:
+    """Remove the clustering key."""
+    op.execute("ALTER TABLE external_signals DROP CLUSTERING KEY")
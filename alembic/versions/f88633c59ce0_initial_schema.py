@@ -2,6 +2,8 @@
 from alembic import op
 import sqlalchemy as sa
 
+from migration_helpers import execute_batch
+
 revision = 'f88633c59ce0'
 down_revision = None
 branch_labels = None
@@ -9,7 +11,7 @@ depends_on = None
 
 
 def upgrade():
-    op.execute("""
+    industries = """
         CREATE TABLE industries (
             id VARCHAR(36) PRIMARY KEY,
             name VARCHAR(255) NOT NULL UNIQUE,
@@ -17,9 +19,9 @@ def upgrade():
             h_r_base DECIMAL(5,2),
             created_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
         )
-    """)
+    """
     
-    op.execute("""
+    companies = """
         CREATE TABLE companies (
             id VARCHAR(36) PRIMARY KEY,
             name VARCHAR(255) NOT NULL,
@@ -30,9 +32,9 @@ def upgrade():
             created_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
             updated_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
         )
-    """)
+    """
     
-    op.execute("""
+    assessments = """
         CREATE TABLE assessments (
             id VARCHAR(36) PRIMARY KEY,
             company_id VARCHAR(36) NOT NULL REFERENCES companies(id),
@@ -46,9 +48,9 @@ def upgrade():
             confidence_upper DECIMAL(5,2),
             created_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP()
         )
-    """)
+    """
     
-    op.execute("""
+    dimension_scores = """
         CREATE TABLE dimension_scores (
             id VARCHAR(36) PRIMARY KEY,
             assessment_id VARCHAR(36) NOT NULL REFERENCES assessments(id),
@@ -60,11 +62,15 @@ def upgrade():
             created_at TIMESTAMP_NTZ DEFAULT CURRENT_TIMESTAMP(),
             UNIQUE (assessment_id, dimension)
         )
-    """)
+    """
+    
+    execute_batch(industries, companies, assessments, dimension_scores)
 
 
 def downgrade():
-    op.execute("DROP TABLE IF EXISTS dimension_scores")
-    op.execute("DROP TABLE IF EXISTS assessments")
-    op.execute("DROP TABLE IF EXISTS companies")
-    op.execute("DROP TABLE IF EXISTS industries")
\ No newline at end of file
+    execute_batch(
+        "DROP TABLE IF EXISTS dimension_scores",
+        "DROP TABLE IF EXISTS assessments",
+        "DROP TABLE IF EXISTS companies",
+        "DROP TABLE IF EXISTS industries",
+    )
\ No newline at end of file
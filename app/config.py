@@ -2,6 +2,7 @@
 from pydantic_settings import BaseSettings, SettingsConfigDict
 from pydantic import Field, SecretStr
 from typing import Optional
+from functools import lru_cache
 
 
 class SnowflakeConfig(BaseSettings):
@@ -14,6 +15,8 @@ class SnowflakeConfig(BaseSettings):
     database: str
     schema: str = Field(default="PUBLIC")
     role: Optional[str] = None
+    pool_size: int = Field(default=10, ge=1)
+    pool_timeout: float = Field(default=30.0, gt=0)
     
     model_config = SettingsConfigDict(
         env_prefix="SNOWFLAKE_",
@@ -64,6 +67,7 @@ class Settings:
         self.s3 = S3Config()
 
 
+@lru_cache(maxsize=1)
 def get_settings() -> Settings:
-    """Get application settings."""
+    """Get application settings (parsed once per process)."""
     return Settings()
\ No newline at end of file
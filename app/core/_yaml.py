@@ -0,0 +1,23 @@
+"""Shared YAML loader for config/*.yml files."""
+import yaml
+from pathlib import Path
+from functools import lru_cache
+
+try:
+    from yaml import CSafeLoader as SafeLoader  # libyaml-backed
+except ImportError:
+    from yaml import SafeLoader
+
+CONFIG_DIR = Path(__file__).parent.parent.parent / "config"
+
+
+@lru_cache()
+def load_yaml(name: str) -> dict:
+    """Load a config file by name (cached per filename)."""
+    config_path = CONFIG_DIR / name
+    
+    if not config_path.exists():
+        raise FileNotFoundError(f"Config not found: {config_path}")
+    
+    with open(config_path) as f:
+        return yaml.load(f, Loader=SafeLoader)
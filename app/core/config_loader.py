@@ -1,14 +1,9 @@
 """Configuration loaders for companies and settings."""
-import yaml
-from pathlib import Path
-from functools import lru_cache
+from app.core._yaml import load_yaml
 
 
-@lru_cache()
 def load_companies_config() -> dict:
-    config_path = Path(__file__).parent.parent.parent / "config" / "companies.yml"
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return load_yaml("companies.yml")
 
 
 def get_target_companies() -> dict:
@@ -1,18 +1,12 @@
 """GitHub configuration loader - NO hardcoding."""
-import yaml
-from pathlib import Path
-from typing import List, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, List, Tuple
+from app.core._yaml import load_yaml
 
-_config = None
 
 def _load_config() -> dict:
     """Load GitHub config from YAML."""
-    global _config
-    if _config is None:
-        config_path = Path(__file__).parent.parent.parent / "config" / "github_orgs.yml"
-        with open(config_path, 'r') as f:
-            _config = yaml.safe_load(f)
-    return _config
+    return load_yaml("github_orgs.yml")
 
 
 def get_github_orgs(ticker: str) -> List[str]:
@@ -21,28 +15,34 @@ def get_github_orgs(ticker: str) -> List[str]:
     return config['github_orgs'].get(ticker, [])
 
 
-def get_ai_topics() -> Set[str]:
+@lru_cache(maxsize=1)
+def get_ai_topics() -> FrozenSet[str]:
     """Get AI topic tags from config."""
-    config = _load_config()
-    return set(config['detection']['ai_topics'])
+    return frozenset(_load_config()['detection']['ai_topics'])
+
+
+@lru_cache(maxsize=1)
+def get_ai_topic_bits() -> Dict[str, int]:
+    """Map each AI topic to a single bit (sorted order) for bitmap matching."""
+    return {topic: 1 << i for i, topic in enumerate(sorted(get_ai_topics()))}
 
 
-def get_ml_libraries() -> Set[str]:
+@lru_cache(maxsize=1)
+def get_ml_libraries() -> FrozenSet[str]:
     """Get ML library names from config."""
-    config = _load_config()
-    return set(config['detection']['ml_libraries'])
+    return frozenset(_load_config()['detection']['ml_libraries'])
 
 
-def get_ai_languages() -> Set[str]:
+@lru_cache(maxsize=1)
+def get_ai_languages() -> FrozenSet[str]:
     """Get AI-related programming languages."""
-    config = _load_config()
-    return set(config['detection']['ai_languages'])
+    return frozenset(_load_config()['detection']['ai_languages'])
 
 
-def get_ai_references() -> List[str]:
+@lru_cache(maxsize=1)
+def get_ai_references() -> Tuple[str, ...]:
     """Get semantic reference phrases."""
-    config = _load_config()
-    return config['detection']['ai_references']
+    return tuple(_load_config()['detection']['ai_references'])
 
 
 def get_similarity_threshold() -> float:
@@ -54,4 +54,4 @@ def get_similarity_threshold() -> float:
 def get_scoring_config() -> dict:
     """Get scoring weights and thresholds."""
     config = _load_config()
-    return config['scoring']
\ No newline at end of file
+    return config['scoring']
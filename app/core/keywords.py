@@ -1,20 +1,13 @@
 """Keyword configuration loader for job signal pipeline."""
-import yaml
-from pathlib import Path
+import re
 from functools import lru_cache
-from typing import Dict, List
+from typing import Dict, List, Pattern, Tuple
+from app.core._yaml import load_yaml
 
 
-@lru_cache()
 def load_keywords() -> dict:
     """Load keywords config (cached for performance)."""
-    config_path = Path(__file__).parent.parent.parent / "config" / "keywords.yml"
-    
-    if not config_path.exists():
-        raise FileNotFoundError(f"Keywords config not found: {config_path}")
-    
-    with open(config_path) as f:
-        return yaml.safe_load(f)
+    return load_yaml("keywords.yml")
 
 
 def _get_talent_skills() -> dict:
@@ -48,4 +41,23 @@ def get_acronyms() -> Dict[str, str]:
 
 def get_seniority_keywords() -> Dict[str, List[str]]:
     """Get seniority level keywords for job classification."""
-    return _get_talent_skills().get('seniority_keywords', {})
\ No newline at end of file
+    return _get_talent_skills().get('seniority_keywords', {})
+
+
+@lru_cache(maxsize=1)
+def get_seniority_patterns() -> Tuple[Tuple[str, Pattern], ...]:
+    """One compiled substring alternation per seniority bucket, in priority order."""
+    sen = get_seniority_keywords()
+    return tuple(
+        (label, re.compile('|'.join(map(re.escape, sen.get(label, []))) or r'(?!)'))
+        for label in ("leadership", "senior", "entry")
+    )
+
+
+def classify_seniority(title: str) -> str:
+    """Seniority label for a job title: leadership > senior > entry, else mid."""
+    t = str(title).lower()
+    for label, pattern in get_seniority_patterns():
+        if pattern.search(t):
+            return label
+    return "mid"
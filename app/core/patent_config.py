@@ -1,26 +1,30 @@
 """Patent configuration loader."""
-import yaml
-from pathlib import Path
-from typing import List, Set
+from functools import lru_cache
+from typing import Dict, FrozenSet, Optional, Tuple
+from app.core._yaml import load_yaml
 
-_config = None
 
 def _load_config() -> dict:
-    global _config
-    if _config is None:
-        config_path = Path(__file__).parent.parent.parent / "config" / "patent_config.yml"
-        with open(config_path, 'r') as f:
-            _config = yaml.safe_load(f)
-    return _config
+    return load_yaml("patent_config.yml")
 
-def get_ai_references() -> List[str]:
-    return _load_config()['detection']['ai_references']
+@lru_cache(maxsize=1)
+def get_ai_references() -> Tuple[str, ...]:
+    return tuple(_load_config()['detection']['ai_references'])
 
-def get_ai_cpc_codes() -> Set[str]:
-    return set(_load_config()['detection']['ai_cpc_codes'])
+@lru_cache(maxsize=1)
+def get_ai_cpc_codes() -> FrozenSet[str]:
+    return frozenset(_load_config()['detection']['ai_cpc_codes'])
+
+@lru_cache(maxsize=1)
+def get_ai_cpc_bits() -> Dict[str, int]:
+    """Map each AI CPC code to a single bit (sorted order) for bitmask matching."""
+    return {code: 1 << i for i, code in enumerate(sorted(get_ai_cpc_codes()))}
 
 def get_similarity_threshold() -> float:
     return _load_config()['detection']['min_similarity']
 
+def get_prefilter_config() -> Optional[dict]:
+    return _load_config()['detection'].get('prefilter')
+
 def get_scoring_config() -> dict:
-    return _load_config()['scoring']
\ No newline at end of file
+    return _load_config()['scoring']
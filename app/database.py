@@ -1,40 +1,153 @@
 """Database connection pooling."""
+import asyncio
+import queue
+import threading
 from contextlib import contextmanager
 import snowflake.connector
+import structlog
+from fastapi import Depends
 from app.config import get_settings
+from app.services.snowflake import SnowflakeService
+
+logger = structlog.get_logger()
 
 
 class DatabaseManager:
-    """Singleton database connection manager."""
+    """Singleton database connection manager backed by a bounded pool."""
     _instance = None
-    _pool = None
-    
+
     def __new__(cls):
         if cls._instance is None:
             cls._instance = super().__new__(cls)
         return cls._instance
-    
+
     def __init__(self):
-        if self._pool is None:
-            settings = get_settings()
-            self._config = {
-                'account': settings.snowflake.account,
-                'user': settings.snowflake.user,
-                'password': settings.snowflake.password.get_secret_value(),
-                'warehouse': settings.snowflake.warehouse,
-                'database': settings.snowflake.database,
-                'schema': settings.snowflake.schema,
-                'role': settings.snowflake.role
+        # __init__ re-runs on every DatabaseManager() call; build state once
+        if getattr(self, '_initialized', False):
+            return
+
+        settings = get_settings()
+        password = settings.snowflake.password.get_secret_value()
+        config = {
+            'account': settings.snowflake.account,
+            'user': settings.snowflake.user,
+            'password': password,
+            'warehouse': settings.snowflake.warehouse,
+            'database': settings.snowflake.database,
+            'schema': settings.snowflake.schema,
+            'role': settings.snowflake.role,
+            # Pooled sessions are long-lived: keep them from expiring and
+            # set session parameters at login instead of via ALTER SESSION
+            'client_session_keep_alive': True,
+            'session_parameters': {
+                'QUERY_TAG': 'pe-orgair',
+                'STATEMENT_TIMEOUT_IN_SECONDS': 60,
+                'USE_CACHED_RESULT': True
             }
-    
+        }
+        self._config = {k: v for k, v in config.items() if v is not None}
+        self._pool_size = settings.snowflake.pool_size
+        self._pool_timeout = settings.snowflake.pool_timeout
+        self._pool = queue.Queue(maxsize=self._pool_size)
+        self._lock = threading.Lock()
+        self._created = 0
+        # Last, so a failed init (e.g. bad settings) is retried next time
+        self._initialized = True
+
+    def _connect(self):
+        return snowflake.connector.connect(**self._config)
+
+    def open_pool(self):
+        """Pre-create connections up to pool_size (called at startup)."""
+        while True:
+            with self._lock:
+                if self._created >= self._pool_size:
+                    break
+                self._created += 1
+            try:
+                self._pool.put_nowait(self._connect())
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        logger.info("Snowflake pool ready", size=self._pool_size)
+
+    def _acquire(self):
+        """Lease a connection, creating one lazily while under pool_size."""
+        try:
+            conn = self._pool.get_nowait()
+        except queue.Empty:
+            with self._lock:
+                can_create = self._created < self._pool_size
+                if can_create:
+                    self._created += 1
+            if can_create:
+                try:
+                    return self._connect()
+                except Exception:
+                    with self._lock:
+                        self._created -= 1
+                    raise
+            try:
+                conn = self._pool.get(timeout=self._pool_timeout)
+            except queue.Empty:
+                raise RuntimeError(
+                    f"Snowflake pool exhausted ({self._pool_size} connections in use)"
+                )
+
+        # Health check: replace connections dropped by the server
+        if conn.is_closed():
+            logger.warning("Replacing closed Snowflake connection")
+            try:
+                conn = self._connect()
+            except Exception:
+                with self._lock:
+                    self._created -= 1
+                raise
+        return conn
+
+    def _release(self, conn):
+        """Return a connection to the pool (discard it if closed)."""
+        if conn.is_closed():
+            with self._lock:
+                self._created -= 1
+            return
+        self._pool.put_nowait(conn)
+
     @contextmanager
     def get_connection(self):
         """Get a database connection from pool."""
-        conn = snowflake.connector.connect(**self._config)
+        conn = self._acquire()
         try:
             yield conn
         finally:
-            conn.close()
+            self._release(conn)
+
+    def close_all(self):
+        """Close every idle pooled connection (called at shutdown)."""
+        closed = 0
+        while True:
+            try:
+                conn = self._pool.get_nowait()
+            except queue.Empty:
+                break
+            try:
+                conn.close()
+            except Exception as e:
+                logger.warning("Failed to close pooled connection", error=str(e))
+            closed += 1
+        with self._lock:
+            self._created -= closed
+        logger.info("Snowflake pool drained", closed=closed)
+
+    def stats(self) -> dict:
+        """Pool usage metrics."""
+        available = self._pool.qsize()
+        return {
+            'pool_size': self._pool_size,
+            'pool_in_use': self._created - available,
+            'pool_available': available
+        }
 
 
 # Global instance
@@ -44,4 +157,18 @@ db_manager = DatabaseManager()
 def get_db():
     """FastAPI dependency for database connection."""
     with db_manager.get_connection() as conn:
-        yield conn
\ No newline at end of file
+        yield conn
+
+
+async def get_db_async():
+    """Async FastAPI dependency: lease a pooled connection off the event loop."""
+    conn = await asyncio.to_thread(db_manager._acquire)
+    try:
+        yield conn
+    finally:
+        db_manager._release(conn)
+
+
+async def get_snowflake_service(conn=Depends(get_db_async)):
+    """Async FastAPI dependency: SnowflakeService over a pooled connection."""
+    return SnowflakeService.from_connection(conn)
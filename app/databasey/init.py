@@ -6,40 +6,70 @@ project_root = Path(__file__).parent.parent.parent
 sys.path.insert(0, str(project_root))
 
 import asyncio
-import subprocess
 import structlog
+from alembic import command
+from alembic.config import Config
+from alembic.script import ScriptDirectory
 
 logger = structlog.get_logger()
 
 
+def run_migrations(conn=None):
+    """Run `alembic upgrade head` in-process (no subprocess / re-import).
+    
+    If a Snowflake connection is given, env.py migrates over it instead of
+    opening its own.
+    """
+    cfg = Config(str(project_root / "alembic.ini"))
+    # Keep the app's logging setup; env.py skips fileConfig when this is False
+    cfg.attributes['configure_logger'] = False
+    if conn is not None:
+        head = ScriptDirectory.from_config(cfg).get_current_head()
+        if _current_revision(conn) == head:
+            logger.info("Schema already at head, skipping migrations", revision=head)
+            return
+        cfg.attributes['connection'] = conn
+    command.upgrade(cfg, "head")
+
+
+def _current_revision(conn):
+    """Applied alembic revision, or None if the schema was never migrated."""
+    cur = conn.cursor()
+    try:
+        cur.execute("SELECT version_num FROM alembic_version")
+        row = cur.fetchone()
+        return row[0] if row else None
+    except Exception:
+        # alembic_version does not exist yet
+        return None
+    finally:
+        cur.close()
+
+
 async def init_database():
     """Initialize database schema and seed data."""
     try:
-        logger.info("Running Alembic migrations")
-        subprocess.run(['alembic', 'upgrade', 'head'], check=True, cwd='.')
-        logger.info("Migrations complete")
-        
-        logger.info("Seeding reference data")
+        from app.database import db_manager
         from app.databasey.seed import seed_all
-        from app.services.snowflake import SnowflakeService
-        from app.config import get_settings
-        
-        settings = get_settings()
-        db = SnowflakeService(
-            account=settings.snowflake.account,
-            user=settings.snowflake.user,
-            password=settings.snowflake.password.get_secret_value(),
-            warehouse=settings.snowflake.warehouse,
-            database=settings.snowflake.database,
-            schema=settings.snowflake.schema,
-            role=settings.snowflake.role
-        )
-        
-        async with db.cursor() as cur:
-            await seed_all(cur)
         
-        db.close()
-        logger.info("Seed data complete")
+        # One pooled connection (one handshake) for both migrations and seeding
+        with db_manager.get_connection() as conn:
+            logger.info("Running Alembic migrations")
+            # Alembic is blocking; keep it off the event loop
+            await asyncio.to_thread(run_migrations, conn)
+            logger.info("Migrations complete")
+            
+            logger.info("Seeding reference data")
+            cur = conn.cursor()
+            try:
+                await seed_all(cur)
+                conn.commit()
+            except Exception:
+                conn.rollback()
+                raise
+            finally:
+                cur.close()
+            logger.info("Seed data complete")
         
     except Exception as e:
         logger.error("Database initialization failed", error=str(e))
@@ -24,19 +24,21 @@ INDUSTRIES_SEED_DATA: List[Dict[str, Any]] = [
 async def seed_industries(cursor) -> int:
     """
     Seed industries table with reference data.
-    Idempotent - uses MERGE for upsert.
+    Idempotent - uses a single multi-row MERGE for upsert.
     
     Returns:
         Number of industries seeded
     """
-    merge_sql = """
+    values = ", ".join(["(%s, %s, %s, %s)"] * len(INDUSTRIES_SEED_DATA))
+    merge_sql = f"""
     MERGE INTO industries AS target
     USING (
         SELECT 
-            %(id)s AS id,
-            %(name)s AS name,
-            %(sector)s AS sector,
-            %(h_r_base)s AS h_r_base
+            column1 AS id,
+            column2 AS name,
+            column3 AS sector,
+            column4 AS h_r_base
+        FROM VALUES {values}
     ) AS source
     ON target.id = source.id
     WHEN MATCHED THEN
@@ -49,10 +51,13 @@ async def seed_industries(cursor) -> int:
         VALUES (source.id, source.name, source.sector, source.h_r_base)
     """
     
-    count = 0
-    for industry in INDUSTRIES_SEED_DATA:
-        cursor.execute(merge_sql, industry)
-        count += 1
+    params = tuple(
+        value
+        for industry in INDUSTRIES_SEED_DATA
+        for value in (industry['id'], industry['name'], industry['sector'], industry['h_r_base'])
+    )
+    cursor.execute(merge_sql, params)
+    count = len(INDUSTRIES_SEED_DATA)
     
     logger.info("Industries seeded", count=count)
     return count
@@ -1,4 +1,7 @@
 """FastAPI application entry point."""
+import asyncio
+from contextlib import asynccontextmanager
+
 from fastapi import FastAPI
 from fastapi.middleware.cors import CORSMiddleware
 import structlog
@@ -6,15 +9,45 @@ import structlog
 from app.routers import health, companies, assessments, dimensions
 from app.routers import documents, signals, evidence
 from app.services.redis_cache import redis_service
+from app.database import db_manager
 
 logger = structlog.get_logger()
 
+
+async def _init_snowflake():
+    """Run migrations/seed, then warm the Snowflake connection pool."""
+    from app.databasey.init import init_database
+    try:
+        await init_database()
+    except Exception as e:
+        logger.error(f"Database initialization failed: {e}")
+        raise
+    await asyncio.to_thread(db_manager.open_pool)
+
+
+@asynccontextmanager
+async def lifespan(app: FastAPI):
+    logger.info("PE Org-AI-R Platform starting")
+    
+    # Snowflake init and Redis connect are independent; run them concurrently
+    await asyncio.gather(_init_snowflake(), redis_service.connect())
+    logger.info("Redis connected")
+    
+    yield
+    
+    logger.info("PE Org-AI-R Platform shutting down")
+    await redis_service.disconnect()  
+    logger.info("Redis disconnected")
+    db_manager.close_all()
+
+
 app = FastAPI(
     title="PE Org-AI-R Platform",
     description="AI-readiness assessment platform for private equity",
     version="1.0.0",
     docs_url="/docs",
-    redoc_url="/redoc"
+    redoc_url="/redoc",
+    lifespan=lifespan
 )
 
 app.add_middleware(
@@ -34,30 +67,6 @@ app.include_router(signals.router)
 app.include_router(documents.router)
 
 
-@app.on_event("startup")
-async def startup():
-    logger.info("PE Org-AI-R Platform starting")
-    
-    # Run database initialization from database/init.py
-    try:
-        from app.databasey.init import init_database
-        await init_database()
-    except Exception as e:
-        logger.error(f"Database initialization failed: {e}")
-        raise
-    
-    # Connect to Redis
-    await redis_service.connect()  
-    logger.info("Redis connected")
-
-
-@app.on_event("shutdown")
-async def shutdown():
-    logger.info("PE Org-AI-R Platform shutting down")
-    await redis_service.disconnect()  
-    logger.info("Redis disconnected")
-
-
 @app.get("/")
 async def root():
     return {
@@ -22,7 +22,9 @@ from app.models.dimension import (
     DimensionScoreBase,
     DimensionScoreCreate,
     DimensionScoreUpdate,
-    DimensionScoreResponse
+    DimensionScoreResponse,
+    compute_vr_score,
+    compute_vr_scores
 )
 
 __all__ = [
@@ -59,4 +61,6 @@ __all__ = [
     'DimensionScoreCreate',
     'DimensionScoreUpdate',
     'DimensionScoreResponse',
+    'compute_vr_score',
+    'compute_vr_scores',
 ]
\ No newline at end of file
@@ -1,9 +1,10 @@
 """Assessment Model for PE Org-AI-R Platform."""
-from pydantic import BaseModel, Field, model_validator, ConfigDict
+from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional, TYPE_CHECKING
 from app.models.enums import AssessmentType, AssessmentStatus
+from app.models.base import FastConstructMixin, utcnow
 
 if TYPE_CHECKING:
     from app.models.dimension import DimensionScoreResponse
@@ -15,7 +16,7 @@ class AssessmentBase(BaseModel):
     company_id: UUID
     assessment_type: AssessmentType
     assessment_date: datetime = Field(
-        default_factory=lambda: datetime.now(timezone.utc)
+        default_factory=utcnow
     )
     primary_assessor: Optional[str] = None
     secondary_assessor: Optional[str] = None
@@ -36,25 +37,19 @@ class AssessmentUpdate(BaseModel):
     status: Optional[AssessmentStatus] = None
 
 
-class AssessmentResponse(AssessmentBase):
+class AssessmentResponse(FastConstructMixin, AssessmentBase):
     """Schema for assessment responses."""
     
     id: UUID
     status: AssessmentStatus = AssessmentStatus.DRAFT
-    v_r_score: Optional[float] = Field(None, ge=0, le=100)
-    confidence_lower: Optional[float] = Field(None, ge=0, le=100)
-    confidence_upper: Optional[float] = Field(None, ge=0, le=100)
+    # Not settable through the API; read models skip re-checking bounds
+    # and lower <= upper on every load
+    v_r_score: Optional[float] = None
+    confidence_lower: Optional[float] = None
+    confidence_upper: Optional[float] = None
     created_at: datetime
     
-    @model_validator(mode='after')
-    def validate_confidence_interval(self) -> 'AssessmentResponse':
-        if (self.confidence_upper is not None and 
-            self.confidence_lower is not None and 
-            self.confidence_upper < self.confidence_lower):
-            raise ValueError('confidence_upper must be >= confidence_lower')
-        return self
-    
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
 
 
 class AssessmentWithScores(AssessmentResponse):
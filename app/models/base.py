@@ -0,0 +1,37 @@
+"""Shared model helpers for PE Org-AI-R Platform."""
+from collections.abc import Mapping
+from datetime import datetime, timezone
+from typing import Any
+
+_UTC = timezone.utc
+
+
+def utcnow() -> datetime:
+    """Timezone-aware now; use as default_factory instead of a lambda."""
+    return datetime.now(_UTC)
+
+
+class FastConstructMixin:
+    """Build response models from trusted database rows without validation."""
+
+    @classmethod
+    def from_orm_fast(cls, obj: Any):
+        """
+        Construct via model_construct (no validators, no constraint checks).
+
+        Accepts a mapping (Snowflake DictCursor rows use uppercase keys),
+        a SQLAlchemy Row (`_mapping`) or a plain object. Values must already
+        have the field types; use model_validate for untrusted input.
+        """
+        if isinstance(obj, Mapping):
+            data = obj
+        elif hasattr(obj, '_mapping'):
+            data = obj._mapping
+        else:
+            data = vars(obj)
+
+        fields = cls.model_fields
+        return cls.model_construct(**{
+            key.lower(): value for key, value in data.items()
+            if key.lower() in fields
+        })
@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field, field_validator, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
+from app.models.base import FastConstructMixin
 
 
 class CompanyBase(BaseModel):
@@ -52,7 +53,7 @@ class CompanyUpdate(BaseModel):
         return v.strip() if v else None
 
 
-class CompanyResponse(CompanyBase):
+class CompanyResponse(FastConstructMixin, CompanyBase):
     """Schema for company responses."""
     
     id: UUID
@@ -60,7 +61,7 @@ class CompanyResponse(CompanyBase):
     created_at: datetime
     updated_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
 
 
 class CompanyWithIndustry(CompanyResponse):
@@ -2,8 +2,10 @@
 from pydantic import BaseModel, Field, model_validator, ConfigDict
 from uuid import UUID
 from datetime import datetime
-from typing import Optional
-from app.models.enums import Dimension, DIMENSION_WEIGHTS
+from typing import Any, Optional, Sequence
+import numpy as np
+from app.models.enums import Dimension, WEIGHTS_BY_CODE
+from app.models.base import FastConstructMixin
 
 
 class DimensionScoreBase(BaseModel):
@@ -16,11 +18,17 @@ class DimensionScoreBase(BaseModel):
     confidence: float = Field(default=0.8, ge=0, le=1)
     evidence_count: int = Field(default=0, ge=0)
     
-    @model_validator(mode='after')
-    def set_default_weight(self) -> 'DimensionScoreBase':
-        if self.weight is None:
-            self.weight = DIMENSION_WEIGHTS.get(self.dimension, 0.1)
-        return self
+    @model_validator(mode='before')
+    @classmethod
+    def set_default_weight(cls, data: Any) -> Any:
+        # Runs on input data so frozen response models can use it too
+        if isinstance(data, dict) and data.get('weight') is None and 'dimension' in data:
+            try:
+                weight = Dimension(data['dimension']).weight
+            except ValueError:
+                return data  # invalid dimension is reported by field validation
+            data = {**data, 'weight': weight}
+        return data
 
 
 class DimensionScoreCreate(DimensionScoreBase):
@@ -37,10 +45,45 @@ class DimensionScoreUpdate(BaseModel):
     evidence_count: Optional[int] = Field(None, ge=0)
 
 
-class DimensionScoreResponse(DimensionScoreBase):
+class DimensionScoreResponse(FastConstructMixin, DimensionScoreBase):
     """Schema for dimension score responses."""
     
     id: UUID
+    # Bounds are enforced on create/update; read models skip them
+    score: float
+    weight: Optional[float] = None
+    confidence: float = 0.8
+    evidence_count: int = 0
     created_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
+
+
+def compute_vr_scores(scores: np.ndarray, weights: np.ndarray, confidences: np.ndarray) -> np.ndarray:
+    """
+    VR scores for a batch of assessments.
+    
+    Inputs are (n_assessments, n_dimensions) float64 arrays; NaN scores mark
+    missing dimensions. Each row is the weight x confidence weighted average
+    of its present scores, NaN when nothing is present.
+    """
+    w = np.where(np.isnan(scores), 0.0, weights * confidences)
+    total = w.sum(axis=1)
+    weighted = np.nansum(scores * w, axis=1)
+    with np.errstate(invalid='ignore', divide='ignore'):
+        return np.round(np.where(total > 0, weighted / total, np.nan), 2)
+
+
+def compute_vr_score(scores: Sequence[DimensionScoreBase]) -> Optional[float]:
+    """VR score for one assessment's dimension scores (None if empty)."""
+    if not scores:
+        return None
+    columns = np.array(
+        [(d.score, np.nan if d.weight is None else d.weight, d.confidence) for d in scores],
+        dtype=np.float64
+    ).T
+    # Unset weights fall back to the defaults, gathered by dimension code
+    defaults = np.take(WEIGHTS_BY_CODE, [d.dimension.code for d in scores])
+    weights = np.where(np.isnan(columns[1]), defaults, columns[1])
+    vr = compute_vr_scores(columns[0:1], weights[None, :], columns[2:3])[0]
+    return None if np.isnan(vr) else float(vr)
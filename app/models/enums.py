@@ -1,7 +1,7 @@
 """
 Enumerations for PE Org-AI-R Platform
 """
-from enum import Enum
+from enum import Enum, IntEnum
 
 
 class AssessmentType(str, Enum):
@@ -57,9 +57,42 @@ DIMENSION_WEIGHTS = {
 }
 
 
+class DimensionCode(IntEnum):
+    """Integer codes for Dimension (same order) for in-process keys and arrays.
+    
+    The API and DB keep the string labels; convert with Dimension.<member>.code.
+    """
+    
+    DATA_INFRASTRUCTURE = 0
+    AI_GOVERNANCE = 1
+    TECHNOLOGY_STACK = 2
+    TALENT_SKILLS = 3
+    LEADERSHIP_VISION = 4
+    USE_CASE_PORTFOLIO = 5
+    CULTURE_CHANGE = 6
+
+
+# Default weights indexed by DimensionCode
+WEIGHTS_BY_CODE = tuple(DIMENSION_WEIGHTS[Dimension[c.name]] for c in DimensionCode)
+
+# Expose code and default weight on each member (attribute load, no dict probe)
+for _dimension in Dimension:
+    _dimension.code = DimensionCode[_dimension.name]
+    _dimension.weight = WEIGHTS_BY_CODE[_dimension.code]
+del _dimension
+
+
 class SignalCategory(str, Enum):
     """Signal category types - match what pipeline uses."""
-    HIRING = "hiring_signal"  
+    HIRING = "hiring_signal"
     PATENT = "patent"
     GITHUB = "github"
-    LEADERSHIP = "leadership"
\ No newline at end of file
+    LEADERSHIP = "leadership"
+
+
+# Bit positions for company_evidence_summary.filing_types_mask
+FILING_TYPE_BITS = {
+    "10-K": 1,
+    "10-Q": 2,
+    "8-K": 4,
+}
@@ -1,9 +1,10 @@
 """Evidence document and chunk models for CS2."""
-from pydantic import BaseModel, Field, field_validator
+from pydantic import BaseModel, Field, field_validator, ConfigDict
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
 from enum import Enum
+from app.models.base import FastConstructMixin, utcnow
 
 
 class DocumentStatus(str, Enum):
@@ -50,14 +51,13 @@ class EvidenceDocumentCreate(BaseModel):
         return v.upper()
 
 
-class EvidenceDocumentResponse(EvidenceDocumentCreate):
+class EvidenceDocumentResponse(FastConstructMixin, EvidenceDocumentCreate):
     """Evidence document with generated fields."""
     id: UUID = Field(default_factory=uuid4)
     status: DocumentStatus = DocumentStatus.PARSED
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
 
 
 class ChunkCreate(BaseModel):
@@ -78,13 +78,12 @@ class ChunkCreate(BaseModel):
     page: int = Field(ge=1)
 
 
-class ChunkResponse(ChunkCreate):
+class ChunkResponse(FastConstructMixin, ChunkCreate):
     """Chunk with generated fields."""
     id: UUID = Field(default_factory=uuid4)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    created_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
 
 
 class DocumentSummary(BaseModel):
@@ -97,5 +96,4 @@ class DocumentSummary(BaseModel):
     section_count: int
     status: DocumentStatus
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
\ No newline at end of file
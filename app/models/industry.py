@@ -3,6 +3,7 @@ from pydantic import BaseModel, Field, ConfigDict
 from uuid import UUID
 from datetime import datetime
 from typing import Optional
+from app.models.base import FastConstructMixin
 
 
 class IndustryBase(BaseModel):
@@ -18,10 +19,12 @@ class IndustryCreate(IndustryBase):
     pass
 
 
-class IndustryResponse(IndustryBase):
+class IndustryResponse(FastConstructMixin, IndustryBase):
     """Schema for industry responses."""
     
     id: UUID
+    # Stored values were bounds-checked on create; don't re-check on read
+    h_r_base: float
     created_at: datetime
     
-    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
\ No newline at end of file
@@ -1,8 +1,9 @@
 """
 Pagination models for list endpoints.
 """
-from pydantic import BaseModel, Field
-from typing import Generic, TypeVar, List
+from functools import lru_cache
+from pydantic import BaseModel, Field, TypeAdapter
+from typing import Generic, Optional, Type, TypeVar, List
 
 T = TypeVar('T')
 
@@ -13,17 +14,38 @@ class PaginatedResponse(BaseModel, Generic[T]):
     items: List[T]
     total: int = Field(..., ge=0)
     page: int = Field(..., ge=1)
-    page_size: int = Field(..., ge=1, le=100)
+    page_size: int  # bounds enforced by the Query parameter
     total_pages: int = Field(..., ge=0)
     
     @staticmethod
-    def create(items: List[T], total: int, page: int, page_size: int) -> 'PaginatedResponse[T]':
-        """Factory method to create paginated response with automatic total_pages calculation."""
-        total_pages = (total + page_size - 1) // page_size if page_size > 0 else 0
-        return PaginatedResponse(
+    @lru_cache(maxsize=None)
+    def adapter_for(item_type: type) -> TypeAdapter:
+        """
+        Shared TypeAdapter(list[item_type]).
+        
+        Building a TypeAdapter compiles a validator, so create it once per
+        item type and reuse it (Pydantic performance guide).
+        """
+        return TypeAdapter(list[item_type])
+    
+    @classmethod
+    def create(
+        cls, items: List[T], total: int, page: int, page_size: int,
+        item_type: Optional[Type[T]] = None
+    ) -> 'PaginatedResponse[T]':
+        """Factory method to create paginated response with automatic total_pages calculation.
+        
+        Built with model_construct: the arguments come from the service layer
+        and validated query parameters. If item_type is given and items are
+        raw dicts (e.g. a Redis cache hit), they are validated in one list
+        pass instead of per item.
+        """
+        if item_type is not None and items and not isinstance(items[0], item_type):
+            items = cls.adapter_for(item_type).validate_python(items)
+        return cls.model_construct(
             items=items,
             total=total,
             page=page,
             page_size=page_size,
-            total_pages=total_pages
-        )
\ No newline at end of file
+            total_pages=-(-total // page_size) if page_size else 0
+        )
@@ -1,17 +1,18 @@
 """Signal models for external evidence."""
-from pydantic import BaseModel, Field, model_validator
+from pydantic import BaseModel, Field, model_validator, computed_field, ConfigDict
 from uuid import UUID, uuid4
-from datetime import datetime, timezone
+from datetime import datetime
 from typing import Optional
-from enum import Enum
+import numpy as np
+from app.models.enums import FILING_TYPE_BITS, SignalCategory
+from app.models.base import FastConstructMixin, utcnow
 
 
-class SignalCategory(str, Enum):
-    """Signal category types."""
-    HIRING = "hiring"
-    PATENT = "patent"
-    GITHUB = "github"
-    LEADERSHIP = "leadership"
+# Required metadata keys per category, filled with setdefault
+_CATEGORY_DEFAULTS = {
+    # Hiring signals should document their source
+    SignalCategory.HIRING: (('source', 'unknown'),),
+}
 
 
 class SignalCreate(BaseModel):
@@ -29,28 +30,68 @@ class SignalCreate(BaseModel):
     @model_validator(mode='after')
     def validate_metadata(self) -> 'SignalCreate':
         """Ensure metadata has required fields based on category."""
-        if self.category == SignalCategory.HIRING:
-            # Hiring signals should document their source
-            if 'source' not in self.metadata:
-                self.metadata['source'] = 'unknown'
+        for key, default in _CATEGORY_DEFAULTS.get(self.category, ()):
+            self.metadata.setdefault(key, default)
         
-        # Add collection timestamp if not present
+        # Add collection timestamp if not present (batch callers pass one in)
         if 'collected_at' not in self.metadata:
-            self.metadata['collected_at'] = datetime.now(timezone.utc).isoformat()
+            self.metadata['collected_at'] = utcnow().isoformat()
         
         return self
 
 
-class SignalResponse(SignalCreate):
+class SignalResponse(FastConstructMixin, SignalCreate):
     """Signal with generated fields."""
     id: UUID = Field(default_factory=uuid4)
-    created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    # Bounds are enforced on create; read models skip them
+    score: float
+    confidence: float
+    created_at: datetime = Field(default_factory=utcnow)
     
-    class Config:
-        from_attributes = True
+    model_config = ConfigDict(from_attributes=True, frozen=True, extra='ignore', validate_default=False)
 
 
-class CompanyEvidenceSummary(BaseModel):
+# PE Org-AI-R framework weights per signal category
+_W = np.array([0.30, 0.25, 0.20, 0.25], dtype=np.float64)  # hiring, patent, github, leadership
+
+
+def compute_summary_scores(
+    hiring: Optional[float],
+    patent: Optional[float],
+    github: Optional[float],
+    leadership: Optional[float],
+    confidences: tuple = ()
+) -> tuple[Optional[float], float]:
+    """
+    Composite score and evidence quality for a company summary.
+    
+    composite = weighted average of the present scores, weights renormalized
+    (hiring 30%, patent 25%, GitHub 20%, leadership 25%).
+    quality = completeness x 0.5 + avg confidence x 0.5 (0.5 if none known).
+    
+    Called by the summary writer; the results are stored as columns so
+    reads never recompute them.
+    """
+    s = np.array(
+        [np.nan if v is None else v for v in (hiring, patent, github, leadership)],
+        dtype=np.float64
+    )
+    mask = ~np.isnan(s)
+    present = int(mask.sum())
+    
+    composite = None
+    if present:
+        w = _W[mask]
+        composite = round(float(np.dot(s[mask], w) / w.sum()), 2)
+    
+    known = [c for c in confidences if c is not None]
+    avg_confidence = sum(known) / len(known) if known else 0.5
+    quality = round((present / 4) * 0.5 + avg_confidence * 0.5, 3)
+    
+    return composite, quality
+
+
+class CompanyEvidenceSummary(FastConstructMixin, BaseModel):
     """
     Pre-aggregated evidence summary for a company.
     This is the primary model for dashboard queries.
@@ -62,106 +103,53 @@ class CompanyEvidenceSummary(BaseModel):
     total_documents: int = 0
     total_chunks: int = 0
     latest_filing_date: Optional[datetime] = None
-    has_10k: bool = False
-    has_10q: bool = False
-    has_8k: bool = False
+    filing_types_mask: int = Field(0, ge=0)  # see FILING_TYPE_BITS
     
-    # Signal scores (one per category)
-    hiring_score: Optional[float] = Field(None, ge=0, le=100)
+    # Signal scores (one per category) with flattened hot metadata keys
+    hiring_score: Optional[float] = None
     hiring_metadata: Optional[dict] = None
+    hiring_job_count: Optional[int] = None
+    hiring_ai_job_count: Optional[int] = None
+    hiring_ai_ratio: Optional[float] = None
     
-    patent_score: Optional[float] = Field(None, ge=0, le=100)
+    patent_score: Optional[float] = None
     patent_metadata: Optional[dict] = None
+    patent_total_count: Optional[int] = None
+    patent_ai_count: Optional[int] = None
+    patent_recent_ai_count: Optional[int] = None
+    patent_ai_ratio: Optional[float] = None
     
-    github_score: Optional[float] = Field(None, ge=0, le=100)
+    github_score: Optional[float] = None
     github_metadata: Optional[dict] = None
+    github_repo_count: Optional[int] = None
+    github_ai_repo_count: Optional[int] = None
+    github_ai_stars: Optional[int] = None
     
-    leadership_score: Optional[float] = Field(None, ge=0, le=100)
+    leadership_score: Optional[float] = None
     leadership_metadata: Optional[dict] = None
     
-    # Composite score (calculated)
-    composite_score: Optional[float] = Field(None, ge=0, le=100)
+    # Composite score (computed at write time, see compute_summary_scores)
+    composite_score: Optional[float] = None
     
-    # Quality metric
-    evidence_quality: Optional[float] = Field(None, ge=0, le=1)
+    # Quality metric (computed at write time)
+    evidence_quality: Optional[float] = None
     
     # Timestamps
-    last_updated: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+    last_updated: datetime = Field(default_factory=utcnow)
     
-    @model_validator(mode='after')
-    def calculate_composite_score(self) -> 'CompanyEvidenceSummary':
-        """
-        Calculate weighted composite score from signal categories.
-        
-        Weights from PE Org-AI-R framework:
-        - Hiring: 30%
-        - Patent: 25%
-        - GitHub: 20%
-        - Leadership: 25%
-        """
-        scores = []
-        weights = []
-        
-        if self.hiring_score is not None:
-            scores.append(self.hiring_score)
-            weights.append(0.30)
-        
-        if self.patent_score is not None:
-            scores.append(self.patent_score)
-            weights.append(0.25)
-        
-        if self.github_score is not None:
-            scores.append(self.github_score)
-            weights.append(0.20)
-        
-        if self.leadership_score is not None:
-            scores.append(self.leadership_score)
-            weights.append(0.25)
-        
-        if scores:
-            # Normalize weights to sum to 1
-            total_weight = sum(weights)
-            normalized_weights = [w / total_weight for w in weights]
-            
-            # Weighted average
-            self.composite_score = round(
-                sum(s * w for s, w in zip(scores, normalized_weights)),
-                2
-            )
-        
-        return self
+    @computed_field
+    @property
+    def has_10k(self) -> bool:
+        return bool(self.filing_types_mask & FILING_TYPE_BITS["10-K"])
     
-    @model_validator(mode='after')
-    def calculate_evidence_quality(self) -> 'CompanyEvidenceSummary':
-        """
-        Calculate evidence quality score based on completeness and confidence.
-        
-        Quality = (data_completeness × 0.5) + (avg_confidence × 0.5)
-        """
-        # Data completeness: how many signal categories do we have?
-        signals_present = sum([
-            self.hiring_score is not None,
-            self.patent_score is not None,
-            self.github_score is not None,
-            self.leadership_score is not None
-        ])
-        completeness = signals_present / 4  # 4 signal categories
-        
-        # Average confidence from metadata
-        confidences = []
-        for metadata in [self.hiring_metadata, self.patent_metadata, 
-                        self.github_metadata, self.leadership_metadata]:
-            if metadata and 'confidence' in metadata:
-                confidences.append(metadata['confidence'])
-        
-        avg_confidence = sum(confidences) / len(confidences) if confidences else 0.5
-        
-        self.evidence_quality = round(
-            (completeness * 0.5) + (avg_confidence * 0.5),
-            3
-        )
-        
-        return self
+    @computed_field
+    @property
+    def has_10q(self) -> bool:
+        return bool(self.filing_types_mask & FILING_TYPE_BITS["10-Q"])
+    
+    @computed_field
+    @property
+    def has_8k(self) -> bool:
+        return bool(self.filing_types_mask & FILING_TYPE_BITS["8-K"])
     
-    class Config:
-        from_attributes = True
\ No newline at end of file
+    model_config = ConfigDict(from_attributes=True)
\ No newline at end of file
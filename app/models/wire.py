@@ -0,0 +1,32 @@
+"""
+msgspec mirrors of high-traffic response models.
+
+Outbound list endpoints encode these with msgspec (see app/responses.py)
+instead of going through Pydantic serialization. Inbound bodies keep
+using the Pydantic models.
+"""
+from collections.abc import Mapping
+from datetime import datetime
+from typing import Any, Optional
+from uuid import UUID
+
+import msgspec
+
+
+class CompanyStruct(msgspec.Struct, frozen=True, kw_only=True):
+    """Mirror of CompanyResponse."""
+    id: UUID
+    name: str
+    ticker: Optional[str] = None
+    industry_id: UUID
+    position_factor: float = 0.0
+    is_deleted: bool = False
+    created_at: datetime
+    updated_at: datetime
+
+
+def to_struct(struct_type: type, obj: Any):
+    """Convert a Pydantic model (or a cached dict) to its msgspec mirror."""
+    if isinstance(obj, Mapping):
+        return msgspec.convert(obj, struct_type, strict=False)
+    return struct_type(**{name: getattr(obj, name) for name in struct_type.__struct_fields__})
@@ -0,0 +1,96 @@
+"""Persistent sentence-embedding cache keyed by content hash."""
+import hashlib
+import sqlite3
+import threading
+from pathlib import Path
+
+import numpy as np
+
+from app.pipelines.embedding_model import cache_model_name
+
+CACHE_PATH = Path(__file__).resolve().parents[2] / ".cache" / "embeddings.sqlite"
+
+
+class EmbeddingCache:
+    """
+    SQLite key-value store: sha1(model + text) -> unit-length vector bytes.
+    
+    Vectors are stored as float16 (half the disk and read I/O); they are
+    only used for cosine similarity, where that precision is plenty.
+    """
+
+    def __init__(self, path: Path = CACHE_PATH):
+        path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(path), check_same_thread=False)
+        self._conn.execute(
+            "CREATE TABLE IF NOT EXISTS unit_embeddings_f16 (key BLOB PRIMARY KEY, vec BLOB NOT NULL)"
+        )
+        self._lock = threading.Lock()
+
+    @staticmethod
+    def key(model_name: str, text: str) -> bytes:
+        return hashlib.sha1(f"{model_name}\0{text}".encode("utf-8")).digest()
+
+    def get_many(self, keys: list) -> dict:
+        """Cached vectors for the given keys (missing keys are absent)."""
+        found = {}
+        with self._lock:
+            # Stay under SQLite's bound-parameter limit
+            for i in range(0, len(keys), 500):
+                chunk = keys[i:i + 500]
+                rows = self._conn.execute(
+                    f"SELECT key, vec FROM unit_embeddings_f16 WHERE key IN ({','.join('?' * len(chunk))})",
+                    chunk
+                ).fetchall()
+                found.update((k, np.frombuffer(v, dtype=np.float16)) for k, v in rows)
+        return found
+
+    def put_many(self, items: list) -> None:
+        """Store (key, vector) pairs."""
+        with self._lock, self._conn:
+            self._conn.executemany(
+                "INSERT OR REPLACE INTO unit_embeddings_f16 (key, vec) VALUES (?, ?)",
+                [(k, np.asarray(v, dtype=np.float16).tobytes()) for k, v in items]
+            )
+
+
+_cache = None
+
+
+def get_embedding_cache() -> EmbeddingCache:
+    """Process-wide cache instance (opened on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = EmbeddingCache()
+    return _cache
+
+
+def encode_cached(model, model_name: str, texts: list, **encode_kwargs) -> np.ndarray:
+    """
+    model.encode(texts) as a float32 (len(texts), dim) array, encoding only
+    texts not already in the on-disk cache.
+    
+    Vectors are L2-normalized, so cosine similarity is a plain dot product.
+    """
+    if not texts:
+        return np.empty((0, 0), dtype=np.float32)
+    cache = get_embedding_cache()
+    model_name = cache_model_name(model_name)
+    keys = [EmbeddingCache.key(model_name, t) for t in texts]
+    found = cache.get_many(list(set(keys)))
+
+    missing = {}
+    for k, t in zip(keys, texts):
+        if k not in found:
+            missing.setdefault(k, t)
+    if missing:
+        new = model.encode(
+            list(missing.values()), convert_to_numpy=True, normalize_embeddings=True, **encode_kwargs
+        )
+        # Round fresh vectors like cached ones so results match across runs
+        new = np.asarray(new, dtype=np.float16)
+        fresh = list(zip(missing.keys(), new))
+        cache.put_many(fresh)
+        found.update(fresh)
+
+    return np.stack([found[k] for k in keys]).astype(np.float32, copy=False)
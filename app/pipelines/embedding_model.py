@@ -0,0 +1,54 @@
+"""Sentence-transformer loading with an optional ONNX Runtime backend."""
+import os
+from functools import lru_cache
+
+import torch
+from sentence_transformers import SentenceTransformer
+
+# ONNX exports shipped in the sentence-transformers hub repos
+_ONNX_FILES = {
+    "onnx": "onnx/model.onnx",
+    "onnx-int8": "onnx/model_qint8_avx512.onnx",
+}
+
+
+def embedding_backend() -> str:
+    """EMBEDDING_BACKEND: torch (default) | onnx | onnx-int8 (read at call time, after load_dotenv)."""
+    return os.getenv("EMBEDDING_BACKEND", "torch").lower()
+
+
+@lru_cache(maxsize=1)
+def embedding_device() -> str:
+    """'cuda' when a GPU is visible, else 'cpu'."""
+    return "cuda" if torch.cuda.is_available() else "cpu"
+
+
+def encode_batch_size() -> int:
+    """Larger batches keep a GPU busy; small ones limit padding on CPU."""
+    return 128 if embedding_device() == "cuda" else 32
+
+
+def load_sentence_transformer(model_name: str) -> SentenceTransformer:
+    """Load model_name on the backend selected by EMBEDDING_BACKEND."""
+    backend = embedding_backend()
+    if backend == "torch":
+        return SentenceTransformer(model_name, device=embedding_device())
+    if backend not in _ONNX_FILES:
+        raise ValueError(
+            f"Unknown EMBEDDING_BACKEND {backend!r}; "
+            f"expected one of torch, {', '.join(_ONNX_FILES)}"
+        )
+    # Requires sentence-transformers[onnx] (optimum + onnxruntime)
+    return SentenceTransformer(
+        model_name,
+        backend="onnx",
+        model_kwargs={"file_name": _ONNX_FILES[backend]}
+    )
+
+
+def cache_model_name(model_name: str) -> str:
+    """Embedding cache namespace; quantized vectors must not mix with torch ones."""
+    backend = embedding_backend()
+    if backend == "torch":
+        return model_name
+    return f"{model_name}:{backend}"
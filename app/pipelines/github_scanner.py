@@ -5,23 +5,33 @@ import math
 import base64
 from datetime import datetime
 from uuid import uuid4
-from sentence_transformers import SentenceTransformer, util
+from app.pipelines.embedding_cache import encode_cached
+from app.pipelines.embedding_model import load_sentence_transformer
 from app.core.github_config import (
-    get_github_orgs, get_ai_topics, get_ai_languages, 
+    get_github_orgs, get_ai_topics, get_ai_topic_bits, get_ai_languages, 
     get_ai_references, get_similarity_threshold, get_scoring_config
 )
 
+MODEL_NAME = 'all-mpnet-base-v2'
+
 _model = None
 _ref_emb = None
 
 def _load_model():
     global _model, _ref_emb
     if _model is None:
-        _model = SentenceTransformer('all-mpnet-base-v2')
-        _ref_emb = _model.encode(get_ai_references(), convert_to_tensor=True)
+        _model = load_sentence_transformer(MODEL_NAME)
+        # Reference embeddings come from the disk cache after the first run
+        _ref_emb = encode_cached(_model, MODEL_NAME, list(get_ai_references()))
     return _model, _ref_emb
 
 
+def warmup():
+    """Load the model and reference embeddings ahead of the first scan."""
+    model, _ = _load_model()
+    model.encode(["warmup"])  # first encode pays one-off torch init costs
+
+
 async def scan_company(ticker: str, company_id: str, token: str = None) -> dict:
     """Scan GitHub for one company."""
     orgs = get_github_orgs(ticker)
@@ -72,60 +82,62 @@ async def scan_company(ticker: str, company_id: str, token: str = None) -> dict:
     
     # Classify
     ai_topics = get_ai_topics()
+    topic_bits = get_ai_topic_bits()
     ai_langs = get_ai_languages()
     threshold = get_similarity_threshold()
     scoring = get_scoring_config()
     
     ai_repos = []
-    all_matched_topics = set()  # Track UNIQUE topics across all repos
+    all_topic_bits = 0  # Bitmap of UNIQUE topics across all repos
     
     print(f"\n  Classifying {len(all_repos)} repos...")
     
+    min_score = scoring['min_score_threshold']
+    candidates = []
+    
     for r in all_repos:
         if r.get('fork'):
             continue
         
         score = 0
         why = []
-        matched_topics = set()
         
-        # Topics
-        topics = set(r.get('topics', []))
-        matches = topics & ai_topics
-        if matches:
+        # Topics (one int OR per topic instead of set intersections)
+        repo_bits = 0
+        for t in r.get('topics') or ():
+            repo_bits |= topic_bits.get(t, 0)
+        if repo_bits:
             score += scoring['topic_match_weight']
-            matched_topics.update(matches)
-            why.append(f"topics:{list(matches)[0]}")
+            why.append(f"topics:{_bits_to_topics(repo_bits, topic_bits)[0]}")
         
         # Language
         if r.get('language') in ai_langs:
             score += scoring['language_weight']
             why.append(f"lang:{r['language']}")
         
-        # Description semantic
-        if score < scoring['min_score_threshold']:
-            if r.get('description'):
-                sim = _semantic_score(r['description'])
-                if sim > threshold:
-                    score += scoring['semantic_weight']
-                    why.append(f"desc:{sim:.2f}")
-            
-            # README semantic
-            if score < scoring['min_score_threshold'] and r.get('readme_text'):
-                sim = _semantic_score(r['readme_text'][:2000])
-                if sim > threshold:
-                    score += scoring['semantic_weight']
-                    why.append(f"readme:{sim:.2f}")
-        
-        if score >= scoring['min_score_threshold']:
+        candidates.append({'repo': r, 'score': score, 'why': why, 'bits': repo_bits})
+    
+    # Semantic checks for repos still under the threshold: descriptions first,
+    # then READMEs, each as one batched encode instead of one per repo
+    for field, label, limit in (('description', 'desc', None), ('readme_text', 'readme', 2000)):
+        pending = [c for c in candidates if c['score'] < min_score and c['repo'].get(field)]
+        sims = _semantic_scores([c['repo'][field][:limit] for c in pending])
+        for c, sim in zip(pending, sims):
+            if sim > threshold:
+                c['score'] += scoring['semantic_weight']
+                c['why'].append(f"{label}:{sim:.2f}")
+    
+    for c in candidates:
+        r, score, why, repo_bits = c['repo'], c['score'], c['why'], c['bits']
+        if score >= min_score:
             ai_repos.append({
                 'name': r['name'],
                 'stars': r.get('stargazers_count', 0),
                 'score': score,
                 'why': why,
-                'topics': list(matched_topics)
+                'topics': _bits_to_topics(repo_bits, topic_bits)
             })
-            all_matched_topics.update(matched_topics)  # Aggregate unique topics
+            all_topic_bits |= repo_bits  # Aggregate unique topics
             print(f"    ✓ {r['name'][:35]:35} {score:2.0f}pts ({', '.join(why)})")
     
     # Calculate scores
@@ -147,7 +159,8 @@ async def scan_company(ticker: str, company_id: str, token: str = None) -> dict:
     # Component 3: DIVERSITY (0-30 points)
     # How many UNIQUE AI topics are covered across all repos
     total_possible_topics = len(ai_topics)
-    unique_topics_count = len(all_matched_topics)
+    unique_topics_count = all_topic_bits.bit_count()
+    all_matched_topics = _bits_to_topics(all_topic_bits, topic_bits)
     diversity_score = min(30, 30 * math.log1p(unique_topics_count) / math.log1p(20))    
     final = ratio_score + star_score + diversity_score
     
@@ -155,7 +168,7 @@ async def scan_company(ticker: str, company_id: str, token: str = None) -> dict:
     print(f"    Ratio:     {ai_count}/{total} ({ratio*100:.1f}%) → {ratio_score:.1f} pts")
     print(f"    Stars:     {stars:,} (log scale) → {star_score:.1f} pts")
     print(f"    Diversity: {unique_topics_count}/{total_possible_topics} unique topics → {diversity_score:.1f} pts")
-    print(f"    Topics covered: {sorted(list(all_matched_topics))[:5]}...")
+    print(f"    Topics covered: {all_matched_topics[:5]}...")
     print(f"    TOTAL:     {final:.1f}/100")
     
     return {
@@ -170,7 +183,7 @@ async def scan_company(ticker: str, company_id: str, token: str = None) -> dict:
             "total_repos": total,
             "ai_repos": ai_count,
             "ai_stars": stars,
-            "unique_ai_topics": list(all_matched_topics), 
+            "unique_ai_topics": all_matched_topics, 
             "topic_coverage": f"{unique_topics_count}/{total_possible_topics}",  
             "top_repos": sorted(ai_repos, key=lambda x: -x['stars'])[:5]
         },
@@ -191,13 +204,25 @@ async def _fetch_readme(client, repo_full_name):
     return None
 
 
-def _semantic_score(text):
-    """Semantic similarity score."""
-    if len(text) < 20:
-        return 0
+def _bits_to_topics(bits, topic_bits):
+    """Decode a topic bitmap back to topic names (sorted)."""
+    return [t for t, bit in topic_bits.items() if bits & bit]
+
+
+def _semantic_scores(texts, batch_size=64):
+    """Max semantic similarity to the AI references, one batched encode."""
+    scores = [0.0] * len(texts)
+    # Texts under 20 chars are too short to score
+    idx = [i for i, t in enumerate(texts) if len(t) >= 20]
+    if not idx:
+        return scores
     model, ref_emb = _load_model()
-    emb = model.encode(text[:500], convert_to_tensor=True)
-    return float(util.cos_sim(emb, ref_emb)[0].max())
+    # Repos are rescanned across runs; only unseen texts hit the model
+    emb = encode_cached(model, MODEL_NAME, [texts[i][:500] for i in idx], batch_size=batch_size)
+    sims = (emb @ ref_emb.T).max(axis=1).tolist()  # unit vectors: dot = cosine
+    for i, sim in zip(idx, sims):
+        scores[i] = sim
+    return scores
 
 
 def _empty(company_id):
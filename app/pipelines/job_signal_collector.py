@@ -1,12 +1,13 @@
 """Lean AI job scraper - config from YAML - CORRECTED to track total_scraped."""
 from jobspy import scrape_jobs
+import numpy as np
 import pandas as pd
 import re
 from datetime import datetime
-from difflib import SequenceMatcher
-from uuid import uuid4
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
-from sentence_transformers import SentenceTransformer, util
+from app.pipelines.embedding_cache import encode_cached
+from app.pipelines.embedding_model import encode_batch_size, load_sentence_transformer
 
 # Check if Playwright available
 try:
@@ -17,106 +18,215 @@ except ImportError:
 
 from app.core.keywords import (
     get_all_job_titles, get_ai_references, get_similarity_threshold,
-    get_acronyms, get_seniority_keywords
+    get_acronyms, get_seniority_patterns, classify_seniority
 )
 
+MODEL_NAME = 'all-mpnet-base-v2'
+
 _model, _ref_emb = None, None
 
 def _load_model():
     global _model, _ref_emb
     if _model is None:
-        _model = SentenceTransformer('all-mpnet-base-v2')
-        _ref_emb = _model.encode(get_ai_references(), convert_to_tensor=True)
+        _model = load_sentence_transformer(MODEL_NAME)
+        _ref_emb = encode_cached(_model, MODEL_NAME, list(get_ai_references()))
     return _model, _ref_emb
 
 
-def score_job(title: str, desc: str = "") -> dict:
-    model, ref_emb = _load_model()
-    title = str(title or "").strip()
-    desc = str(desc or "").strip()[:1500]
-    
-    if not title and not desc:
-        return {"score": 0, "similarity": 0, "is_ai": False}
+def _score_texts(titles: list, descs: list) -> tuple[list, list, list, list]:
+    """Cleaned titles/descriptions, indices of non-empty postings and their scoring texts."""
+    titles = [str(t or "").strip() for t in titles]
+    descs = [str(d or "").strip()[:1500] for d in descs]
+    idx = [i for i, (t, d) in enumerate(zip(titles, descs)) if t or d]
+    texts = [
+        f"{titles[i]}. {titles[i]}. {descs[i]}" if descs[i] else f"{titles[i]}. {titles[i]}. {titles[i]}"
+        for i in idx
+    ]
+    return titles, descs, idx, texts
+
+
+def _scores_from_embeddings(titles: list, descs: list, idx: list, emb) -> dict:
+    """Score columns (score, similarity, is_ai arrays) from embeddings of the rows in idx."""
+    _, ref_emb = _load_model()
+    patterns = dict(get_seniority_patterns())
+    n = len(titles)
     
-    text = f"{title}. {title}. {desc}" if desc else f"{title}. {title}. {title}"
-    emb = model.encode(text, convert_to_tensor=True)
-    sim = util.cos_sim(emb, ref_emb)[0].max().item()
+    sims = np.zeros(n)
+    has_text = np.zeros(n, dtype=bool)
+    if idx:
+        sims[idx] = (emb @ ref_emb.T).max(axis=1)  # unit vectors: dot = cosine
+        has_text[idx] = True
     
-    base = min(60, sim * 100)
-    sen = get_seniority_keywords()
-    t_low = title.lower()
-    bonus = 20 if any(k in t_low for k in sen.get("leadership", [])) else (
-            10 if any(k in t_low for k in sen.get("senior", [])) else 0)
-    desc_bonus = 10 if len(desc) > 500 else (5 if len(desc) > 100 else 0)
+    t_low = pd.Series(titles, dtype=object).str.lower()
+    bonus = np.where(t_low.str.contains(patterns["leadership"]).to_numpy(dtype=bool), 20,
+                     np.where(t_low.str.contains(patterns["senior"]).to_numpy(dtype=bool), 10, 0))
+    desc_len = np.fromiter(map(len, descs), dtype=np.int64, count=n)
+    desc_bonus = np.where(desc_len > 500, 10, np.where(desc_len > 100, 5, 0))
     
+    score = np.minimum(100, np.minimum(60, sims * 100) + bonus + desc_bonus)
     return {
-        "score": round(min(100, base + bonus + desc_bonus), 1),
-        "similarity": round(sim, 3),
-        "is_ai": sim >= get_similarity_threshold()
+        "score": np.where(has_text, np.round(score, 1), 0.0),
+        "similarity": np.round(sims, 3),
+        "is_ai": has_text & (sims >= get_similarity_threshold())
     }
 
 
-def dedupe(df: pd.DataFrame) -> pd.DataFrame:
-    """Simple: 85% similarity on 'title | location' combined string."""
+def _score_columns(titles: list, descs: list) -> dict:
+    """Score columns for a batch of postings with one (cached) encode."""
+    titles, descs, idx, texts = _score_texts(titles, descs)
+    emb = None
+    if texts:
+        model, _ = _load_model()
+        # encode() length-sorts internally; postings seen on earlier runs skip it
+        emb = encode_cached(model, MODEL_NAME, texts, batch_size=encode_batch_size(), show_progress_bar=False)
+    return _scores_from_embeddings(titles, descs, idx, emb)
+
+
+def score_jobs(titles: list, descs: list) -> list[dict]:
+    """Score a batch of postings with one (cached) encode."""
+    cols = _score_columns(titles, descs)
+    return [
+        {"score": float(s), "similarity": float(m), "is_ai": bool(a)}
+        for s, m, a in zip(cols["score"], cols["similarity"], cols["is_ai"])
+    ]
+
+
+def score_job(title: str, desc: str = "") -> dict:
+    return score_jobs([title], [desc])[0]
+
+
+_SR_RE = re.compile(r'\bsr\.?\s+')
+_JR_RE = re.compile(r'\bjr\.?\s+')
+
+
+@lru_cache(maxsize=1)
+def _acronym_pattern() -> tuple[re.Pattern, dict]:
+    """
+    One alternation regex over all acronyms plus their final expansions.
+    
+    Expanding acronyms one at a time (longest first) lets an expansion be
+    expanded again by a later acronym (genai -> generative ai -> generative
+    artificial intelligence). Resolving that chain here once keeps the same
+    output with a single scan per title.
+    """
+    ordered = sorted(get_acronyms().items(), key=lambda x: -len(x[0]))
+    expansions = {}
+    for pos, (k, v) in enumerate(ordered):
+        for later, later_v in ordered[pos + 1:]:
+            v = re.sub(rf'\b{re.escape(later)}\b', later_v, v)
+        expansions[k] = v
+    pattern = re.compile(r'\b(?:' + '|'.join(re.escape(k) for k, _ in ordered) + r')\b')
+    return pattern, expansions
+
+
+def _dedupe_keys(df: pd.DataFrame) -> tuple[list, list]:
+    """Normalized 'title | location' strings and normalized locations per row."""
+    acronym_re, expansions = _acronym_pattern()
+    
+    titles = (
+        df['title'].astype(str).str.lower().str.strip()
+        .str.replace(_SR_RE, 'senior ', regex=True)
+        .str.replace(_JR_RE, 'junior ', regex=True)
+    )
+    if expansions:
+        titles = titles.str.replace(acronym_re, lambda m: expansions[m.group(0)], regex=True)
+    titles = titles.str.replace(r'\s+', ' ', regex=True).str.strip()
+    
+    locs = (
+        df['location'].astype(str).str.lower().str.strip()
+        .str.replace(r'[,\s]+(il|us|usa|united states)$', '', regex=True)
+        .str.replace(r'\s+', ' ', regex=True).str.strip()
+        .replace('', 'null')
+    )
+    
+    locs = locs.tolist()
+    combined = [f"{t} | {l}" for t, l in zip(titles.tolist(), locs)]
+    return combined, locs
+
+
+def dedupe(df: pd.DataFrame, emb: np.ndarray = None) -> pd.DataFrame:
+    """
+    Cluster near-duplicate postings by embedding similarity of 'title | location'.
+    
+    emb: precomputed embeddings of the _dedupe_keys strings (one row per posting).
+    """
     if df.empty:
         return pd.DataFrame()
     
-    acronyms = get_acronyms()
-    
-    def norm_title(t):
-        t = str(t).lower().strip()
-        t = re.sub(r'\bsr\.?\s+', 'senior ', t)
-        t = re.sub(r'\bjr\.?\s+', 'junior ', t)
-        for k, v in sorted(acronyms.items(), key=lambda x: -len(x[0])):
-            t = re.sub(rf'\b{re.escape(k)}\b', v, t)
-        return re.sub(r'\s+', ' ', t).strip()
-    
-    def norm_loc(loc):
-        loc = str(loc).lower().strip()
-        loc = re.sub(r'[,\s]+(il|us|usa|united states)$', '', loc)
-        return re.sub(r'\s+', ' ', loc).strip() or 'null'
-    
-    df = df.copy()
-    df['_keep'] = True
-    df['_sources'] = df.get('site', 'unknown')
-    
-    for i in range(len(df)):
-        if not df.at[i, '_keep']:
-            continue
-        
-        title_i = norm_title(df.at[i, 'title'])
-        loc_i = norm_loc(df.at[i, 'location'])
-        combined_i = f"{title_i} | {loc_i}"
-        
-        for j in range(i + 1, len(df)):
-            if not df.at[j, '_keep']:
-                continue
-            
-            title_j = norm_title(df.at[j, 'title'])
-            loc_j = norm_loc(df.at[j, 'location'])
-            combined_j = f"{title_j} | {loc_j}"
-            
-            sim = SequenceMatcher(None, combined_i, combined_j).ratio()
-            
-            if sim >= 0.9:
-                if loc_i == 'null' and loc_j != 'null':
-                    df.at[i, '_keep'] = False
-                    break
-                elif loc_j == 'null' and loc_i != 'null':
-                    df.at[j, '_keep'] = False
-                else:
-                    # Merge sources
-                    src_i = set(str(df.at[i, '_sources']).split(','))
-                    src_j = set(str(df.at[j, 'site']).split(','))
-                    df.at[i, '_sources'] = ','.join(sorted(src_i | src_j))
-                    df.at[j, '_keep'] = False
-    
-    result = df[df['_keep']].copy()
-    result['sources'] = result['_sources']
-    result['multi_source'] = result['_sources'].str.contains(',')
+    df = df.reset_index(drop=True)
+    n = len(df)
+    combined, locs = _dedupe_keys(df)
+    sites = df['site'].astype(str).tolist() if 'site' in df else ['unknown'] * n
+    
+    if emb is None:
+        model, _ = _load_model()
+        emb = encode_cached(model, MODEL_NAME, combined, batch_size=64, show_progress_bar=False)
+    # Cached embeddings are unit length, so the dot product is the cosine
+    adjacent = emb @ emb.T >= 0.9
+    
+    # Connected components by union-find over the similar pairs (upper
+    # triangle only); a cluster's root is its lowest row index
+    parent = list(range(n))
+    
+    def find(i):
+        while parent[i] != i:
+            parent[i] = parent[parent[i]]
+            i = parent[i]
+        return i
+    
+    for i, j in np.argwhere(np.triu(adjacent, 1)).tolist():
+        ri, rj = find(i), find(j)
+        if ri != rj:
+            parent[max(ri, rj)] = min(ri, rj)
+    
+    clusters = {}
+    for i in range(n):
+        clusters.setdefault(find(i), []).append(i)
+    
+    keep, sources = [], []
+    for members in clusters.values():
+        # Prefer a posting that has a location
+        located = [m for m in members if locs[m] != 'null']
+        keep.append(located[0] if located else members[0])
+        sources.append(','.join(sorted({s for m in members for s in sites[m].split(',')})))
+    
+    result = df.loc[keep].copy()
+    result['sources'] = sources
+    result['multi_source'] = result['sources'].str.contains(',')
     result['dupe_count'] = 1
     
-    return result.drop(columns=['_keep', '_sources'])
+    return result
+
+
+def _add_scores(df: pd.DataFrame, cols: dict) -> pd.DataFrame:
+    df["ai_score"] = cols["score"]
+    df["ai_similarity"] = cols["similarity"]
+    df["is_ai"] = cols["is_ai"]
+    return df
+
+
+def _job_columns(df: pd.DataFrame) -> tuple[list, list]:
+    n = len(df)
+    titles = df["title"].fillna("").tolist() if "title" in df else [""] * n
+    descs = df["description"].fillna("").tolist() if "description" in df else [""] * n
+    return titles, descs
+
+
+def score_and_dedupe(df: pd.DataFrame) -> pd.DataFrame:
+    """Score and dedupe raw postings with a single encode over both text sets."""
+    if df.empty:
+        return pd.DataFrame()
+    
+    df = df.reset_index(drop=True)
+    combined, _ = _dedupe_keys(df)
+    titles, descs, idx, texts = _score_texts(*_job_columns(df))
+    
+    model, _ = _load_model()
+    emb = encode_cached(model, MODEL_NAME, combined + texts, batch_size=encode_batch_size(), show_progress_bar=False)
+    
+    df = _add_scores(df, _scores_from_embeddings(titles, descs, idx, emb[len(combined):]))
+    return dedupe(df, emb[:len(combined)])
+
 
 def scrape_ai_jobs(ticker: str, company_name: str, max_jobs: int = 100, hours_old: int = 240) -> pd.DataFrame:
     """Scrape jobs with Playwright fallback if JobSpy fails/returns 0.
@@ -165,7 +275,8 @@ def scrape_ai_jobs(ticker: str, company_name: str, max_jobs: int = 100, hours_ol
     if not all_jobs:
         df = pd.DataFrame()
     else:
-        df = dedupe(pd.concat(all_jobs, ignore_index=True))
+        # Scores are computed with the dedupe embeddings and carried through
+        df = score_and_dedupe(pd.concat(all_jobs, ignore_index=True))
         print(f"  [DEDUPE] After deduplication: {len(df)} unique jobs")  
 
     
@@ -181,11 +292,9 @@ def scrape_ai_jobs(ticker: str, company_name: str, max_jobs: int = 100, hours_ol
     if df.empty:
         return pd.DataFrame()
     
-    # Score all jobs
-    scores = df.apply(lambda r: score_job(r.get("title", ""), r.get("description", "")), axis=1)
-    df["ai_score"] = scores.apply(lambda x: x["score"])
-    df["ai_similarity"] = scores.apply(lambda x: x["similarity"])
-    df["is_ai"] = scores.apply(lambda x: x["is_ai"])
+    # Playwright fallback rows still need scoring
+    if "is_ai" not in df.columns:
+        df = _add_scores(df, _score_columns(*_job_columns(df)))
     
     # CRITICAL: Save total BEFORE filtering
     total_before_filter = len(df)
@@ -195,17 +304,7 @@ def scrape_ai_jobs(ticker: str, company_name: str, max_jobs: int = 100, hours_ol
     
     # Seniority (if not already present from Playwright)
     if "seniority_label" not in df.columns:
-        sen = get_seniority_keywords()
-        def get_seniority_label(title):
-            t = str(title).lower()
-            if any(k in t for k in sen.get("leadership", [])):
-                return "leadership"
-            if any(k in t for k in sen.get("senior", [])):
-                return "senior"
-            if any(k in t for k in sen.get("entry", [])):
-                return "entry"
-            return "mid"
-        df["seniority_label"] = df["title"].apply(get_seniority_label)
+        df["seniority_label"] = [classify_seniority(t) for t in df["title"]]
     
     # Filter to AI jobs only
     df_ai_only = df[df["is_ai"]].drop(columns=["is_ai"])
@@ -217,29 +316,34 @@ def scrape_ai_jobs(ticker: str, company_name: str, max_jobs: int = 100, hours_ol
 
 
 def prepare_for_snowflake(df: pd.DataFrame, company_id: str, ticker: str) -> list[dict]:
-    signals = []
-    for _, job in df.iterrows():
-        signals.append({
-            "id": str(uuid4()),
+    # NaN/NaT -> None once for the whole frame, then plain dict records
+    # (no per-row Series construction as with iterrows)
+    records = df.astype(object).where(df.notna(), None).to_dict("records")
+    collected_at = datetime.now()
+    
+    # No "id": the row key is generated by Snowflake on insert
+    return [
+        {
             "company_id": company_id,
             "category": "hiring_signal",
-            "source": str(job.get("sources", "unknown")).split(",")[0],
-            "score": float(job.get("ai_score", 0)),
-            "confidence": round(float(job.get("ai_similarity", 0)) * 0.8, 2),
+            "source": str(job.get("sources") or "unknown").split(",")[0],
+            "score": float(job.get("ai_score") or 0),
+            "confidence": round(float(job.get("ai_similarity") or 0) * 0.8, 2),
             "metadata": {
-                "title": str(job.get("title", "")),
-                "seniority_label": str(job.get("seniority_label", "mid")),
-                "multi_source": bool(job.get("multi_source", False)),
-                "location": str(job.get("location", "")) if pd.notna(job.get("location")) else "",
-                "is_remote": bool(job.get("is_remote", False)),
-                "date_posted": str(job["date_posted"]) if pd.notna(job.get("date_posted")) else None,
-                "salary_min": int(job["min_amount"]) if pd.notna(job.get("min_amount")) else None,
-                "salary_max": int(job["max_amount"]) if pd.notna(job.get("max_amount")) else None,
-                "job_url": str(job.get("job_url", "")) if pd.notna(job.get("job_url")) else "",
+                "title": str(job.get("title") or ""),
+                "seniority_label": str(job.get("seniority_label") or "mid"),
+                "multi_source": bool(job.get("multi_source") or False),
+                "location": str(job.get("location") or ""),
+                "is_remote": bool(job.get("is_remote") or False),
+                "date_posted": str(job["date_posted"]) if job.get("date_posted") is not None else None,
+                "salary_min": int(job["min_amount"]) if job.get("min_amount") is not None else None,
+                "salary_max": int(job["max_amount"]) if job.get("max_amount") is not None else None,
+                "job_url": str(job.get("job_url") or ""),
                 "is_ai_related": True, 
-                "ai_score": float(job.get("ai_score", 0))
+                "ai_score": float(job.get("ai_score") or 0)
             },
             "s3_full_data_key": None,
-            "collected_at": datetime.now()
-        })
-    return signals
\ No newline at end of file
+            "collected_at": collected_at
+        }
+        for job in records
+    ]
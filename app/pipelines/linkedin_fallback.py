@@ -11,7 +11,29 @@ import time
 import random
 from datetime import datetime, timedelta
 
-from app.core.keywords import get_seniority_keywords
+from app.core.keywords import classify_seniority
+
+
+# Extract every job card's fields in the browser (single page.evaluate call)
+_CARDS_JS = """
+() => Array.from(document.querySelectorAll('.base-card, .job-search-card')).map(card => {
+    const text = (sel) => {
+        const el = card.querySelector(sel);
+        return el ? el.innerText.trim() : '';
+    };
+    const time = card.querySelector('time');
+    const link = card.querySelector('a');
+    return {
+        title: text('.base-search-card__title, .job-search-card__title'),
+        company: text('.base-search-card__subtitle, .job-search-card__company'),
+        location: text('.job-search-card__location'),
+        hasTime: time !== null,
+        dateIso: time ? time.getAttribute('datetime') : null,
+        dateText: time ? time.innerText.trim() : '',
+        href: link ? (link.getAttribute('href') || '') : ''
+    };
+})
+"""
 
 
 def parse_relative_date(text: str) -> datetime:
@@ -49,8 +71,6 @@ def scrape_linkedin_fast(ticker: str, company_name: str) -> pd.DataFrame:
     # Get ALL job titles from config
     job_titles = get_all_job_titles()
     
-    seniority_kw = get_seniority_keywords()
-    
     # Company variations
     variations = [
         company_name,
@@ -77,25 +97,22 @@ def scrape_linkedin_fast(ticker: str, company_name: str) -> pd.DataFrame:
                     page.keyboard.press("End")
                     page.wait_for_timeout(800)
                 
-                cards = page.query_selector_all(".base-card, .job-search-card")
+                # One round trip per page instead of several IPC calls per card
+                cards = page.evaluate(_CARDS_JS)
                 
                 for card in cards:
                     try:
-                        title_el = card.query_selector(".base-search-card__title, .job-search-card__title")
-                        comp_el = card.query_selector(".base-search-card__subtitle, .job-search-card__company")
+                        title = card["title"]
+                        company = card["company"]
                         
-                        if not title_el or not comp_el:
+                        if not title or not company:
                             continue
                         
-                        title = title_el.inner_text().strip()
-                        company = comp_el.inner_text().strip()
-                        
                         # Verify company
                         if not any(v.lower() in company.lower() for v in variations):
                             continue
                         
-                        loc_el = card.query_selector(".job-search-card__location")
-                        location = loc_el.inner_text().strip() if loc_el else ""
+                        location = card["location"]
                         
                         # Fingerprint dedupe
                         fp = f"{title.lower()}|{location.lower()}"
@@ -105,10 +122,9 @@ def scrape_linkedin_fast(ticker: str, company_name: str) -> pd.DataFrame:
                         
                         # Date
                         date_posted = None
-                        time_el = card.query_selector("time")
-                        if time_el:
-                            date_iso = time_el.get_attribute("datetime")
-                            date_text = time_el.inner_text().strip()
+                        if card["hasTime"]:
+                            date_iso = card["dateIso"]
+                            date_text = card["dateText"]
                             if date_iso:
                                 try:
                                     date_posted = pd.to_datetime(date_iso)
@@ -118,19 +134,7 @@ def scrape_linkedin_fast(ticker: str, company_name: str) -> pd.DataFrame:
                                 date_posted = parse_relative_date(date_text)
                         
                         # URL
-                        link_el = card.query_selector("a")
-                        job_url = link_el.get_attribute("href").split('?')[0] if link_el else ""
-                        
-                        # Seniority
-                        t = title.lower()
-                        if any(k in t for k in seniority_kw.get("leadership", [])):
-                            seniority = "leadership"
-                        elif any(k in t for k in seniority_kw.get("senior", [])):
-                            seniority = "senior"
-                        elif any(k in t for k in seniority_kw.get("entry", [])):
-                            seniority = "entry"
-                        else:
-                            seniority = "mid"
+                        job_url = card["href"].split('?')[0]
                         
                         all_jobs.append({
                             "title": title,
@@ -146,7 +150,7 @@ def scrape_linkedin_fast(ticker: str, company_name: str) -> pd.DataFrame:
                             "is_remote": "remote" in location.lower(),
                             "min_amount": None,
                             "max_amount": None,
-                            "seniority_label": seniority
+                            "seniority_label": classify_seniority(title)
                         })
                     
                     except:
@@ -1,29 +1,60 @@
 """Patent scanner with transformer classification."""
 import asyncio
+import importlib.util
 import httpx
 import math
 import json
 from datetime import datetime
 from uuid import uuid4
 from collections import defaultdict
-from sentence_transformers import SentenceTransformer, util
+from app.pipelines.embedding_cache import encode_cached
+from app.pipelines.embedding_model import encode_batch_size, load_sentence_transformer
 
 from app.core.patent_config import (
-    get_ai_references, get_ai_cpc_codes,
-    get_similarity_threshold, get_scoring_config
+    get_ai_references, get_ai_cpc_bits,
+    get_similarity_threshold, get_prefilter_config, get_scoring_config
 )
 
+MODEL_NAME = 'all-mpnet-base-v2'
+
+# Seconds between PatentsView request starts (~45 requests/min limit)
+PATENTSVIEW_MIN_INTERVAL = 1.5
+
+# httpx needs the h2 package (httpx[http2]) to negotiate HTTP/2
+_HTTP2 = importlib.util.find_spec("h2") is not None
+
 _model = None
 _ref_emb = None
 
 def _load_model():
     global _model, _ref_emb
     if _model is None:
-        _model = SentenceTransformer('all-mpnet-base-v2')
-        _ref_emb = _model.encode(get_ai_references(), convert_to_tensor=True)
+        _model = load_sentence_transformer(MODEL_NAME)
+        _ref_emb = encode_cached(_model, MODEL_NAME, list(get_ai_references()))
     return _model, _ref_emb
 
 
+_fast_models = {}
+
+def _load_fast_model(name: str):
+    """Small prefilter model and its reference embeddings (loaded once)."""
+    if name not in _fast_models:
+        model = load_sentence_transformer(name)
+        _fast_models[name] = (model, encode_cached(model, name, list(get_ai_references())))
+    return _fast_models[name]
+
+
+def _cpc_mask(patent: dict, cpc_bits: dict) -> int:
+    """Bitmask of the AI CPC codes matching a patent's 4-char CPC prefixes."""
+    mask = 0
+    cpcs = patent.get('cpc_current')
+    if cpcs and isinstance(cpcs, list):
+        for c in cpcs:
+            if isinstance(c, dict):
+                mask |= cpc_bits.get(c.get('cpc_section_id', '')[:4], 0)
+    return mask
+
+
 class PatentScanner:
     
     def __init__(self, api_key: str):
@@ -32,7 +63,8 @@ class PatentScanner:
         self.headers = {"X-Api-Key": api_key, "Content-Type": "application/json"}
         self.threshold = get_similarity_threshold()
         self.scoring = get_scoring_config()
-        self.ai_cpc = get_ai_cpc_codes()
+        self.ai_cpc_bits = get_ai_cpc_bits()
+        self.ai_cpc_mask = sum(self.ai_cpc_bits.values())
     
     async def scan_company(self, company_name: str, company_id: str, ticker: str, year_from: int) -> dict:
         print(f"  Fetching patents for {company_name} (granted >= {year_from})...")
@@ -94,105 +126,130 @@ class PatentScanner:
             "collected_at": datetime.now()
         }
     
-    async def _fetch_patents(self, patent_names: list, year_from: int) -> list:
+    async def _fetch_patents(self, patent_names: list, year_from: int, max_concurrency: int = 4) -> list:
         if not patent_names:
             return []
         
-        all_patents = []
+        fields = ["patent_id", "patent_title", "patent_date", "application.filing_date", "patent_abstract", "cpc_current"]
+        sem = asyncio.Semaphore(max_concurrency)
+        # Space request starts PATENTSVIEW_MIN_INTERVAL apart
+        # across all names, so one name's round trip overlaps another's wait.
+        # Only the remainder of the interval is slept; a slow response has
+        # usually used it up already
+        pacing = asyncio.Lock()
+        loop = asyncio.get_running_loop()
+        last_start = -PATENTSVIEW_MIN_INTERVAL
+        
+        async def paced_post(client, body):
+            nonlocal last_start
+            async with pacing:
+                wait = last_start + PATENTSVIEW_MIN_INTERVAL - loop.time()
+                if wait > 0:
+                    await asyncio.sleep(wait)
+                last_start = loop.time()
+            return await client.post(f"{self.base_url}/patent/", json=body)
         
-        for name in patent_names:
+        async def fetch_one(client, name):
             query = {"_and": [{"_begins": {"assignees.assignee_organization": name}},{"_gte": {"patent_date": f"{year_from}-01-01"}}]}
-            fields = ["patent_id", "patent_title", "patent_date", "application.filing_date", "patent_abstract", "cpc_current"]
-            
+            patents = []
             after = None
-            async with httpx.AsyncClient(timeout=60.0, headers=self.headers) as client:
-                while len(all_patents) < 10000:
+            async with sem:
+                while len(patents) < 10000:
                     body = {"q": query, "f": fields, "o": {"size": 1000}}
                     if after:
                         body["o"]["after"] = after
                     
-                    print(f"    {len(all_patents)} fetched...", end="\r", flush=True)
-                    
-                    r = await client.post(f"{self.base_url}/patent/", json=body)
+                    r = await paced_post(client, body)
                     if r.status_code != 200:
                         break
                     
-                    data = r.json()
-                    batch = data.get("patents", [])
+                    batch = r.json().get("patents", [])
                     if not batch:
                         break
                     
-                    all_patents.extend(batch)
+                    # Parse CPC codes once, while the page is fresh
+                    for p in batch:
+                        p['_cpc_mask'] = _cpc_mask(p, self.ai_cpc_bits)
+                    patents.extend(batch)
+                    print(f"    {name}: {len(patents)} fetched...", end="\r", flush=True)
                     if len(batch) < 1000:
                         break
                     
                     after = batch[-1]["patent_id"]
-                    await asyncio.sleep(1.5)
+            return patents
+        
+        # One client (and connection pool) shared by every name and page;
+        # HTTP/2 multiplexes concurrent names over a single TLS connection
+        limits = httpx.Limits(max_keepalive_connections=8, max_connections=16, keepalive_expiry=60)
+        async with httpx.AsyncClient(timeout=60.0, headers=self.headers,
+                                     http2=_HTTP2, limits=limits) as client:
+            results = await asyncio.gather(*(fetch_one(client, name) for name in patent_names))
+        
+        # Name prefixes can overlap; keep each patent once
+        all_patents = list({p["patent_id"]: p for batch in results for p in batch}.values())[:10000]
         
         print(f"\n    Total: {len(all_patents)} patents")
         return all_patents
     
     def _classify_patents(self, patents: list) -> list:
-        """Classify in parallel batches (this is the slow part)."""
-        from concurrent.futures import ThreadPoolExecutor
-        import numpy as np
+        """Classify patents with batched encodes (this is the slow part)."""
+        if not patents:
+            return []
         
-        model, ref_emb = _load_model()
         ai_patents = []
+        texts = [f"{p.get('patent_title', '')}. {p.get('patent_abstract', '')}" for p in patents]
         
-        batch_size = 100
-        batches = [patents[i:i + batch_size] for i in range(0, len(patents), batch_size)]
+        has_ai_cpc = [
+            bool((p['_cpc_mask'] if '_cpc_mask' in p else _cpc_mask(p, self.ai_cpc_bits)) & self.ai_cpc_mask)
+            for p in patents
+        ]
+        
+        # Stage 1: small model drops clearly non-AI patents before mpnet
+        shortlist = range(len(patents))
+        prefilter = get_prefilter_config()
+        if prefilter:
+            fast_model, fast_ref = _load_fast_model(prefilter['model'])
+            fast_emb = encode_cached(fast_model, prefilter['model'], texts,
+                                     batch_size=encode_batch_size(), show_progress_bar=False)
+            fast_sims = (fast_emb @ fast_ref.T).max(axis=1)
+            cutoff = self.threshold - prefilter.get('margin', 0.05)
+            shortlist = [i for i, sim in enumerate(fast_sims) if sim >= cutoff or has_ai_cpc[i]]
+            print(f"    Prefilter: {len(shortlist)}/{len(patents)} patents to re-score")
+            if not shortlist:
+                return []
+        
+        # Stage 2: mpnet scores the shortlist. A single encode() call
+        # length-sorts texts into homogeneous batches; patents already seen
+        # on earlier runs come from the disk cache
+        model, ref_emb = _load_model()
+        text_embeddings = encode_cached(model, MODEL_NAME, [texts[i] for i in shortlist],
+                                        batch_size=encode_batch_size(), show_progress_bar=False)
+        max_sims = (text_embeddings @ ref_emb.T).max(axis=1).tolist()  # unit vectors: dot = cosine
         
-        def classify_batch(batch):
-            """Classify one batch."""
-            texts = [f"{p.get('patent_title', '')}. {p.get('patent_abstract', '')}" for p in batch]
-            text_embeddings = model.encode(texts, convert_to_tensor=True, show_progress_bar=False)
-            similarities = util.cos_sim(text_embeddings, ref_emb)
-            max_sims = similarities.max(dim=1).values
+        for i, sim in zip(shortlist, max_sims):
+            patent = patents[i]
+            is_ai = sim >= self.threshold or has_ai_cpc[i]
             
-            batch_ai = []
-            for j, sim in enumerate(max_sims):
-                patent = batch[j]
+            if is_ai:
+                grant_date = patent.get('patent_date', '')
+                filing_date = None
                 
-                has_ai_cpc = False
-                if patent.get('cpc_current'):
-                    cpcs = patent['cpc_current']
-                    if isinstance(cpcs, list):
-                        patent_cpcs = set(c.get('cpc_section_id', '')[:4] for c in cpcs if isinstance(c, dict))
-                        has_ai_cpc = bool(patent_cpcs & self.ai_cpc)
+                if patent.get('application'):
+                    app = patent['application']
+                    if isinstance(app, list) and app:
+                        filing_date = app[0].get('filing_date')
+                    elif isinstance(app, dict):
+                        filing_date = app.get('filing_date')
                 
-                is_ai = sim >= self.threshold or has_ai_cpc
-                
-                if is_ai:
-                    grant_date = patent.get('patent_date', '')
-                    filing_date = None
-                    
-                    if patent.get('application'):
-                        app = patent['application']
-                        if isinstance(app, list) and app:
-                            filing_date = app[0].get('filing_date')
-                        elif isinstance(app, dict):
-                            filing_date = app.get('filing_date')
-                    
-                    batch_ai.append({
-                        'patent_id': patent.get('patent_id', ''),
-                        'title': patent.get('patent_title', ''),
-                        'grant_date': grant_date,
-                        'filing_date': filing_date or grant_date,
-                        'ai_score': float(sim),
-                        'has_ai_cpc': has_ai_cpc,
-                        'abstract': patent.get('patent_abstract', '')
-                    })
-            
-            return batch_ai
-        
-        # Process batches in parallel
-        with ThreadPoolExecutor(max_workers=4) as executor:
-            results = list(executor.map(classify_batch, batches))
-        
-        # Flatten results
-        for batch_result in results:
-            ai_patents.extend(batch_result)
+                ai_patents.append({
+                    'patent_id': patent.get('patent_id', ''),
+                    'title': patent.get('patent_title', ''),
+                    'grant_date': grant_date,
+                    'filing_date': filing_date or grant_date,
+                    'ai_score': float(sim),
+                    'has_ai_cpc': has_ai_cpc[i],
+                    'abstract': patent.get('patent_abstract', '')
+                })
         
         return ai_patents
     
@@ -1,17 +1,30 @@
 import re
+import string
+import hashlib
 import logging
+from itertools import chain
 from pathlib import Path
-from dataclasses import dataclass, asdict
+from dataclasses import dataclass, asdict, replace
 from .sec_parser import SECParser, Block, ITEM_TITLES_8K, ITEM_TITLES_10Q
 
+# Near-duplicate detection (falls back to exact prefix hashes without it)
+try:
+    from datasketch import MinHash, MinHashLSH
+    MINHASH_AVAILABLE = True
+except ImportError:
+    MINHASH_AVAILABLE = False
+
 logger = logging.getLogger(__name__)
 
-# Comprehensive ITEM patterns for all SEC form types
+# Comprehensive ITEM patterns for all SEC form types. The item number must
+# be followed by a non-digit, so digit runs (table cells, "Item 2024...")
+# fail at once instead of matching a prefix of the number
 ITEM_PATTERNS = {
-    "10-K": r'^(?:ITEM|Item)\s*(\d{1,2}[A-Da-d]?)\.?\s*[-–—.]?\s*(.*)$',
-    "10-Q": r'^(?:ITEM|Item)\s*(\d{1,2}[A-Da-d]?)\.?\s*[-–—.]?\s*(.*)$',
-    "8-K":  r'^(?:ITEM|Item)\s*(\d+\.?\d*)\.?\s*[-–—.]?\s*(.*)$',
+    "10-K": r'^(?:ITEM|Item)\s+(?P<item_num>\d{1,2}[A-Da-d]?)(?!\d)\.?\s*[-–—.]?\s*(?P<item_title>.*)$',
+    "10-Q": r'^(?:ITEM|Item)\s+(?P<item_num>\d{1,2}[A-Da-d]?)(?!\d)\.?\s*[-–—.]?\s*(?P<item_title>.*)$',
+    "8-K":  r'^(?:ITEM|Item)\s+(?P<item_num>\d+(?:\.\d+)?)(?!\d)\.?\s*[-–—.]?\s*(?P<item_title>.*)$',
 }
+ITEM_PATTERNS_COMPILED = {form: re.compile(p) for form, p in ITEM_PATTERNS.items()}
 
 # Standard 10-K Item titles 
 ITEM_TITLES_10K = {
@@ -66,21 +79,61 @@ FORM_CONFIGS = {
     },
 }
 
-# Boilerplate patterns to filter out
+# Literal boilerplate, matched on lowercased whitespace-collapsed text
+BOILERPLATE_EXACT = frozenset({
+    *(f"table{a}of{b}content{s}" for a in ("", " ") for b in ("", " ") for s in ("", "s")),
+    'signature', 'signatures',
+    'exhibit index',
+    'none', 'none.',
+    'na', 'na.', 'n/a', 'n/a.',
+})
+_BOILERPLATE_EXACT_MAXLEN = max(map(len, BOILERPLATE_EXACT))
+
+# Boilerplate that needs a pattern
 BOILERPLATE_PATTERNS = [
-    r'^table\s*of\s*contents?$',
-    r'^signatures?$',
     r'^page\s*\d+$',
     r'^\d+$',  # Just page numbers
     r'^part\s+[ivx]+$',
-    r'^exhibit\s+index$',
-    r'^None\.?$',
-    r'^N/?A\.?$',
 ]
-BOILERPLATE_RE = re.compile('|'.join(BOILERPLATE_PATTERNS), re.IGNORECASE)
 
 
-@dataclass
+def _compile_block_re(form_type: str) -> re.Pattern:
+    """Boilerplate and ITEM header patterns as one alternation.
+    
+    A single match() per block classifies it; dispatch on lastgroup
+    ('boiler' or 'item'). Only the boilerplate branch is case-insensitive.
+    """
+    item = ITEM_PATTERNS.get(form_type, ITEM_PATTERNS["10-K"])
+    return re.compile(f"(?P<boiler>(?i:{'|'.join(BOILERPLATE_PATTERNS)}))|(?P<item>{item})")
+
+
+_BLOCK_RES = {form: _compile_block_re(form) for form in ITEM_PATTERNS}
+
+
+def _may_match_block_re(text: str) -> bool:
+    """Cheap pre-check for the block regex: every alternative starts with
+    'page'/'part' (any case), a digit, or ITEM/Item. Keep in sync with
+    BOILERPLATE_PATTERNS and ITEM_PATTERNS."""
+    first = text[:1]
+    return first in ('p', 'P', 'I') or first.isdecimal()
+
+
+# Hot-loop patterns, compiled once
+_SENT_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+_TOKEN_RE = re.compile(r'[a-z0-9]+')
+# ASCII fast path for _TOKEN_RE: every other character becomes a space
+_TOKEN_SEP_TABLE = str.maketrans({
+    c: c if chr(c) in string.ascii_lowercase + string.digits else ' ' for c in range(128)
+})
+
+# Content dedup: blocks whose word 5-gram Jaccard similarity is >= 0.85
+# are treated as duplicates
+DEDUP_THRESHOLD = 0.85
+DEDUP_NUM_PERM = 64
+SHINGLE_SIZE = 5
+
+
+@dataclass(slots=True)
 class Chunk:
     """A RAG-ready chunk with metadata."""
     id: str
@@ -99,7 +152,7 @@ class Chunk:
         return asdict(self)
 
 
-@dataclass
+@dataclass(slots=True)
 class Section:
     """A document section containing blocks."""
     id: str
@@ -115,18 +168,13 @@ class SECChunker:
     
     def _get_item_title(self, item_num: str) -> str:
         """Get the standard title for an item number.
-        Handles 10-Q nested Part I/II structure.
+        Handles 10-Q nested Part I/II structure: the current part wins,
+        then any part (precomputed in _apply_form_config).
         """
-        if self.form_type == "10-Q":
-            # Try current part first, then fallback to other part
-            title = self.item_titles.get(self._current_10q_part, {}).get(item_num, "")
-            if not title:
-                # Try the other part
-                other_part = "II" if self._current_10q_part == "I" else "I"
-                title = self.item_titles.get(other_part, {}).get(item_num, "")
-            return title
-        else:
+        if self._part_titles is None:
             return self.item_titles.get(item_num, "")
+        return (self._part_titles.get(self._current_10q_part, {}).get(item_num)
+                or self._any_part_titles.get(item_num, ""))
     
     def __init__(
         self, 
@@ -141,8 +189,9 @@ class SECChunker:
         self._current_10q_part = "I"  # Track Part I/II for 10-Q
         self._apply_form_config(target_chunk_size, min_chunk_size, max_chunk_size, overlap_size)
         self.min_table_words = min_table_words
-        self.pattern = re.compile(ITEM_PATTERNS.get(self.form_type, ITEM_PATTERNS["10-K"]))
-        self._seen_content = set()
+        self.pattern = ITEM_PATTERNS_COMPILED.get(self.form_type, ITEM_PATTERNS_COMPILED["10-K"])
+        self.block_re = _BLOCK_RES.get(self.form_type, _BLOCK_RES["10-K"])
+        self._seen_content = self._new_seen_index()
         self.stats = {
             'sections': 0, 
             'chunks': 0, 
@@ -161,6 +210,12 @@ class SECChunker:
         self.max_chunk_size = max_size or config["max_chunk_size"]
         self.overlap_size = overlap or config["overlap_size"]
         self.item_titles = config.get("item_titles", ITEM_TITLES_10K)
+        # 10-Q titles are nested by part; merge them once for the fallback
+        if self.form_type == "10-Q":
+            self._part_titles = self.item_titles
+            self._any_part_titles = {k: v for part in self.item_titles.values() for k, v in part.items()}
+        else:
+            self._part_titles = self._any_part_titles = None
         logger.debug("Applied %s config: target=%d, min=%d, max=%d, overlap=%d",
                     self.form_type, self.target_chunk_size, self.min_chunk_size,
                     self.max_chunk_size, self.overlap_size)
@@ -168,25 +223,27 @@ class SECChunker:
     def process(self, blocks: list[Block], form_type: str = None, accession: str = None, 
                 ticker: str = "UNKNOWN", year: str = "2025") -> list[Chunk]:
         """Chunk parsed blocks into RAG-ready segments."""
-        self._seen_content = set()
+        # Reset per-document state in place (MinHashLSH has no clear())
+        if isinstance(self._seen_content, set):
+            self._seen_content.clear()
+        else:
+            self._seen_content = self._new_seen_index()
         self._current_10q_part = "I"  # Reset for each process
-        self.stats = {
-            'sections': 0, 
-            'chunks': 0, 
-            'tables': 0, 
-            'trivial_skipped': 0,
-            'boilerplate_skipped': 0,
-            'merged_undersized': 0,
-            'content_deduped': 0
-        }
+        self.stats.update(dict.fromkeys(self.stats, 0))
         
         if form_type:
             self.form_type = form_type.upper()
             self._apply_form_config()
-            self.pattern = re.compile(ITEM_PATTERNS.get(self.form_type, ITEM_PATTERNS["10-K"]))
+            self.pattern = ITEM_PATTERNS_COMPILED.get(self.form_type, ITEM_PATTERNS_COMPILED["10-K"])
+            self.block_re = _BLOCK_RES.get(self.form_type, _BLOCK_RES["10-K"])
         
         logger.debug("Processing %d blocks for %s %s (%s)", len(blocks), ticker, form_type, self.form_type)
         
+        # Strip and count words once; every pass below reuses these
+        for block in blocks:
+            block._stripped = block.text.strip()
+            block._wc = len(block._stripped.split())
+        
         # Filter boilerplate blocks first
         filtered_blocks = self._filter_boilerplate(blocks)
         logger.debug("After boilerplate filter: %d blocks (filtered %d)", 
@@ -196,11 +253,9 @@ class SECChunker:
         sections = self._extract_sections(filtered_blocks)
         self.stats['sections'] = len(sections)
         
-        chunks = []
-        for section in sections:
-            section_chunks = self._chunk_section(section, ticker, year, accession)
-            chunks.extend(section_chunks)
-            logger.debug("Section '%s': %d chunks", section.id, len(section_chunks))
+        chunks = list(chain.from_iterable(
+            self._chunk_section(section, ticker, year, accession) for section in sections
+        ))
         
         # Merge undersized chunks
         chunks = self._merge_undersized_chunks(chunks)
@@ -218,57 +273,91 @@ class SECChunker:
         
         return chunks
     
-    def _get_item_title(self, item_num: str) -> str:
-        """Get standard title for item number."""
-        if self.form_type == "10-Q":
-            title = self.item_titles.get(self._current_10q_part, {}).get(item_num, "")
-            if not title:
-                other_part = "II" if self._current_10q_part == "I" else "I"
-                title = self.item_titles.get(other_part, {}).get(item_num, "")
-            return title
-        else:
-            return self.item_titles.get(item_num, "")
-    
     def _filter_boilerplate(self, blocks: list[Block]) -> list[Block]:
         """Filter out boilerplate content blocks and deduplicate similar content."""
         filtered = []
         for block in blocks:
-            text = block.text.strip()
-            if BOILERPLATE_RE.match(text):
+            text = block._stripped
+            # Hash lookup first; only short blocks can be literal boilerplate
+            if len(text) <= _BOILERPLATE_EXACT_MAXLEN and ' '.join(text.lower().split()) in BOILERPLATE_EXACT:
+                match = None
+                is_boilerplate = True
+            else:
+                # Most blocks are prose and fail the first-character check
+                match = self.block_re.match(text) if _may_match_block_re(text) else None
+                is_boilerplate = match is not None and match.lastgroup == 'boiler'
+            if is_boilerplate:
                 self.stats['boilerplate_skipped'] += 1
                 logger.debug("Filtered boilerplate: '%s...'", text[:50])
                 continue
             # Skip very short non-table blocks (likely headers/fragments)
-            if not block.is_table and len(text.split()) < 5:
+            if not block.is_table and block._wc < 5:
                 self.stats['boilerplate_skipped'] += 1
                 continue
             
             # Content-based deduplication
             fingerprint = self._get_content_fingerprint(text)
-            if fingerprint in self._seen_content:
+            if fingerprint is not None and self._seen_before(fingerprint, key=str(len(filtered))):
                 self.stats['content_deduped'] += 1
                 logger.debug("Deduped content block: '%s...'", text[:50])
                 continue
-            if len(fingerprint) > 20:  # Only track substantial content
-                self._seen_content.add(fingerprint)
             
+            # Reused by _extract_sections instead of a second regex pass
+            block._item_match = match
             filtered.append(block)
         return filtered
     
-    def _get_content_fingerprint(self, text: str) -> str:
+    @staticmethod
+    def _new_seen_index():
+        """Index of content fingerprints seen so far in this document."""
+        if MINHASH_AVAILABLE:
+            return MinHashLSH(threshold=DEDUP_THRESHOLD, num_perm=DEDUP_NUM_PERM)
+        return set()
+    
+    def _get_content_fingerprint(self, text: str):
         """Get a normalized fingerprint of content for deduplication.
         
-        Strips table formatting, normalizes whitespace, and lowercases
-        to catch near-duplicate content.
+        Strips table formatting and punctuation and lowercases. Returns a
+        MinHash over word 5-gram shingles when datasketch is installed
+        (catches near-duplicates that differ anywhere in the text), else a
+        64-bit hash of the first 200 normalized chars (blocks sharing an
+        opening are treated as duplicates). Returns None for content too
+        short to be worth tracking.
         """
         # For tables, strip markdown formatting
         if '|' in text:
             text = self.TABLE_DATA_RE.sub(' ', text)
-        # Normalize: lowercase, single spaces, strip punctuation
-        text = re.sub(r'[^a-z0-9\s]', '', text.lower())
-        text = ' '.join(text.split())
-        # Return first 200 chars as fingerprint (enough to identify unique content)
-        return text[:200]
+        text = text.lower()
+        # translate is a C table lookup per char, but only stays on its fast
+        # path for pure-ASCII strings
+        tokens = text.translate(_TOKEN_SEP_TABLE).split() if text.isascii() else _TOKEN_RE.findall(text)
+        normalized = ' '.join(tokens)
+        if len(normalized) <= 20:  # Only track substantial content
+            return None
+        
+        if not MINHASH_AVAILABLE:
+            # 64-bit int: the seen set holds and compares machine-word keys
+            digest = hashlib.blake2b(normalized[:200].encode(), digest_size=8).digest()
+            return int.from_bytes(digest, 'little')
+        
+        mh = MinHash(num_perm=DEDUP_NUM_PERM)
+        mh.update_batch([
+            ' '.join(tokens[i:i + SHINGLE_SIZE]).encode()
+            for i in range(max(1, len(tokens) - SHINGLE_SIZE + 1))
+        ])
+        return mh
+    
+    def _seen_before(self, fingerprint, key: str) -> bool:
+        """Check fingerprint against the seen index; record it if new."""
+        if MINHASH_AVAILABLE:
+            if self._seen_content.query(fingerprint):
+                return True
+            self._seen_content.insert(key, fingerprint)
+            return False
+        if fingerprint in self._seen_content:
+            return True
+        self._seen_content.add(fingerprint)
+        return False
     
     def _extract_sections(self, blocks: list[Block]) -> list[Section]:
         """Group blocks into sections by ITEM headers.
@@ -280,12 +369,13 @@ class SECChunker:
         preamble_blocks = []  # Blocks before first ITEM
         
         for block in blocks:
-            text = block.text.strip()
+            text = block._stripped
             
             # Check for section_hint first (from parser's form-specific detection)
             is_header = False
             item_num = ""
             title_text = ""
+            title_is_standard = False
             
             if hasattr(block, 'section_hint') and block.section_hint:
                 # Parse hint like "item:1A" or "part:I"
@@ -297,16 +387,20 @@ class SECChunker:
                         self._current_10q_part = item_num  # "I" or "II"
                         continue  # Part headers don't create sections
                     is_header = header_type == "item"
-                    # Get title using helper method
-                    title_text = self._get_item_title(item_num)
+                    if is_header:
+                        title_text = self._get_item_title(item_num)
+                        title_is_standard = True
             
             # Fallback to regex matching
             if not is_header:
-                match = self.pattern.match(text)
-                if match and block.type in ['header', 'text', 'item_header']:
+                if block._item_match is not None:
+                    match = block._item_match
+                else:
+                    match = self.pattern.match(text) if text[:4] in ('ITEM', 'Item') else None
+                if match and match.group('item_num') and block.type in ['header', 'text', 'item_header']:
                     is_header = True
-                    item_num = match.group(1).upper()
-                    title_text = match.group(2).strip() if match.group(2) else ""
+                    item_num = match.group('item_num').upper()
+                    title_text = match.group('item_title').strip() if match.group('item_title') else ""
             
             if is_header:
                 # Save previous section
@@ -322,7 +416,7 @@ class SECChunker:
                     preamble_blocks = []
                 
                 # Use standard title if available and parsed title is short
-                if len(title_text) < 10:
+                if len(title_text) < 10 and not title_is_standard:
                     std_title = self._get_item_title(item_num)
                     if std_title:
                         title_text = std_title
@@ -363,15 +457,18 @@ class SECChunker:
                 return
             
             content = ' '.join(buffer)
+            word_count = buf_words
             
             # Prepend overlap from previous chunk (except for first chunk)
             if add_overlap and last_overlap and chunks:
                 content = last_overlap + " " + content
+                word_count += self.overlap_size
             
-            # Store overlap for next chunk (last N words)
-            words_list = content.split()
-            if len(words_list) > self.overlap_size:
-                last_overlap = ' '.join(words_list[-self.overlap_size:])
+            # Store overlap for next chunk (last N words); rsplit only
+            # tokenizes the tail instead of the whole chunk
+            tail = content.rsplit(None, self.overlap_size)
+            if len(tail) > self.overlap_size:
+                last_overlap = ' '.join(tail[1:])
             else:
                 last_overlap = ""
             
@@ -386,12 +483,12 @@ class SECChunker:
                 section_title=section.title,
                 page=buf_page,
                 has_table=buf_table,
-                word_count=len(content.split())
+                word_count=word_count
             ))
             buffer, buf_words, buf_table = [], 0, False
         
         for block in section.blocks:
-            words = len(block.text.split())
+            words = block._wc
             
             # Skip trivial tables
             if block.is_table and words < self.min_table_words:
@@ -415,7 +512,7 @@ class SECChunker:
                     buf_page = block.page
                 
                 # Split block by sentences if too large
-                for sent in re.split(r'(?<=[.!?])\s+', block.text):
+                for sent in _SENT_SPLIT_RE.split(block.text):
                     sw = len(sent.split())
                     if buf_words + sw > self.max_chunk_size:
                         flush()
@@ -430,6 +527,7 @@ class SECChunker:
         
         # Flush remaining buffer
         flush()
+        logger.debug("Section '%s': %d chunks", section.id, len(chunks))
         return chunks
     
     def _merge_undersized_chunks(self, chunks: list[Chunk]) -> list[Chunk]:
@@ -448,21 +546,15 @@ class SECChunker:
                 # Try to merge with next chunk in same section
                 if i + 1 < len(chunks) and chunks[i + 1].section_id == chunk.section_id:
                     next_chunk = chunks[i + 1]
-                    merged_content = chunk.content + " " + next_chunk.content
-                    merged_words = len(merged_content.split())
+                    # Joining with a space neither splits nor fuses words,
+                    # so the counts simply add
+                    merged_words = chunk.word_count + next_chunk.word_count
                     
                     # Only merge if result isn't too large
                     if merged_words <= self.max_chunk_size:
-                        merged_chunk = Chunk(
-                            id=chunk.id,  # Keep first chunk's ID
-                            content=merged_content,
-                            ticker=chunk.ticker,
-                            form_type=chunk.form_type,
-                            year=chunk.year,
-                            accession_number=chunk.accession_number,
-                            section_id=chunk.section_id,
-                            section_title=chunk.section_title,
-                            page=chunk.page,
+                        merged_chunk = replace(  # Keeps first chunk's ID and metadata
+                            chunk,
+                            content=chunk.content + " " + next_chunk.content,
                             has_table=chunk.has_table or next_chunk.has_table,
                             word_count=merged_words
                         )
@@ -478,20 +570,12 @@ class SECChunker:
                 # Try to merge with previous chunk in same section
                 if merged and merged[-1].section_id == chunk.section_id and not merged[-1].has_table:
                     prev_chunk = merged[-1]
-                    merged_content = prev_chunk.content + " " + chunk.content
-                    merged_words = len(merged_content.split())
+                    merged_words = prev_chunk.word_count + chunk.word_count
                     
                     if merged_words <= self.max_chunk_size:
-                        merged[-1] = Chunk(
-                            id=prev_chunk.id,
-                            content=merged_content,
-                            ticker=prev_chunk.ticker,
-                            form_type=prev_chunk.form_type,
-                            year=prev_chunk.year,
-                            accession_number=prev_chunk.accession_number,
-                            section_id=prev_chunk.section_id,
-                            section_title=prev_chunk.section_title,
-                            page=prev_chunk.page,
+                        merged[-1] = replace(
+                            prev_chunk,
+                            content=prev_chunk.content + " " + chunk.content,
                             has_table=prev_chunk.has_table or chunk.has_table,
                             word_count=merged_words
                         )
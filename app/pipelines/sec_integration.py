@@ -2,12 +2,13 @@
 import logging
 import json
 import hashlib
+from concurrent.futures import ThreadPoolExecutor, as_completed
 from pathlib import Path
 from uuid import uuid4
 from datetime import datetime, timezone
 
 import boto3
-from botocore.exceptions import ClientError
+from botocore.config import Config
 from sec_edgar_downloader import Downloader
 
 from app.pipelines.sec_parser import SECParser
@@ -20,11 +21,12 @@ logger = logging.getLogger(__name__)
 
 class SECIntegration:
     
-    def __init__(self, snowflake_conn, s3_bucket: str, email: str):
+    def __init__(self, snowflake_conn, s3_bucket: str, email: str, max_workers: int = 8):
         self.storage = EvidenceStorage(snowflake_conn)
-        self.parser = SECParser()
-        self.chunker = SECChunker()
-        self.s3 = boto3.client('s3')
+        # Filings are processed on worker threads; boto3 clients are
+        # thread-safe but need enough pooled connections to go around
+        self.max_workers = max_workers
+        self.s3 = boto3.client('s3', config=Config(max_pool_connections=32))
         self.bucket = s3_bucket
         self.downloader = Downloader("PE-OrgAIR", email, Path("data/temp"))
         
@@ -57,38 +59,60 @@ class SECIntegration:
                 
                 files = list(filing_dir.glob("**/full-submission.txt"))
                 logger.info(f"Found {len(files)} filings")
+                if not files:
+                    continue
+                
+                # One batched lookup each for Snowflake and S3 instead of a
+                # round trip per filing
+                stored = self._stored_accessions([fp.parts[-2] for fp in files])
+                s3_keys = self._list_s3_keys(f"sec/{ticker}/{filing_type}/")
                 
-                for idx, file_path in enumerate(files, 1):
-                    accession = file_path.parts[-2]
-                    logger.info(f"[{idx}/{len(files)}] {accession}")
+                # Per-filing work is network-bound (S3, Snowflake): overlap it
+                with ThreadPoolExecutor(max_workers=min(self.max_workers, len(files))) as executor:
+                    futures = {
+                        executor.submit(
+                            self._process_filing, file_path, company_id, ticker, filing_type,
+                            file_path.parts[-2], stored, s3_keys
+                        ): file_path
+                        for file_path in files
+                    }
                     
-                    try:
-                        result = self._process_filing(file_path, company_id, ticker, filing_type, accession)
-                        
-                        if result['source'] == 'skipped':
-                            stats['skipped_db'] += 1
-                        elif result['source'] == 's3':
-                            stats['from_s3'] += 1
-                            stats['documents'] += 1
-                            stats['chunks'] += result['chunks']
-                        else:
-                            stats['from_sec'] += 1
-                            stats['documents'] += 1
-                            stats['chunks'] += result['chunks']
+                    for idx, future in enumerate(as_completed(futures), 1):
+                        file_path = futures[future]
+                        accession = file_path.parts[-2]
                         
-                        logger.info(f"  {result['source']}: {result['chunks']} chunks")
-                        
-                    except Exception as e:
-                        logger.error(f"  Error: {e}")
-                        stats['errors'] += 1
-                    finally:
-                        if file_path.exists():
-                            file_path.unlink()
+                        try:
+                            result = future.result()
+                            
+                            if result['source'] == 'skipped':
+                                stats['skipped_db'] += 1
+                            elif result['source'] == 's3':
+                                stats['from_s3'] += 1
+                                stats['documents'] += 1
+                                stats['chunks'] += result['chunks']
+                            else:
+                                stats['from_sec'] += 1
+                                stats['documents'] += 1
+                                stats['chunks'] += result['chunks']
+                            
+                            logger.info(f"[{idx}/{len(files)}] {accession} {result['source']}: {result['chunks']} chunks")
+                            
+                        except Exception as e:
+                            logger.error(f"[{idx}/{len(files)}] {accession} Error: {e}")
+                            stats['errors'] += 1
+                        finally:
+                            if file_path.exists():
+                                file_path.unlink()
                 
             except Exception as e:
                 logger.error(f"Failed {filing_type}: {e}")
                 stats['errors'] += 1
         
+        # Once per company, after all filings: concurrent per-filing updates
+        # would race on the summary row
+        if stats['documents']:
+            self.storage._update_company_summary(company_id, ticker)
+        
         self._cleanup_temp_dir()
         return stats
     
@@ -98,56 +122,72 @@ class SECIntegration:
         company_id: str,
         ticker: str,
         filing_type: str,
-        accession: str
+        accession: str,
+        stored: set,
+        s3_keys: set
     ) -> dict:
         
-        if self._in_snowflake(accession):
+        if accession in stored:
             return {'source': 'skipped', 'chunks': 0}
         
         s3_key = f"sec/{ticker}/{filing_type}/{accession}.txt"
         
-        if self._in_s3(s3_key):
+        if s3_key in s3_keys:
             logger.debug("  Retrieving from S3")
             content = self._download_from_s3(s3_key)
             source = 's3'
         else:
             logger.debug("  Reading local, uploading to S3")
-            content = file_path.read_text(encoding='utf-8', errors='ignore')
-            self._upload_to_s3(content, s3_key)
+            # Upload the file bytes as-is; decode once, for the parser only
+            raw = file_path.read_bytes()
+            self._upload_to_s3(raw, s3_key)
+            content = raw.decode('utf-8', errors='ignore')
+            del raw
             source = 'sec'
         
+        # Parser and chunker keep per-document state: one each per filing
         logger.debug("  Parsing")
-        blocks = self.parser.parse(content, form_type=filing_type)
+        blocks = SECParser(form_type=filing_type).parse(content, form_type=filing_type)
+        del content
         
         logger.debug("  Chunking")
-        chunks = self.chunker.process(blocks, filing_type, accession, ticker, year="2024")
+        chunks = SECChunker(filing_type).process(blocks, filing_type, accession, ticker, year="2024")
         
         logger.debug("  Storing")
         self._store_to_snowflake(chunks, company_id, ticker, filing_type, accession, s3_key)
         
         return {'source': source, 'chunks': len(chunks)}
     
-    def _in_snowflake(self, accession: str) -> bool:
+    def _stored_accessions(self, accessions: list) -> set:
+        """Accession numbers already in evidence_documents."""
+        if not accessions:
+            return set()
         cursor = self.storage.conn.cursor()
-        cursor.execute("SELECT COUNT(*) FROM evidence_documents WHERE accession_number = %s", (accession,))
-        return cursor.fetchone()[0] > 0
+        cursor.execute(
+            f"SELECT accession_number FROM evidence_documents "
+            f"WHERE accession_number IN ({', '.join(['%s'] * len(accessions))})",
+            accessions
+        )
+        return {row[0] for row in cursor.fetchall()}
     
-    def _in_s3(self, s3_key: str) -> bool:
-        try:
-            self.s3.head_object(Bucket=self.bucket, Key=s3_key)
-            return True
-        except ClientError:
-            return False
+    def _list_s3_keys(self, prefix: str) -> set:
+        """All object keys under prefix."""
+        paginator = self.s3.get_paginator('list_objects_v2')
+        return {
+            obj['Key']
+            for page in paginator.paginate(Bucket=self.bucket, Prefix=prefix)
+            for obj in page.get('Contents', [])
+        }
     
     def _download_from_s3(self, s3_key: str) -> str:
         response = self.s3.get_object(Bucket=self.bucket, Key=s3_key)
-        return response['Body'].read().decode('utf-8')
+        return response['Body'].read().decode('utf-8', errors='ignore')
     
-    def _upload_to_s3(self, content: str, s3_key: str):
+    def _upload_to_s3(self, body: bytes, s3_key: str):
         self.s3.put_object(
             Bucket=self.bucket,
             Key=s3_key,
-            Body=content.encode('utf-8'),
+            Body=body,
             ContentType='text/plain'
         )
     
@@ -172,11 +212,47 @@ class SECIntegration:
         total_words = sum(c.word_count for c in chunks)
         section_count = len(sections_summary)
         table_count = sum(1 for c in chunks if c.has_table)
-        content_hash = hashlib.sha256(str(chunks).encode()).hexdigest()[:16]
+        # Change-detection fingerprint only; blake2b over the chunk text avoids
+        # building the repr of every Chunk
+        hasher = hashlib.blake2b(digest_size=8)
+        for chunk in chunks:
+            hasher.update(chunk.section_id.encode())
+            hasher.update(b'\0')
+            hasher.update(chunk.content.encode())
+            hasher.update(b'\0')
+        content_hash = hasher.hexdigest()
         
         doc_id = str(uuid4())
         cursor = self.storage.conn.cursor()
         
+        # The session autocommits and is shared by the worker threads, so
+        # there is no transaction to roll back: write the chunks first and
+        # the document row last. _stored_accessions keys off the document
+        # row, so a filing whose chunks fail is retried on the next run.
+        try:
+            # executemany rewrites each batch into one multi-row INSERT, so a
+            # batch is a single round trip; batches keep the statement size bounded
+            batch_size = 100
+            for i in range(0, len(chunks), batch_size):
+                batch = chunks[i:i + batch_size]
+                cursor.executemany("""
+                    INSERT INTO document_chunks (
+                        id, document_id, chunk_index, section_id, section_title,
+                        content, word_count, has_table, page
+                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
+                """, [
+                    (str(uuid4()), doc_id, i + j, chunk.section_id, chunk.section_title,
+                     chunk.content, chunk.word_count, chunk.has_table, chunk.page)
+                    for j, chunk in enumerate(batch)
+                ])
+        except Exception:
+            # Best effort: drop the partial chunks of this attempt
+            try:
+                cursor.execute("DELETE FROM document_chunks WHERE document_id = %s", (doc_id,))
+            except Exception as e:
+                logger.warning(f"Could not clean up chunks for {accession}: {e}")
+            raise
+        
         cursor.execute("""
             INSERT INTO evidence_documents (
                 id, company_id, ticker, filing_type, filing_date,
@@ -189,23 +265,6 @@ class SECIntegration:
             total_chunks, total_words, section_count, table_count,
             json.dumps(sections_summary), 'parsed'
         ))
-        
-        batch_size = 100
-        for i in range(0, len(chunks), batch_size):
-            batch = chunks[i:i + batch_size]
-            for j, chunk in enumerate(batch):
-                cursor.execute("""
-                    INSERT INTO document_chunks (
-                        id, document_id, chunk_index, section_id, section_title,
-                        content, word_count, has_table, page
-                    ) VALUES (%s, %s, %s, %s, %s, %s, %s, %s, %s)
-                """, (
-                    str(uuid4()), doc_id, i + j, chunk.section_id, chunk.section_title,
-                    chunk.content, chunk.word_count, chunk.has_table, chunk.page
-                ))
-            self.storage.conn.commit()
-        
-        self.storage._update_company_summary(company_id, ticker)
     
     def _cleanup_temp_dir(self):
         temp_dir = Path("data/temp")
@@ -0,0 +1,72 @@
+"""Redis cache of SECParser output keyed by filing content hash."""
+import hashlib
+import json
+import logging
+import os
+import zlib
+
+import redis
+
+logger = logging.getLogger(__name__)
+
+# Parses never change for the same content and settings; a day covers re-runs
+PARSE_CACHE_TTL = 86400
+
+
+class ParseCache:
+    """
+    Best-effort sync Redis store: key -> zlib-compressed JSON of block rows.
+
+    The SEC pipeline runs in scripts and worker threads, outside the API's
+    async RedisService. Any Redis error disables the cache for the rest of
+    the process, so a missing server costs one failed connection, not one
+    per filing.
+    """
+
+    def __init__(self):
+        self._client = redis.Redis(
+            host=os.getenv("REDIS_HOST", "localhost"),
+            port=int(os.getenv("REDIS_PORT", "6379")),
+            db=int(os.getenv("REDIS_DB", "0")),
+            socket_connect_timeout=2
+        )
+        self._enabled = True
+
+    @staticmethod
+    def key(content: str, *settings) -> str:
+        digest = hashlib.blake2b(content.encode("utf-8", "ignore"), digest_size=16).hexdigest()
+        return f"secparse:{digest}:{':'.join(map(str, settings))}"
+
+    def _disable(self, error: Exception) -> None:
+        logger.warning("Parse cache disabled (Redis unavailable): %s", error)
+        self._enabled = False
+
+    def get(self, key: str):
+        """Cached payload for key, or None."""
+        if not self._enabled:
+            return None
+        try:
+            raw = self._client.get(key)
+        except redis.RedisError as e:
+            self._disable(e)
+            return None
+        return json.loads(zlib.decompress(raw)) if raw else None
+
+    def set(self, key: str, payload: dict) -> None:
+        if not self._enabled:
+            return
+        try:
+            self._client.setex(key, PARSE_CACHE_TTL, zlib.compress(json.dumps(payload).encode(), 1))
+        except redis.RedisError as e:
+            self._disable(e)
+
+
+_cache = None
+
+
+def get_parse_cache() -> ParseCache:
+    """Process-wide cache instance (created on first use)."""
+    global _cache
+    if _cache is None:
+        _cache = ParseCache()
+    return _cache
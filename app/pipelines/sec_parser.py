@@ -3,20 +3,30 @@ Supports: 10-K, 10-Q, 8-K with tailored extraction logic per form type.
 """
 import re
 import logging
-from dataclasses import dataclass
+import importlib.util
+from dataclasses import dataclass, field
 from typing import Optional
 from bs4 import BeautifulSoup
 
+from app.pipelines.sec_parse_cache import get_parse_cache
+
 logger = logging.getLogger(__name__)
 
+# C-backed lxml tree builder when installed (several times faster on large
+# filings); the pure-Python html.parser otherwise
+BS_PARSER = 'lxml' if importlib.util.find_spec('lxml') is not None else 'html.parser'
+
+# Part of the parse cache key: bump whenever a change alters parse() output,
+# so cached blocks from the old logic are not served
+PARSER_VERSION = 1
+
 # XBRL metadata noise patterns 
 XBRL_NOISE_PATTERNS = [
     r'Namespace Prefix:',
     r'Data Type:\s*xbrli:',
     r'Balance Type:\s*(?:na|credit|debit)',
     r'Period Type:\s*(?:duration|instant)',
-    r'\bdei_\w+\b',
-    r'\bus-gaap_\w+\b',
+    r'\b(?:dei|us-gaap)_\w+\b',
     r'xbrli:\w+ItemType',
     r'Definition.*References',
     r'Reference 1:\s*http://www\.xbrl\.org',
@@ -36,6 +46,11 @@ XBRL_REFERENCE_RE = re.compile(
     re.IGNORECASE
 )
 
+# Inline-style and text-normalization patterns used per element/block
+DISPLAY_NONE_RE = re.compile(r'display:\s*none', re.IGNORECASE)
+WHITESPACE_RE = re.compile(r'\s+')
+SENTENCE_SPLIT_RE = re.compile(r'(?<=[.!?])\s+')
+
 # Form-specific section patterns
 FORM_SECTION_PATTERNS = {
     "10-K": [
@@ -110,6 +125,10 @@ class Block:
     page: int
     is_table: bool
     section_hint: Optional[str] = None  # For form-specific section detection
+    # Set by SECChunker.process(); not part of the parse result
+    _stripped: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+    _wc: Optional[int] = field(default=None, init=False, repr=False, compare=False)
+    _item_match: Optional[re.Match] = field(default=None, init=False, repr=False, compare=False)
 
 
 class SECParser:
@@ -128,10 +147,14 @@ class SECParser:
         (r'</?dei:[^>]+>', ''),
         (r'</?us-gaap:[^>]+>', ''),
     ]
+    # All replacements are '': strip every pattern in one pass over the filing
+    STRIP_RE = re.compile('|'.join(f'(?:{p})' for p, _ in STRIP_PATTERNS), re.DOTALL)
     
-    def __init__(self, min_text_len: int = 10, max_table_rows: int = 25, form_type: str = "10-K"):
+    def __init__(self, min_text_len: int = 10, max_table_rows: int = 25, form_type: str = "10-K",
+                 use_cache: bool = True):
         self.min_text_len = min_text_len
         self.max_table_rows = max_table_rows
+        self.use_cache = use_cache
         self.form_type = form_type.upper()
         self.stats = {'blocks': 0, 'tables': 0, 'xbrl_noise_skipped': 0, 'duplicates_removed': 0, 'pages': 1}
         self._seen_sentences = set()
@@ -184,24 +207,36 @@ class SECParser:
         if form_type:
             self.set_form_type(form_type)
         
+        # Parsing is deterministic for (content, parser version, tree builder,
+        # form type, settings): re-ingested filings skip BeautifulSoup entirely
+        cache = get_parse_cache() if self.use_cache else None
+        if cache:
+            cache_key = cache.key(
+                content, PARSER_VERSION, BS_PARSER,
+                self.form_type, self.min_text_len, self.max_table_rows
+            )
+            cached = cache.get(cache_key)
+            if cached is not None:
+                self.stats = cached['stats']
+                logger.info("Parse cache hit: %d blocks", self.stats['blocks'])
+                return [Block(*row) for row in cached['blocks']]
+        
         self.stats = {'blocks': 0, 'tables': 0, 'xbrl_noise_skipped': 0, 'duplicates_removed': 0, 'pages': 1}
         self._seen_sentences = set()
         self._current_10q_part = "I"  # Reset for each parse
-        html = content
         
         logger.debug("Parsing %s filing, content length: %d chars", self.form_type, len(content))
         
-        for pattern, repl in self.STRIP_PATTERNS:
-            html = re.sub(pattern, repl, html, flags=re.DOTALL)
+        html = self.STRIP_RE.sub('', content)
         
-        soup = BeautifulSoup(html, 'html.parser')
+        soup = BeautifulSoup(html, BS_PARSER)
         
         # Remove XBRL reference/definition metadata tables (authRefData class)
         for tag in soup.find_all(class_='authRefData'):
             tag.decompose()
         
         # Remove hidden elements (display: none) - these often contain XBRL metadata
-        for tag in soup.find_all(style=re.compile(r'display:\s*none', re.I)):
+        for tag in soup.find_all(style=DISPLAY_NONE_RE):
             tag.decompose()
         
         # Remove JSON-LD and other script/style elements
@@ -231,7 +266,7 @@ class SECParser:
             text = XBRL_CRUFT_RE.sub('', text).strip()
             # Strip XBRL reference patterns
             text = XBRL_REFERENCE_RE.sub('', text).strip()
-            text = re.sub(r'\s+', ' ', text)  # Normalize whitespace
+            text = WHITESPACE_RE.sub(' ', text)  # Normalize whitespace
             
             # Deduplicate at sentence level
             text = self._deduplicate_text(text)
@@ -265,6 +300,11 @@ class SECParser:
                    self.stats['blocks'], self.stats['tables'], 
                    self.stats['xbrl_noise_skipped'], self.stats['duplicates_removed'], self.stats['pages'])
         
+        if cache:
+            cache.set(cache_key, {
+                'stats': self.stats,
+                'blocks': [[b.text, b.type, b.page, b.is_table, b.section_hint] for b in blocks]
+            })
         return blocks
     
     def _deduplicate_text(self, text: str) -> str:
@@ -273,17 +313,20 @@ class SECParser:
         text = self._remove_consecutive_duplicates(text)
         
         # Split into sentences
-        sentences = re.split(r'(?<=[.!?])\s+', text)
+        sentences = SENTENCE_SPLIT_RE.split(text)
         unique_sentences = []
         
         for sentence in sentences:
-            # Normalize for comparison (lowercase, strip extra whitespace)
-            normalized = ' '.join(sentence.lower().split())
-            if len(normalized) > 20 and normalized in self._seen_sentences:
-                self.stats['duplicates_removed'] += 1
-                continue
+            # Normalize for comparison: parse() has already collapsed
+            # whitespace, so lowercasing is enough
+            normalized = sentence.lower()
             if len(normalized) > 20:
-                self._seen_sentences.add(normalized)
+                # Keep the 64-bit hash, not the sentence, in the seen set
+                key = hash(normalized)
+                if key in self._seen_sentences:
+                    self.stats['duplicates_removed'] += 1
+                    continue
+                self._seen_sentences.add(key)
             unique_sentences.append(sentence)
         
         return ' '.join(unique_sentences)
@@ -294,30 +337,39 @@ class SECParser:
         if len(words) < 4:
             return text
         
+        # Case-insensitive phrase equality == word-by-word equality of the
+        # lowercased words, so compare precomputed lists instead of joining
+        lower = [w.lower() for w in words]
+        
         # Check for consecutive duplicate n-grams (2-8 words)
         for n in range(8, 1, -1):  # Start with larger phrases
+            kept, kept_lower = [], []
+            start = 0  # First word not yet copied to kept
             i = 0
-            result = []
-            while i < len(words):
-                # Check if next n words match the following n words
-                if i + 2 * n <= len(words):
-                    phrase1 = ' '.join(words[i:i+n])
-                    phrase2 = ' '.join(words[i+n:i+2*n])
-                    if phrase1.lower() == phrase2.lower() and len(phrase1) > 10:
-                        result.extend(words[i:i+n])
-                        i += 2 * n  # Skip the duplicate
-                        self.stats['duplicates_removed'] += 1
-                        continue
-                result.append(words[i])
+            limit = len(words) - 2 * n
+            while i <= limit:
+                # Cheap first-word test rejects almost every position
+                if (lower[i] == lower[i + n] and lower[i:i + n] == lower[i + n:i + 2 * n]
+                        and len(' '.join(words[i:i + n])) > 10):
+                    kept.extend(words[start:i + n])
+                    kept_lower.extend(lower[start:i + n])
+                    i += 2 * n  # Skip the duplicate
+                    start = i
+                    self.stats['duplicates_removed'] += 1
+                    continue
                 i += 1
-            words = result
+            if start:
+                kept.extend(words[start:])
+                kept_lower.extend(lower[start:])
+                words, lower = kept, kept_lower
         
         return ' '.join(words)
     
     def _is_xbrl_noise(self, text: str) -> bool:
         """Check if content is XBRL structural metadata."""
-        matches = len(XBRL_NOISE_RE.findall(text))
-        return matches >= 2
+        # Two hits are enough: stop scanning there instead of collecting all
+        matches = XBRL_NOISE_RE.finditer(text)
+        return next(matches, None) is not None and next(matches, None) is not None
     
     def _table_to_md(self, table) -> str:
         """Convert HTML table to markdown format."""
@@ -0,0 +1,50 @@
+"""Custom response classes."""
+from typing import Any, Callable
+
+import msgspec
+from fastapi import Request
+from fastapi.responses import JSONResponse, StreamingResponse
+from pydantic import BaseModel
+
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+# Rows pulled from the cursor per fetchmany call when streaming
+FETCH_BATCH_SIZE = 1000
+
+
+def _enc_hook(obj: Any) -> Any:
+    # Fallback for Pydantic models nested in an otherwise msgspec payload
+    if isinstance(obj, BaseModel):
+        return obj.model_dump(mode='json')
+    raise NotImplementedError(f"Cannot encode {type(obj).__name__}")
+
+
+_encoder = msgspec.json.Encoder(enc_hook=_enc_hook)
+
+
+class MsgspecJSONResponse(JSONResponse):
+    """JSONResponse rendered with msgspec (structs, dicts, UUIDs, datetimes)."""
+    
+    def render(self, content: Any) -> bytes:
+        return _encoder.encode(content)
+
+
+
+def wants_ndjson(request: Request) -> bool:
+    """True when the client asked for newline-delimited JSON."""
+    return NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
+
+def ndjson_response(cursor, row_to_dict: Callable[[tuple], Any]) -> StreamingResponse:
+    """
+    Stream an executed cursor's rows as NDJSON, one encoded row per line.
+
+    Rows are fetched FETCH_BATCH_SIZE at a time, so the full result set is
+    never held in memory. The generator is sync: Starlette iterates it in a
+    worker thread, keeping the blocking fetches off the event loop.
+    """
+    def lines():
+        while batch := cursor.fetchmany(FETCH_BATCH_SIZE):
+            for row in batch:
+                yield _encoder.encode(row_to_dict(row)) + b"\n"
+
+    return StreamingResponse(lines(), media_type=NDJSON_MEDIA_TYPE)
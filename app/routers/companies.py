@@ -1,82 +1,58 @@
 """Companies router."""
-from fastapi import APIRouter, HTTPException, Query
+from fastapi import APIRouter, Depends, HTTPException, Query
 from uuid import UUID
 from typing import Optional
 
 from app.models import CompanyCreate, CompanyUpdate, CompanyResponse, PaginatedResponse
-from app.services.snowflake import SnowflakeService
-from app.config import get_settings
+from app.models.wire import CompanyStruct, to_struct
+from app.responses import MsgspecJSONResponse
+from app.database import get_snowflake_service
 
 router = APIRouter(prefix="/api/v1/companies", tags=["companies"])
 
 
-def get_db():
-    settings = get_settings()
-    return SnowflakeService(
-        settings.snowflake.account,
-        settings.snowflake.user,
-        settings.snowflake.password.get_secret_value(),
-        settings.snowflake.warehouse,
-        settings.snowflake.database,
-        settings.snowflake.schema,
-        settings.snowflake.role
-    )
-
-
 @router.post("", response_model=CompanyResponse, status_code=201)
-async def create_company(company: CompanyCreate):
-    db = get_db()
-    try:
-        return await db.create_company(company)
-    finally:
-        db.close()
+async def create_company(company: CompanyCreate, db = Depends(get_snowflake_service)):
+    return await db.create_company(company)
 
 
 @router.get("", response_model=PaginatedResponse[CompanyResponse])
 async def list_companies(
     page: int = Query(1, ge=1),
     page_size: int = Query(20, ge=1, le=100),
-    industry_id: Optional[UUID] = None
+    industry_id: Optional[UUID] = None,
+    db = Depends(get_snowflake_service)
 ):
-    db = get_db()
-    try:
-        skip = (page - 1) * page_size
-        companies, total = await db.list_companies(skip, page_size, industry_id)
-        return PaginatedResponse.create(companies, total, page, page_size)
-    finally:
-        db.close()
+    skip = (page - 1) * page_size
+    companies, total = await db.list_companies(skip, page_size, industry_id)
+    # Encoded with msgspec; response_model above still documents the schema
+    return MsgspecJSONResponse({
+        "items": [to_struct(CompanyStruct, c) for c in companies],
+        "total": total,
+        "page": page,
+        "page_size": page_size,
+        "total_pages": (total + page_size - 1) // page_size
+    })
 
 
 @router.get("/{company_id}", response_model=CompanyResponse)
-async def get_company(company_id: UUID):
-    db = get_db()
-    try:
-        company = await db.get_company(company_id)
-        if not company:
-            raise HTTPException(status_code=404, detail="Company not found")
-        return company
-    finally:
-        db.close()
+async def get_company(company_id: UUID, db = Depends(get_snowflake_service)):
+    company = await db.get_company(company_id)
+    if not company:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return company
 
 
 @router.put("/{company_id}", response_model=CompanyResponse)
-async def update_company(company_id: UUID, company: CompanyUpdate):
-    db = get_db()
-    try:
-        updated = await db.update_company(company_id, company)
-        if not updated:
-            raise HTTPException(status_code=404, detail="Company not found")
-        return updated
-    finally:
-        db.close()
+async def update_company(company_id: UUID, company: CompanyUpdate, db = Depends(get_snowflake_service)):
+    updated = await db.update_company(company_id, company)
+    if not updated:
+        raise HTTPException(status_code=404, detail="Company not found")
+    return updated
 
 
 @router.delete("/{company_id}", status_code=204)
-async def delete_company(company_id: UUID):
-    db = get_db()
-    try:
-        deleted = await db.delete_company(company_id)
-        if not deleted:
-            raise HTTPException(status_code=404, detail="Company not found")
-    finally:
-        db.close()
\ No newline at end of file
+async def delete_company(company_id: UUID, db = Depends(get_snowflake_service)):
+    deleted = await db.delete_company(company_id)
+    if not deleted:
+        raise HTTPException(status_code=404, detail="Company not found")
\ No newline at end of file
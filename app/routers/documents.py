@@ -1,29 +1,58 @@
 """Document endpoints - ENHANCED with section data and content viewing."""
-from fastapi import APIRouter, Depends, HTTPException
+from fastapi import APIRouter, Depends, HTTPException, Request
 from uuid import UUID
 from typing import Optional
 from app.services.redis_cache import redis_service
+from app.responses import MsgspecJSONResponse, ndjson_response, wants_ndjson
 import hashlib
-import json
 
-from app.database import get_db
+from app.database import get_db_async
 
 router = APIRouter(prefix="/api/v1/documents", tags=["documents"])
 
 
+def _document_row(r) -> dict:
+    return {
+        "id": r[0],
+        "company_id": r[1],
+        "ticker": r[2],
+        "filing_type": r[3],
+        "filing_date": r[4],
+        "status": r[5],
+        "word_count": r[6],
+        "total_chunks": r[7],
+        "section_count": r[8],
+        "sections_summary": r[9]
+    }
+
+
+def _chunk_row(r) -> dict:
+    return {
+        "id": r[0],
+        "chunk_index": r[1],
+        "section_id": r[2],
+        "section_title": r[3],
+        "word_count": r[4],
+        "content": r[5]  # ADDED: actual parsed text
+    }
+
+
 @router.get("")
 async def list_documents(
+    request: Request,
     company_id: Optional[UUID] = None,
     skip: int = 0,
     limit: int = 50,
-    conn = Depends(get_db)
+    conn = Depends(get_db_async)
 ):
-    """List documents with section metadata."""
+    """List documents with section metadata (NDJSON rows on Accept: application/x-ndjson)."""
+    stream = wants_ndjson(request)
     # Cache check
     cache_key = f"documents:list:{company_id}:{skip}:{limit}"
-    cached = await redis_service.get(cache_key)
-    if cached:
-        return cached
+    if not stream:
+        cached = await redis_service.get(cache_key)
+        if cached:
+            return MsgspecJSONResponse(cached)
     
     cursor = conn.cursor()
     
@@ -41,40 +70,28 @@ async def list_documents(
     query += f" ORDER BY filing_date DESC LIMIT {limit} OFFSET {skip}"
     
     cursor.execute(query, params)
+    if stream:
+        return ndjson_response(cursor, _document_row)
     rows = cursor.fetchall()
     
     result= {
-        "documents": [
-            {
-                "id": r[0],
-                "company_id": r[1],
-                "ticker": r[2],
-                "filing_type": r[3],
-                "filing_date": r[4],
-                "status": r[5],
-                "word_count": r[6],
-                "total_chunks": r[7],
-                "section_count": r[8],
-                "sections_summary": r[9]
-            }
-            for r in rows
-        ],
+        "documents": [_document_row(r) for r in rows],
         "total": len(rows),
         "skip": skip,
         "limit": limit
     }
     await redis_service.set(cache_key, result, ttl=300)
-    return result
+    return MsgspecJSONResponse(result)
 
 
 @router.get("/{document_id}")
-async def get_document(document_id: UUID, conn = Depends(get_db)):
+async def get_document(document_id: UUID, conn = Depends(get_db_async)):
     """Get single document with full metadata."""
     # Cache check
     cache_key = f"document:{document_id}"
     cached = await redis_service.get(cache_key)
     if cached:
-        return cached
+        return MsgspecJSONResponse(cached)
     
     cursor = conn.cursor()
     
@@ -105,17 +122,18 @@ async def get_document(document_id: UUID, conn = Depends(get_db)):
         "sections_summary": row[10]
     }
     await redis_service.set(cache_key, result, ttl=300)
-    return result
+    return MsgspecJSONResponse(result)
 
 
 
 
 @router.get("/{document_id}/chunks")
 async def get_document_chunks(
+    request: Request,
     document_id: UUID, 
     section_id: Optional[str] = None,
     limit: int = 100, 
-    conn = Depends(get_db)
+    conn = Depends(get_db_async)
 ):
     """Get chunks for a document, optionally filtered by section.
     
@@ -123,13 +141,20 @@ async def get_document_chunks(
         document_id: Document UUID
         section_id: Optional section filter (e.g., 'item_1a', 'item_7')
         limit: Max chunks to return
+    
+    With Accept: application/x-ndjson, chunks are streamed one per line
+    straight from the cursor (uncached).
     """
+    stream = wants_ndjson(request)
 
     # Cache check
+    # Chunk payloads are large plain dicts: encode with msgspec rather than
+    # walking them through jsonable_encoder
     cache_key = f"chunks:{document_id}:{section_id}:{limit}"
-    cached = await redis_service.get(cache_key)
-    if cached:
-        return cached
+    if not stream:
+        cached = await redis_service.get(cache_key)
+        if cached:
+            return MsgspecJSONResponse(cached)
 
     cursor = conn.cursor()
     
@@ -147,86 +172,67 @@ async def get_document_chunks(
     query += f" ORDER BY chunk_index LIMIT {limit}"
     
     cursor.execute(query, params)
+    if stream:
+        return ndjson_response(cursor, _chunk_row)
     rows = cursor.fetchall()
     
     result= {
         "document_id": str(document_id),
         "section_id": section_id,
-        "chunks": [
-            {
-                "id": r[0],
-                "chunk_index": r[1],
-                "section_id": r[2],
-                "section_title": r[3],
-                "word_count": r[4],
-                "content": r[5]  # ADDED: actual parsed text
-            }
-            for r in rows
-        ],
+        "chunks": [_chunk_row(r) for r in rows],
         "total_chunks": len(rows)
     }
     await redis_service.set(cache_key, result, ttl=300)
-    return result
+    return MsgspecJSONResponse(result)
 
 
 
 
 @router.get("/{document_id}/sections")
-async def get_document_sections(document_id: UUID, conn = Depends(get_db)):
+async def get_document_sections(document_id: UUID, conn = Depends(get_db_async)):
     """Get list of all sections in a document with summary stats."""
     # Cache check
     cache_key = f"sections:{document_id}"
     cached = await redis_service.get(cache_key)
     if cached:
-        return cached
-    
-    import json
+        return MsgspecJSONResponse(cached)
 
     cursor = conn.cursor()
     
-    # Get document metadata
+    # Document metadata (kind 0) and its sections (kind 1) in one round trip;
+    # per-section stats are read out of the sections_summary VARIANT in SQL
     cursor.execute("""
-        SELECT ticker, filing_type, sections_summary
+        SELECT 0 AS kind, ticker, filing_type,
+               NULL AS section_id, NULL AS section_title, NULL AS first_chunk,
+               NULL AS chunk_count, NULL AS word_count
         FROM evidence_documents
         WHERE id = %(id)s
+        UNION ALL
+        SELECT 1, NULL, NULL, c.section_id, c.section_title, MIN(c.chunk_index),
+               COALESCE(ANY_VALUE(GET(d.sections_summary, c.section_id):chunk_count::INT), 0),
+               COALESCE(ANY_VALUE(GET(d.sections_summary, c.section_id):total_words::INT), 0)
+        FROM document_chunks c
+        JOIN evidence_documents d ON d.id = c.document_id
+        WHERE c.document_id = %(id)s
+        GROUP BY c.section_id, c.section_title
+        ORDER BY kind, first_chunk
     """, {'id': str(document_id)})
     
-    doc = cursor.fetchone()
+    rows = cursor.fetchall()
     
-    if not doc:
+    if not rows or rows[0][0] != 0:
         raise HTTPException(status_code=404, detail="Document not found")
-    
-    sections_summary_raw = doc[2]
-    if isinstance(sections_summary_raw, str):
-        sections_summary = json.loads(sections_summary_raw)
-    elif isinstance(sections_summary_raw, dict):
-        sections_summary = sections_summary_raw
-    else:
-        sections_summary = {}
-    
-    # Get actual sections from chunks
-    cursor.execute("""
-    SELECT section_id, section_title, MIN(chunk_index) as first_chunk
-    FROM document_chunks
-    WHERE document_id = %(id)s
-    GROUP BY section_id, section_title
-    ORDER BY first_chunk
-""", {'id': str(document_id)})
-    
-    sections = []
-    for row in cursor.fetchall():
-        section_id = row[0]
-        section_title = row[1]
-        
-        # Get stats from summary if available
-        section_stats = sections_summary.get(section_id, {})
-        
-        sections.append({
-            "section_id": section_id,
-            "section_title": section_title,
-            "chunk_count": section_stats.get('chunk_count', 0),
-            "word_count": section_stats.get('total_words', 0)
-        })
+    doc = rows[0][1:3]
+    
+    sections = [
+        {
+            "section_id": row[3],
+            "section_title": row[4],
+            "chunk_count": row[6],
+            "word_count": row[7]
+        }
+        for row in rows[1:]
+    ]
     
     result= {
         "document_id": str(document_id),
@@ -235,6 +241,6 @@ async def get_document_sections(document_id: UUID, conn = Depends(get_db)):
         "sections": sections
     }
     await redis_service.set(cache_key, result, ttl=300)
-    return result
+    return MsgspecJSONResponse(result)
 
 
@@ -14,7 +14,7 @@ import json
 logging.basicConfig(level=logging.INFO)
 logger = logging.getLogger(__name__)
 
-from app.database import get_db
+from app.database import get_db_async
 
 router = APIRouter(prefix="/api/v1/evidence", tags=["evidence"])
 
@@ -110,7 +110,7 @@ def ensure_companies_exist(tickers: List[str], conn):
 async def backfill_evidence(
     request: BackfillRequest, 
     background_tasks: BackgroundTasks,
-    conn = Depends(get_db)
+    conn = Depends(get_db_async)
 ):
     """Trigger evidence collection. If tickers=null, runs for all 10 companies."""
     
@@ -137,7 +137,7 @@ async def backfill_evidence(
 
 
 @router.get("/stats")
-async def get_evidence_stats(conn = Depends(get_db)):
+async def get_evidence_stats(conn = Depends(get_db_async)):
     """Get overall evidence statistics."""
     # Cache check
     cache_key = "evidence:stats"
@@ -194,7 +194,7 @@ async def get_evidence_stats(conn = Depends(get_db)):
 
 
 @router.get("/companies/{company_id}/evidence")
-async def get_company_evidence(company_id: UUID, conn = Depends(get_db)):
+async def get_company_evidence(company_id: UUID, conn = Depends(get_db_async)):
     """Get all evidence for a company."""
     # Cache check
     cache_key = f"evidence:company:{company_id}"
@@ -94,4 +94,11 @@ async def health_check():
         timestamp=datetime.now(timezone.utc),
         version="1.0.0",
         dependencies=dependencies
-    )
\ No newline at end of file
+    )
+
+
+@router.get("/health/db")
+async def db_pool_health():
+    """Snowflake connection pool metrics."""
+    from app.database import db_manager
+    return db_manager.stats()
@@ -12,7 +12,7 @@ import json
 from app.services.redis_cache import redis_service
 import hashlib
 
-from app.database import get_db
+from app.database import get_db_async
 
 router = APIRouter(prefix="/api/v1/signals", tags=["signals"])
 
@@ -55,7 +55,7 @@ def run_signal_pipelines(ticker: str, pipelines: List[str]):
 
 
 @router.post("/collect", response_model=SignalCollectionResponse)
-async def collect_signals(request: SignalCollectionRequest, background_tasks: BackgroundTasks, conn = Depends(get_db)):
+async def collect_signals(request: SignalCollectionRequest, background_tasks: BackgroundTasks, conn = Depends(get_db_async)):
     """Trigger signal collection for a company."""
     ticker = get_ticker_from_company_id(request.company_id, conn)
     background_tasks.add_task(run_signal_pipelines, ticker, request.pipelines)
@@ -74,7 +74,7 @@ async def collect_signals(request: SignalCollectionRequest, background_tasks: Ba
 
 
 @router.post("/collect/hiring")
-async def collect_hiring_signal(company_id: UUID, background_tasks: BackgroundTasks, conn = Depends(get_db)):
+async def collect_hiring_signal(company_id: UUID, background_tasks: BackgroundTasks, conn = Depends(get_db_async)):
     """Trigger hiring signal collection only."""
     ticker = get_ticker_from_company_id(company_id, conn)
     background_tasks.add_task(run_signal_pipelines, ticker, ["job"])
@@ -89,7 +89,7 @@ async def collect_hiring_signal(company_id: UUID, background_tasks: BackgroundTa
 
 
 @router.post("/collect/patent")
-async def collect_patent_signal(company_id: UUID, background_tasks: BackgroundTasks, conn = Depends(get_db)):
+async def collect_patent_signal(company_id: UUID, background_tasks: BackgroundTasks, conn = Depends(get_db_async)):
     """Trigger patent signal collection only."""
     ticker = get_ticker_from_company_id(company_id, conn)
     background_tasks.add_task(run_signal_pipelines, ticker, ["patent"])
@@ -104,7 +104,7 @@ async def collect_patent_signal(company_id: UUID, background_tasks: BackgroundTa
 
 
 @router.post("/collect/github")
-async def collect_github_signal(company_id: UUID, background_tasks: BackgroundTasks, conn = Depends(get_db)):
+async def collect_github_signal(company_id: UUID, background_tasks: BackgroundTasks, conn = Depends(get_db_async)):
     """Trigger GitHub signal collection only."""
     ticker = get_ticker_from_company_id(company_id, conn)
     background_tasks.add_task(run_signal_pipelines, ticker, ["github"])
@@ -119,7 +119,7 @@ async def collect_github_signal(company_id: UUID, background_tasks: BackgroundTa
 
 
 @router.get("/companies/{company_id}/signals")
-async def get_company_signals(company_id: UUID, conn = Depends(get_db)):
+async def get_company_signals(company_id: UUID, conn = Depends(get_db_async)):
     """Get signal summary for a company."""
     # Cache check
     cache_key = f"signals:company:{company_id}"
@@ -158,7 +158,7 @@ async def get_company_signals(company_id: UUID, conn = Depends(get_db)):
 
 
 @router.get("/companies/{company_id}/signals/{category}")
-async def get_company_signals_by_category(company_id: UUID, category: str, conn = Depends(get_db)):
+async def get_company_signals_by_category(company_id: UUID, category: str, conn = Depends(get_db_async)):
     """Get detailed signal data with FULL metadata parsing for dashboard."""
     # Cache check
     cache_key = f"signals:category:{company_id}:{category}"
@@ -2,6 +2,7 @@
 import json
 import logging
 from uuid import uuid4
+from app.models.enums import FILING_TYPE_BITS
 
 logger = logging.getLogger(__name__)
 
@@ -20,15 +21,17 @@ class EvidenceStorage:
         cursor.execute(f"SELECT COUNT(*) FROM company_evidence_summary WHERE company_id = '{company_id}'")
         exists = cursor.fetchone()[0] > 0
         
-        # Aggregate stats
+        # Aggregate stats (filing presence packed into one bitmask)
+        mask_expr = " + ".join(
+            f"MAX(CASE WHEN filing_type = '{filing_type}' THEN {bit} ELSE 0 END)"
+            for filing_type, bit in FILING_TYPE_BITS.items()
+        )
         cursor.execute(f"""
             SELECT 
                 COUNT(*) as total_docs,
                 COALESCE(SUM(total_chunks), 0) as total_chunks,
                 MAX(filing_date) as latest_date,
-                MAX(CASE WHEN filing_type = '10-K' THEN 1 ELSE 0 END) as has_10k,
-                MAX(CASE WHEN filing_type = '10-Q' THEN 1 ELSE 0 END) as has_10q,
-                MAX(CASE WHEN filing_type = '8-K' THEN 1 ELSE 0 END) as has_8k
+                {mask_expr} as filing_types_mask
             FROM evidence_documents
             WHERE company_id = '{company_id}'
         """)
@@ -41,9 +44,7 @@ class EvidenceStorage:
                 SET total_documents = {stats[0]},
                     total_chunks = {stats[1]},
                     latest_filing_date = '{stats[2]}',
-                    has_10k = {stats[3] == 1},
-                    has_10q = {stats[4] == 1},
-                    has_8k = {stats[5] == 1},
+                    filing_types_mask = {stats[3]},
                     last_updated = CURRENT_TIMESTAMP()
                 WHERE company_id = '{company_id}'
             """)
@@ -51,10 +52,10 @@ class EvidenceStorage:
             cursor.execute(f"""
                 INSERT INTO company_evidence_summary (
                     company_id, ticker, total_documents, total_chunks,
-                    latest_filing_date, has_10k, has_10q, has_8k, last_updated
+                    latest_filing_date, filing_types_mask, last_updated
                 ) VALUES (
                     '{company_id}', '{ticker}', {stats[0]}, {stats[1]},
-                    '{stats[2]}', {stats[3] == 1}, {stats[4] == 1}, {stats[5] == 1},
+                    '{stats[2]}', {stats[3]},
                     CURRENT_TIMESTAMP()
                 )
             """)
@@ -44,13 +44,13 @@ class JobSignalService:
                         metadata, s3_full_data_key, collected_at
                     )
                     SELECT 
-                        %(id)s, %(company_id)s, %(category)s, %(source)s, 
+                        COALESCE(%(id)s, UUID_STRING()), %(company_id)s, %(category)s, %(source)s, 
                         %(score)s, %(confidence)s,
                         TO_VARIANT(PARSE_JSON(%(metadata)s)),
                         %(s3_key)s, %(collected_at)s
                     """,
                     {
-                        'id': signal["id"],
+                        'id': signal.get("id"),
                         'company_id': signal["company_id"],
                         'category': signal["category"],
                         'source': signal["source"],
@@ -149,6 +149,9 @@ class JobSignalService:
                         %(ticker)s as ticker,
                         %(score)s as hiring_score,
                         TO_VARIANT(PARSE_JSON(%(metadata)s)) as hiring_metadata,
+                        %(job_count)s as hiring_job_count,
+                        %(ai_job_count)s as hiring_ai_job_count,
+                        %(ai_ratio)s as hiring_ai_ratio,
                         CURRENT_TIMESTAMP() as hiring_collected_at
                 ) AS source
                 ON target.company_id = source.company_id
@@ -156,16 +159,26 @@ class JobSignalService:
                     UPDATE SET
                         hiring_score = source.hiring_score,
                         hiring_metadata = source.hiring_metadata,
+                        hiring_job_count = source.hiring_job_count,
+                        hiring_ai_job_count = source.hiring_ai_job_count,
+                        hiring_ai_ratio = source.hiring_ai_ratio,
                         hiring_collected_at = source.hiring_collected_at,
                         last_updated = CURRENT_TIMESTAMP()
                 WHEN NOT MATCHED THEN
-                    INSERT (company_id, ticker, hiring_score, hiring_metadata, hiring_collected_at, last_updated)
-                    VALUES (source.company_id, source.ticker, source.hiring_score, source.hiring_metadata, source.hiring_collected_at, CURRENT_TIMESTAMP())
+                    INSERT (company_id, ticker, hiring_score, hiring_metadata,
+                            hiring_job_count, hiring_ai_job_count, hiring_ai_ratio,
+                            hiring_collected_at, last_updated)
+                    VALUES (source.company_id, source.ticker, source.hiring_score, source.hiring_metadata,
+                            source.hiring_job_count, source.hiring_ai_job_count, source.hiring_ai_ratio,
+                            source.hiring_collected_at, CURRENT_TIMESTAMP())
             """, {
                 'company_id': company_id,
                 'ticker': ticker,
                 'score': round(score, 2),
-                'metadata': metadata_json
+                'metadata': metadata_json,
+                'job_count': total_scraped,
+                'ai_job_count': ai_jobs,
+                'ai_ratio': round(ai_ratio, 3)
             })
             
             self.conn.commit()
@@ -240,6 +253,9 @@ class JobSignalService:
                                 'entry_pct', ROUND(entry_pct * 100, 1)
                             )
                         ) as hiring_metadata,
+                        total as hiring_job_count,
+                        ai_related_count as hiring_ai_job_count,
+                        ROUND(ai_ratio, 3) as hiring_ai_ratio,
                         CURRENT_TIMESTAMP() as hiring_collected_at
                     FROM scored
                 ) AS source
@@ -248,11 +264,18 @@ class JobSignalService:
                     UPDATE SET
                         hiring_score = source.hiring_score,
                         hiring_metadata = source.hiring_metadata,
+                        hiring_job_count = source.hiring_job_count,
+                        hiring_ai_job_count = source.hiring_ai_job_count,
+                        hiring_ai_ratio = source.hiring_ai_ratio,
                         hiring_collected_at = source.hiring_collected_at,
                         last_updated = CURRENT_TIMESTAMP()
                 WHEN NOT MATCHED THEN
-                    INSERT (company_id, ticker, hiring_score, hiring_metadata, hiring_collected_at, last_updated)
-                    VALUES (source.company_id, source.ticker, source.hiring_score, source.hiring_metadata, source.hiring_collected_at, CURRENT_TIMESTAMP())
+                    INSERT (company_id, ticker, hiring_score, hiring_metadata,
+                            hiring_job_count, hiring_ai_job_count, hiring_ai_ratio,
+                            hiring_collected_at, last_updated)
+                    VALUES (source.company_id, source.ticker, source.hiring_score, source.hiring_metadata,
+                            source.hiring_job_count, source.hiring_ai_job_count, source.hiring_ai_ratio,
+                            source.hiring_collected_at, CURRENT_TIMESTAMP())
             """
             
             cursor.execute(merge_query, {'company_id': company_id, 'ticker': ticker})
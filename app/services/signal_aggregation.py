@@ -1,6 +1,7 @@
 """Signal aggregation and composite score calculation."""
 import snowflake.connector
 from app.config import get_settings
+from app.models.signal import compute_summary_scores
 
 
 def calculate_composite_scores(ticker: str) -> None:
@@ -21,24 +22,30 @@ def calculate_composite_scores(ticker: str) -> None:
     cursor = conn.cursor()
     
     try:
+        cursor.execute("""
+            SELECT hiring_score, patent_score, github_score, leadership_score,
+                   hiring_metadata:confidence::float,
+                   patent_metadata:confidence::float,
+                   github_metadata:confidence::float,
+                   leadership_metadata:confidence::float
+            FROM company_evidence_summary
+            WHERE ticker = %s
+        """, (ticker,))
+        row = cursor.fetchone()
+        if row is None:
+            return
+        
+        scores = [float(v) if v is not None else None for v in row[:4]]
+        composite, quality = compute_summary_scores(*scores, confidences=row[4:])
+        
         cursor.execute("""
             UPDATE company_evidence_summary
             SET 
-                composite_score = (
-                    COALESCE(hiring_score * 0.30, 0) +
-                    COALESCE(patent_score * 0.25, 0) +
-                    COALESCE(github_score * 0.20, 0) +
-                    COALESCE(leadership_score * 0.25, 0)
-                ) / NULLIF(
-                    (CASE WHEN hiring_score IS NOT NULL THEN 0.30 ELSE 0 END) +
-                    (CASE WHEN patent_score IS NOT NULL THEN 0.25 ELSE 0 END) +
-                    (CASE WHEN github_score IS NOT NULL THEN 0.20 ELSE 0 END) +
-                    (CASE WHEN leadership_score IS NOT NULL THEN 0.25 ELSE 0 END),
-                    0
-                ),
+                composite_score = %s,
+                evidence_quality = %s,
                 last_updated = CURRENT_TIMESTAMP()
             WHERE ticker = %s
-        """, (ticker,))
+        """, (composite, quality, ticker))
         
         conn.commit()
         
@@ -11,13 +11,47 @@ from app.services.redis_cache import cache, invalidate_cache
 from app.models import (
     CompanyCreate, CompanyUpdate, CompanyResponse,
     IndustryResponse,
-    AssessmentCreate, AssessmentResponse, AssessmentStatus,
-    DimensionScoreCreate, DimensionScoreUpdate, DimensionScoreResponse
+    AssessmentCreate, AssessmentResponse, AssessmentStatus, AssessmentType,
+    Dimension, DimensionScoreCreate, DimensionScoreUpdate, DimensionScoreResponse,
+    compute_vr_score
 )
 
 logger = structlog.get_logger()
 
 
+# Rows read back from Snowflake are trusted: convert column types and build
+# the response models with from_orm_fast (model_construct, no validation).
+
+def _optional_float(value) -> Optional[float]:
+    return float(value) if value else None
+
+
+def _company_from_row(r: dict) -> CompanyResponse:
+    return CompanyResponse.from_orm_fast({
+        **r, 'ID': UUID(r['ID']), 'INDUSTRY_ID': UUID(r['INDUSTRY_ID']),
+        'POSITION_FACTOR': float(r['POSITION_FACTOR'])
+    })
+
+
+def _assessment_from_row(r: dict) -> AssessmentResponse:
+    return AssessmentResponse.from_orm_fast({
+        **r, 'ID': UUID(r['ID']), 'COMPANY_ID': UUID(r['COMPANY_ID']),
+        'ASSESSMENT_TYPE': AssessmentType(r['ASSESSMENT_TYPE']),
+        'STATUS': AssessmentStatus(r['STATUS']),
+        'V_R_SCORE': _optional_float(r['V_R_SCORE']),
+        'CONFIDENCE_LOWER': _optional_float(r['CONFIDENCE_LOWER']),
+        'CONFIDENCE_UPPER': _optional_float(r['CONFIDENCE_UPPER'])
+    })
+
+
+def _dimension_score_from_row(r: dict) -> DimensionScoreResponse:
+    return DimensionScoreResponse.from_orm_fast({
+        **r, 'ID': UUID(r['ID']), 'ASSESSMENT_ID': UUID(r['ASSESSMENT_ID']),
+        'DIMENSION': Dimension(r['DIMENSION']), 'SCORE': float(r['SCORE']),
+        'WEIGHT': float(r['WEIGHT']), 'CONFIDENCE': float(r['CONFIDENCE'])
+    })
+
+
 class SnowflakeService:
     
     def __init__(self, account: str, user: str, password: str, 
@@ -25,8 +59,19 @@ class SnowflakeService:
         self.config = {k: v for k, v in locals().items() if k != 'self' and v is not None}
         self._conn = None
     
+    @classmethod
+    def from_connection(cls, conn) -> "SnowflakeService":
+        """Wrap a leased pool connection; the pool owns its lifecycle, so don't close() it."""
+        service = cls.__new__(cls)
+        service.config = None
+        service._conn = conn
+        return service
+    
     def connect(self):
         if self._conn is None or self._conn.is_closed():
+            if self.config is None:
+                # Pooled connection: the pool replaces dead ones on the next lease
+                raise RuntimeError("Leased Snowflake connection was closed; retry the request")
             self._conn = snowflake.connector.connect(**self.config)
         return self._conn
     
@@ -79,12 +124,7 @@ class SnowflakeService:
         if not row:
             return None
         
-        return CompanyResponse(
-            id=UUID(row['ID']), name=row['NAME'], ticker=row['TICKER'],
-            industry_id=UUID(row['INDUSTRY_ID']), position_factor=float(row['POSITION_FACTOR']),
-            is_deleted=row['IS_DELETED'], created_at=row['CREATED_AT'], 
-            updated_at=row['UPDATED_AT']
-        )
+        return _company_from_row(row)
     
     @cache(ttl=180, key_prefix="companies:list")
     async def list_companies(
@@ -109,14 +149,7 @@ class SnowflakeService:
             """, params + [limit, skip])
             rows = cur.fetchall()
         
-        companies = [
-            CompanyResponse(
-                id=UUID(r['ID']), name=r['NAME'], ticker=r['TICKER'],
-                industry_id=UUID(r['INDUSTRY_ID']), position_factor=float(r['POSITION_FACTOR']),
-                is_deleted=r['IS_DELETED'], created_at=r['CREATED_AT'], 
-                updated_at=r['UPDATED_AT']
-            ) for r in rows
-        ]
+        companies = [_company_from_row(r) for r in rows]
         
         return companies, total
     
@@ -178,10 +211,9 @@ class SnowflakeService:
             rows = cur.fetchall()
         
         return [
-            IndustryResponse(
-                id=UUID(r['ID']), name=r['NAME'], sector=r['SECTOR'],
-                h_r_base=float(r['H_R_BASE']), created_at=r['CREATED_AT']
-            ) for r in rows
+            IndustryResponse.from_orm_fast({
+                **r, 'ID': UUID(r['ID']), 'H_R_BASE': float(r['H_R_BASE'])
+            }) for r in rows
         ]
     
     @invalidate_cache("assessment:*", "assessments:list:*")
@@ -221,16 +253,7 @@ class SnowflakeService:
         if not row:
             return None
         
-        return AssessmentResponse(
-            id=UUID(row['ID']), company_id=UUID(row['COMPANY_ID']),
-            assessment_type=row['ASSESSMENT_TYPE'], assessment_date=row['ASSESSMENT_DATE'],
-            status=row['STATUS'], primary_assessor=row['PRIMARY_ASSESSOR'],
-            secondary_assessor=row['SECONDARY_ASSESSOR'],
-            v_r_score=float(row['V_R_SCORE']) if row['V_R_SCORE'] else None,
-            confidence_lower=float(row['CONFIDENCE_LOWER']) if row['CONFIDENCE_LOWER'] else None,
-            confidence_upper=float(row['CONFIDENCE_UPPER']) if row['CONFIDENCE_UPPER'] else None,
-            created_at=row['CREATED_AT']
-        )
+        return _assessment_from_row(row)
     
     @cache(ttl=180, key_prefix="assessments:list")
     async def list_assessments(
@@ -262,22 +285,17 @@ class SnowflakeService:
             """, params + [limit, skip])
             rows = cur.fetchall()
         
-        assessments = [
-            AssessmentResponse(
-                id=UUID(r['ID']), company_id=UUID(r['COMPANY_ID']),
-                assessment_type=r['ASSESSMENT_TYPE'], assessment_date=r['ASSESSMENT_DATE'],
-                status=r['STATUS'], primary_assessor=r['PRIMARY_ASSESSOR'],
-                secondary_assessor=r['SECONDARY_ASSESSOR'],
-                v_r_score=float(r['V_R_SCORE']) if r['V_R_SCORE'] else None,
-                confidence_lower=float(r['CONFIDENCE_LOWER']) if r['CONFIDENCE_LOWER'] else None,
-                confidence_upper=float(r['CONFIDENCE_UPPER']) if r['CONFIDENCE_UPPER'] else None,
-                created_at=r['CREATED_AT']
-            ) for r in rows
-        ]
+        assessments = [_assessment_from_row(r) for r in rows]
         
         return assessments, total
     
-    async def validate_assessment_complete(self, assessment_id: UUID) -> Tuple[bool, List[str]]:
+    async def validate_assessment_complete(
+        self, assessment_id: UUID
+    ) -> Tuple[bool, List[str], List[DimensionScoreResponse]]:
+        """Check the assessment has all seven dimensions with weights summing to 1.
+        
+        Also returns the scores it loaded, so callers need not fetch them again.
+        """
         from app.models.enums import Dimension
         
         errors = []
@@ -295,23 +313,29 @@ class SnowflakeService:
         if abs(total_weight - 1.0) > 0.001:
             errors.append(f"Weights sum to {total_weight:.3f}, expected 1.0")
         
-        return (len(errors) == 0, errors)
+        return (len(errors) == 0, errors, scores)
     
     @invalidate_cache("assessment:*", "assessments:list:*")
     async def update_assessment_status(
         self, assessment_id: UUID, new_status: str
     ) -> Optional[AssessmentResponse]:
         status_enum = AssessmentStatus(new_status)
+        updates, params = ["status = %s"], [new_status]
         
         if status_enum == AssessmentStatus.SUBMITTED:
-            is_valid, errors = await self.validate_assessment_complete(assessment_id)
+            is_valid, errors, scores = await self.validate_assessment_complete(assessment_id)
             if not is_valid:
                 raise ValueError(f"Incomplete: {'; '.join(errors)}")
+            
+            # Complete assessment: store its VR score alongside the status
+            updates.append("v_r_score = %s")
+            params.append(compute_vr_score(scores))
         
+        params.append(str(assessment_id))
         async with self.cursor() as cur:
-            cur.execute("""
-                UPDATE assessments SET status = %s WHERE id = %s
-            """, (new_status, str(assessment_id)))
+            cur.execute(f"""
+                UPDATE assessments SET {', '.join(updates)} WHERE id = %s
+            """, params)
             
             if cur.rowcount == 0:
                 return None
@@ -347,14 +371,7 @@ class SnowflakeService:
             """, (str(assessment_id),))
             rows = cur.fetchall()
         
-        return [
-            DimensionScoreResponse(
-                id=UUID(r['ID']), assessment_id=UUID(r['ASSESSMENT_ID']),
-                dimension=r['DIMENSION'], score=float(r['SCORE']), weight=float(r['WEIGHT']),
-                confidence=float(r['CONFIDENCE']), evidence_count=r['EVIDENCE_COUNT'],
-                created_at=r['CREATED_AT']
-            ) for r in rows
-        ]
+        return [_dimension_score_from_row(r) for r in rows]
     
     @invalidate_cache("dimension:*", "assessment:*")
     async def update_dimension_score(
@@ -383,12 +400,7 @@ class SnowflakeService:
             if not row:
                 return None
             
-            return DimensionScoreResponse(
-                id=UUID(row['ID']), assessment_id=UUID(row['ASSESSMENT_ID']),
-                dimension=row['DIMENSION'], score=float(row['SCORE']),
-                weight=float(row['WEIGHT']), confidence=float(row['CONFIDENCE']),
-                evidence_count=row['EVIDENCE_COUNT'], created_at=row['CREATED_AT']
-            )
+            return _dimension_score_from_row(row)
         
         params.append(str(score_id))
         
@@ -403,12 +415,7 @@ class SnowflakeService:
             cur.execute("SELECT * FROM dimension_scores WHERE id = %s", (str(score_id),))
             row = cur.fetchone()
         
-        return DimensionScoreResponse(
-            id=UUID(row['ID']), assessment_id=UUID(row['ASSESSMENT_ID']),
-            dimension=row['DIMENSION'], score=float(row['SCORE']),
-            weight=float(row['WEIGHT']), confidence=float(row['CONFIDENCE']),
-            evidence_count=row['EVIDENCE_COUNT'], created_at=row['CREATED_AT']
-        )
+        return _dimension_score_from_row(row)
     
     async def seed_data(self):
         from app.database.seed import seed_all
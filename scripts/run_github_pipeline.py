@@ -7,10 +7,11 @@ import asyncio
 import argparse
 import os
 import json
+import threading
 import snowflake.connector
 from app.config import get_settings
 from app.core.config_loader import get_target_companies
-from app.pipelines.github_scanner import scan_company
+from app.pipelines.github_scanner import scan_company, warmup
 from dotenv import load_dotenv
 load_dotenv()
 
@@ -66,20 +67,31 @@ def update_summary(conn, company_id, ticker, signal):
                 %(company_id)s as company_id,
                 %(ticker)s as ticker,
                 %(score)s as github_score,
-                TO_VARIANT(PARSE_JSON(%(metadata)s)) as github_metadata
+                TO_VARIANT(PARSE_JSON(%(metadata)s)) as github_metadata,
+                %(total_repos)s as github_repo_count,
+                %(ai_repos)s as github_ai_repo_count,
+                %(ai_stars)s as github_ai_stars
             ) AS s
             ON t.company_id = s.company_id
             WHEN MATCHED THEN UPDATE SET
                 github_score = s.github_score,
                 github_metadata = s.github_metadata,
+                github_repo_count = s.github_repo_count,
+                github_ai_repo_count = s.github_ai_repo_count,
+                github_ai_stars = s.github_ai_stars,
                 github_collected_at = CURRENT_TIMESTAMP()
-            WHEN NOT MATCHED THEN INSERT (company_id, ticker, github_score, github_metadata, github_collected_at)
-                VALUES (s.company_id, s.ticker, s.github_score, s.github_metadata, CURRENT_TIMESTAMP())
+            WHEN NOT MATCHED THEN INSERT (company_id, ticker, github_score, github_metadata,
+                    github_repo_count, github_ai_repo_count, github_ai_stars, github_collected_at)
+                VALUES (s.company_id, s.ticker, s.github_score, s.github_metadata,
+                    s.github_repo_count, s.github_ai_repo_count, s.github_ai_stars, CURRENT_TIMESTAMP())
         """, {
             'company_id': company_id,
             'ticker': ticker,
             'score': signal['score'],
-            'metadata': json.dumps(signal['metadata'])
+            'metadata': json.dumps(signal['metadata']),
+            'total_repos': signal['metadata'].get('total_repos'),
+            'ai_repos': signal['metadata'].get('ai_repos'),
+            'ai_stars': signal['metadata'].get('ai_stars')
         })
         conn.commit()
         return True
@@ -130,6 +142,10 @@ def main():
     
     print(f"Using {len(tokens)} GitHub tokens")
     
+    # Load the embedding model while Snowflake connects
+    warmup_thread = threading.Thread(target=warmup, daemon=True)
+    warmup_thread.start()
+    
     settings = get_settings()
     companies = get_target_companies()
     
@@ -144,6 +160,7 @@ def main():
     )
     
     to_process = list(companies.items() if args.all else [(args.ticker, companies[args.ticker])])
+    warmup_thread.join()
     
     results = {}
     for idx, (ticker, info) in enumerate(to_process):
@@ -66,23 +66,39 @@ def update_summary(conn, company_id, ticker, signal):
                 %(company_id)s as company_id,
                 %(ticker)s as ticker,
                 %(score)s as patent_score,
-                TO_VARIANT(PARSE_JSON(%(metadata)s)) as patent_metadata
+                TO_VARIANT(PARSE_JSON(%(metadata)s)) as patent_metadata,
+                %(total_patents)s as patent_total_count,
+                %(ai_patents)s as patent_ai_count,
+                %(recent_ai_count)s as patent_recent_ai_count,
+                %(ai_ratio)s as patent_ai_ratio
             ) AS s
             ON t.company_id = s.company_id
             WHEN MATCHED THEN UPDATE SET
                 patent_score = s.patent_score,
                 patent_metadata = s.patent_metadata,
+                patent_total_count = s.patent_total_count,
+                patent_ai_count = s.patent_ai_count,
+                patent_recent_ai_count = s.patent_recent_ai_count,
+                patent_ai_ratio = s.patent_ai_ratio,
                 patent_collected_at = CURRENT_TIMESTAMP()
             WHEN NOT MATCHED THEN INSERT (
-                company_id, ticker, patent_score, patent_metadata, patent_collected_at
+                company_id, ticker, patent_score, patent_metadata,
+                patent_total_count, patent_ai_count, patent_recent_ai_count, patent_ai_ratio,
+                patent_collected_at
             ) VALUES (
-                s.company_id, s.ticker, s.patent_score, s.patent_metadata, CURRENT_TIMESTAMP()
+                s.company_id, s.ticker, s.patent_score, s.patent_metadata,
+                s.patent_total_count, s.patent_ai_count, s.patent_recent_ai_count, s.patent_ai_ratio,
+                CURRENT_TIMESTAMP()
             )
         """, {
             'company_id': company_id,
             'ticker': ticker,
             'score': signal['score'],
-            'metadata': json.dumps(signal['metadata'])
+            'metadata': json.dumps(signal['metadata']),
+            'total_patents': signal['metadata'].get('total_patents'),
+            'ai_patents': signal['metadata'].get('ai_patents'),
+            'recent_ai_count': signal['metadata'].get('recent_ai_count'),
+            'ai_ratio': signal['metadata'].get('ai_ratio')
         })
         conn.commit()
         return True
@@ -13,7 +13,8 @@ from app.models.signal import (
     SignalCreate,
     SignalResponse,
     SignalCategory,
-    CompanyEvidenceSummary
+    CompanyEvidenceSummary,
+    compute_summary_scores
 )
 
 
@@ -105,6 +106,23 @@ class TestEvidenceDocumentModels:
                 page=1
             )
 
+    def test_chunk_response_from_row(self):
+        """Test trusted DB rows build without validation."""
+        document_id = uuid4()
+        chunk = ChunkResponse.from_orm_fast({
+            "DOCUMENT_ID": document_id,
+            "CHUNK_INDEX": 3,
+            "CONTENT": "Risk factors...",
+            "WORD_COUNT": 2,
+            "PAGE": 7,
+            "EXTRA_COLUMN": "ignored"
+        })
+
+        assert chunk.document_id == document_id
+        assert chunk.chunk_index == 3
+        assert chunk.has_table is False  # default applied
+        assert chunk.id is not None
+
 
 class TestSignalModels:
     """Test signal models."""
@@ -164,60 +182,59 @@ class TestCompanyEvidenceSummary:
     """Test company evidence summary model."""
     
     def test_composite_score_calculation(self):
-        """Test composite score auto-calculates."""
-        summary = CompanyEvidenceSummary(
-            company_id=uuid4(),
-            ticker="CAT",
-            hiring_score=75.0,
-            patent_score=89.0,
-            github_score=68.0,
-            leadership_score=80.0
-        )
+        """Test composite score from all four signals."""
+        composite, _ = compute_summary_scores(75.0, 89.0, 68.0, 80.0)
         
         # Weighted average: 75*0.3 + 89*0.25 + 68*0.2 + 80*0.25
         # = 22.5 + 22.25 + 13.6 + 20 = 78.35
-        assert summary.composite_score == pytest.approx(78.35, abs=0.1)
+        assert composite == pytest.approx(78.35, abs=0.1)
     
     def test_composite_score_partial_signals(self):
         """Test composite with some missing signals."""
-        summary = CompanyEvidenceSummary(
-            company_id=uuid4(),
-            ticker="HCA",
-            hiring_score=45.0,
-            patent_score=None,  # Missing
-            github_score=None,  # Missing
-            leadership_score=60.0
-        )
+        composite, _ = compute_summary_scores(45.0, None, None, 60.0)
         
         #45*0.545 + 60*0.455 = 24.55 + 27.27 = 51.82
-        assert summary.composite_score == pytest.approx(51.82, abs=0.1)
+        assert composite == pytest.approx(51.82, abs=0.1)
 
     def test_evidence_quality_calculation(self):
         """Test evidence quality score."""
-        summary = CompanyEvidenceSummary(
-            company_id=uuid4(),
-            ticker="JPM",
-            hiring_score=85.0,
-            hiring_metadata={"confidence": 0.90},
-            patent_score=92.0,
-            patent_metadata={"confidence": 0.95},
-            github_score=88.0,
-            github_metadata={"confidence": 0.85},
-            leadership_score=80.0,
-            leadership_metadata={"confidence": 0.95}
+        _, quality = compute_summary_scores(
+            85.0, 92.0, 88.0, 80.0,
+            confidences=(0.90, 0.95, 0.85, 0.95)
         )
         
         # Completeness: 4/4 = 1.0
         # Avg confidence: (0.90 + 0.95 + 0.85 + 0.95) / 4 = 0.9125
         # Quality: 1.0*0.5 + 0.9125*0.5 = 0.956
-        assert summary.evidence_quality == pytest.approx(0.956, abs=0.01)
+        assert quality == pytest.approx(0.956, abs=0.01)
     
     def test_no_signals_defaults(self):
         """Test summary with no signals."""
+        composite, quality = compute_summary_scores(None, None, None, None)
+        
+        assert composite is None
+        assert quality == pytest.approx(0.25, abs=0.01)  # 0*0.5 + 0.5*0.5
+    
+    def test_summary_does_not_recompute_scores(self):
+        """Test stored scores are read as-is."""
         summary = CompanyEvidenceSummary(
             company_id=uuid4(),
-            ticker="UNKNOWN"
+            ticker="CAT",
+            hiring_score=75.0,
+            composite_score=70.0
+        )
+        
+        assert summary.composite_score == 70.0
+        assert summary.evidence_quality is None
+    
+    def test_filing_flags_from_mask(self):
+        """Test has_10k/has_10q/has_8k derive from filing_types_mask."""
+        summary = CompanyEvidenceSummary(
+            company_id=uuid4(),
+            ticker="CAT",
+            filing_types_mask=0b101  # 10-K + 8-K
         )
         
-        assert summary.composite_score is None
-        assert summary.evidence_quality == pytest.approx(0.25, abs=0.01)  # 0*0.5 + 0.5*0.5
\ No newline at end of file
+        assert summary.has_10k is True
+        assert summary.has_10q is False
+        assert summary.has_8k is True
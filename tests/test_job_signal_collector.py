@@ -0,0 +1,89 @@
+"""Test job posting dedupe and title normalization."""
+import numpy as np
+import pandas as pd
+
+from app.pipelines.job_signal_collector import _acronym_pattern, _dedupe_keys, dedupe
+
+
+def _unit_vectors(*degrees):
+    """2-d unit embeddings at the given angles (cosine = cos of the angle gap)."""
+    rad = np.radians(degrees)
+    return np.stack([np.cos(rad), np.sin(rad)], axis=1).astype(np.float32)
+
+
+def _postings(rows):
+    return pd.DataFrame(rows, columns=["title", "location", "site"])
+
+
+class TestDedupe:
+    """Test embedding-similarity clustering of postings."""
+    
+    def test_clusters_are_transitive(self):
+        """Test A~B and B~C merge A, B and C even though A and C are not similar."""
+        df = _postings([
+            ("ML Engineer", "Chicago", "indeed"),
+            ("ML Engineer", "Chicago", "linkedin"),
+            ("ML Engineer", "Chicago", "glassdoor"),
+            ("Data Analyst", "Peoria", "indeed"),
+        ])
+        # cos(20°) ≈ 0.94 >= 0.9, cos(40°) ≈ 0.77 < 0.9
+        result = dedupe(df, _unit_vectors(0, 20, 40, 90))
+        
+        assert len(result) == 2
+        assert result.iloc[0]["sources"] == "glassdoor,indeed,linkedin"
+        assert bool(result.iloc[0]["multi_source"]) is True
+        assert result.iloc[1]["sources"] == "indeed"
+        assert bool(result.iloc[1]["multi_source"]) is False
+    
+    def test_keeps_located_posting_and_merges_dropped_sources(self):
+        """Test the posting with a location is kept and the dropped row's site still counts."""
+        df = _postings([
+            ("AI Engineer", "", "linkedin"),
+            ("AI Engineer", "Chicago, IL", "indeed"),
+        ])
+        result = dedupe(df, _unit_vectors(0, 5))
+        
+        assert len(result) == 1
+        assert result.iloc[0]["location"] == "Chicago, IL"
+        assert result.iloc[0]["sources"] == "indeed,linkedin"
+    
+    def test_dissimilar_postings_are_kept(self):
+        """Test postings below the similarity threshold stay separate, in input order."""
+        df = _postings([
+            ("AI Engineer", "Chicago", "indeed"),
+            ("Data Scientist", "Peoria", "indeed"),
+            ("NLP Researcher", "Remote", "linkedin"),
+        ])
+        result = dedupe(df, _unit_vectors(0, 60, 120))
+        
+        assert result["title"].tolist() == ["AI Engineer", "Data Scientist", "NLP Researcher"]
+        assert (result["dupe_count"] == 1).all()
+    
+    def test_empty_frame(self):
+        """Test an empty frame dedupes to an empty frame."""
+        assert dedupe(pd.DataFrame(), np.empty((0, 2))).empty
+
+
+class TestTitleNormalization:
+    """Test acronym expansion used for dedupe keys."""
+    
+    def test_acronym_expansions_chain(self):
+        """Test an expansion is expanded again by later acronyms."""
+        _, expansions = _acronym_pattern()
+        
+        assert expansions["genai"] == "generative artificial intelligence"
+        assert expansions["mlops"] == "machine learning operations"
+    
+    def test_dedupe_keys_normalize_title_and_location(self):
+        """Test seniority abbreviations, acronyms and location suffixes are normalized."""
+        df = _postings([
+            ("Sr. GenAI Engineer", "Chicago, IL", "indeed"),
+            ("Jr ML  Engineer", "", "linkedin"),
+        ])
+        combined, locs = _dedupe_keys(df)
+        
+        assert combined == [
+            "senior generative artificial intelligence engineer | chicago",
+            "junior machine learning engineer | null",
+        ]
+        assert locs == ["chicago", "null"]
@@ -0,0 +1,54 @@
+"""Test CS1 models."""
+import numpy as np
+import pytest
+from uuid import uuid4
+from app.models import Dimension, DimensionScoreCreate, compute_vr_score, compute_vr_scores
+
+
+def _score(dimension: Dimension, score: float, **kwargs) -> DimensionScoreCreate:
+    return DimensionScoreCreate(assessment_id=uuid4(), dimension=dimension, score=score, **kwargs)
+
+
+class TestVRScore:
+    """Test VR score aggregation."""
+    
+    def test_full_default_weights(self):
+        """Test all seven dimensions with default weights and equal confidence."""
+        scores = [
+            _score(Dimension.DATA_INFRASTRUCTURE, 80),
+            _score(Dimension.AI_GOVERNANCE, 60),
+            _score(Dimension.TECHNOLOGY_STACK, 70),
+            _score(Dimension.TALENT_SKILLS, 50),
+            _score(Dimension.LEADERSHIP_VISION, 90),
+            _score(Dimension.USE_CASE_PORTFOLIO, 40),
+            _score(Dimension.CULTURE_CHANGE, 100),
+        ]
+        
+        # 80*0.25 + 60*0.2 + 70*0.15 + 50*0.15 + 90*0.1 + 40*0.1 + 100*0.05 = 68.0
+        assert compute_vr_score(scores) == pytest.approx(68.0)
+    
+    def test_confidence_and_explicit_weight(self):
+        """Test weights are scaled by confidence and explicit weights override defaults."""
+        scores = [
+            _score(Dimension.DATA_INFRASTRUCTURE, 80, confidence=1.0),
+            _score(Dimension.AI_GOVERNANCE, 20, weight=0.25, confidence=0.5),
+        ]
+        
+        # (80*0.25 + 20*0.125) / 0.375 = 60.0
+        assert compute_vr_score(scores) == pytest.approx(60.0)
+    
+    def test_missing_dimension_nan(self):
+        """Test NaN scores are left out of both the sum and the total weight."""
+        scores = np.array([[80.0, np.nan], [np.nan, np.nan]])
+        weights = np.array([[0.25, 0.20], [0.25, 0.20]])
+        confidences = np.ones((2, 2))
+        
+        vr = compute_vr_scores(scores, weights, confidences)
+        
+        assert vr[0] == pytest.approx(80.0)
+        assert np.isnan(vr[1])
+    
+    def test_empty_input(self):
+        """Test no dimension scores gives no VR score."""
+        assert compute_vr_score([]) is None
+        assert np.isnan(compute_vr_scores(np.empty((1, 0)), np.empty((1, 0)), np.empty((1, 0)))[0])